@@ -0,0 +1,256 @@
+# python scripts/benchmark.py run [-o results.json] [-r ROUNDS] [-k FILTER]
+#     [--synthetic GLYPHS:AXES ...]
+# python scripts/benchmark.py compare base.json results.json [-t PERCENT]
+#
+# Time the hot paths of FakeLab (opening, saving, interpolating, AFM export, deleting
+# and decomposing glyphs) on the fonts in tests/data and on synthetic fonts of
+# configurable size.
+# The results can be saved as JSON, and two result files can be compared to find
+# regressions. The compare command exits with status 1 if any benchmark got slower by
+# more than the threshold.
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from statistics import mean
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from vfbLib.json import save_vfb_json
+
+from FL.fake.synthetic import save_synthetic_font
+from FL.objects.Font import Font
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+data_path = Path(__file__).parent.parent / "tests" / "data"
+
+FIXTURES = ("mini.vfb", "2axMM.vfb", "ComicJensPro-Regular3.000.vfb")
+
+# The synthetic fonts that are benchmarked by default, as number of glyphs and axes
+DEFAULT_SYNTHETIC = ["5000:0", "2000:2"]
+
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 10.0
+
+# A benchmark: A setup function that returns the argument for the timed function, which
+# is called once per round
+Benchmark = tuple["Callable[[], Any]", "Callable[[Any], Any]"]
+
+
+def make_synthetic(spec: str, out_path: Path) -> Path:
+    """
+    Save a synthetic font with kerning, classes, composites and hints.
+
+    Args:
+        spec (str): The number of glyphs and axes, e.g. "2000:2".
+        out_path (Path): The directory to save the font to.
+
+    Returns:
+        Path: The path of the font.
+    """
+    glyphs, _, axes = spec.partition(":")
+    num_glyphs = int(glyphs)
+    num_axes = int(axes or 0)
+    vfb_path = out_path / f"synthetic-{num_glyphs}-{num_axes}ax.vfb"
+    save_synthetic_font(
+        vfb_path,
+        num_glyphs=num_glyphs,
+        num_axes=num_axes,
+        num_composites=num_glyphs // 10,
+        num_kerning_pairs=num_glyphs * 5,
+        num_kerning_classes=num_glyphs // 20,
+        hints_per_glyph=2,
+    )
+    return vfb_path
+
+
+def get_benchmarks(vfb_path: Path, tmp_path: Path) -> "Iterator[tuple[str, Benchmark]]":
+    """
+    Yield the benchmarks for a font.
+
+    Args:
+        vfb_path (Path): The path of the font.
+        tmp_path (Path): A directory to save files to.
+
+    Yields:
+        Iterator[tuple[str, Benchmark]]: The benchmark name and the benchmark.
+    """
+    name = vfb_path.name
+    out_path = tmp_path / f"out.{name}"
+    font = Font(str(vfb_path))
+
+    def open_font(lazy: bool) -> None:
+        Font().Open(str(vfb_path), lazy=lazy)
+
+    def roundtrip(_: Any) -> None:
+        # Like `fakelab --roundtrip`
+        f = Font(str(vfb_path))
+        f.Save(str(out_path))
+        save_vfb_json(out_path)
+
+    yield f"open[{name}]", (lambda: False, open_font)
+    yield f"open_lazy[{name}]", (lambda: True, open_font)
+    yield f"save[{name}]", (lambda: font, lambda f: f.Save(str(out_path)))
+    yield f"roundtrip[{name}]", (lambda: None, roundtrip)
+    if font._primary_instances:
+        values = font._primary_instances[0]["values"]
+        yield f"ip[{name}]", (lambda: font, lambda f: f.ip(values))
+    yield (
+        f"afm_expanded[{name}]",
+        (lambda: font, lambda f: f.fake_get_afm(expand_kerning=True)),
+    )
+    # Delete every tenth glyph
+    gids = list(range(0, len(font), 10))
+    yield (
+        f"delete_glyphs[{name}]",
+        (lambda: Font(font), lambda f: f.fake_delete_glyphs(gids)),
+    )
+    composites = [i for i, g in enumerate(font.glyphs) if g.components]
+    if composites:
+
+        def decompose(f: Font) -> None:
+            for i in composites:
+                f[i].Decompose()
+
+        yield f"decompose[{name}]", (lambda: Font(font), decompose)
+
+
+def measure(benchmark: Benchmark, rounds: int) -> dict[str, Any]:
+    """
+    Run a benchmark and return the timing. The setup is not timed.
+
+    Args:
+        benchmark (Benchmark): The benchmark.
+        rounds (int): The number of rounds.
+
+    Returns:
+        dict[str, Any]: The best and mean time in seconds, and the number of rounds.
+    """
+    setup, func = benchmark
+    times = []
+    for _ in range(rounds):
+        arg = setup()
+        start = perf_counter()
+        func(arg)
+        times.append(perf_counter() - start)
+    return {"best": min(times), "mean": mean(times), "rounds": rounds}
+
+
+def get_metadata(rounds: int) -> dict[str, Any]:
+    meta: dict[str, Any] = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rounds": rounds,
+    }
+    for package in ("fakelab", "vfbLib", "numpy"):
+        try:
+            meta[package] = version(package)
+        except PackageNotFoundError:
+            meta[package] = None
+    return meta
+
+
+def run(args: argparse.Namespace) -> int:
+    results: dict[str, Any] = {}
+    with TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        vfb_paths = [data_path / name for name in FIXTURES]
+        for spec in args.synthetic:
+            print(f"Generating synthetic font {spec}...")
+            vfb_paths.append(make_synthetic(spec, tmp_path))
+        for vfb_path in vfb_paths:
+            for name, benchmark in get_benchmarks(vfb_path, tmp_path):
+                if args.filter and args.filter not in name:
+                    continue
+
+                try:
+                    result = results[name] = measure(benchmark, args.rounds)
+                except Exception as e:
+                    # Don't let a bug in one code path prevent the other measurements
+                    print(f"{'failed':>13}  {name}: {e!r}")
+                    continue
+
+                print(f"{result['best'] * 1000:10.2f} ms  {name}")
+    if args.output:
+        data = {"meta": get_metadata(args.rounds), "results": results}
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"Results saved to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.base) as f:
+        base = json.load(f)["results"]
+    with open(args.new) as f:
+        new = json.load(f)["results"]
+    regressions = 0
+    for name in sorted(set(base) | set(new)):
+        if name not in base or name not in new:
+            status = "only in base" if name in base else "only in new"
+            print(f"{'':>10}  {'':>10}  {'':>8}  {name} ({status})")
+            continue
+
+        before = base[name]["best"]
+        after = new[name]["best"]
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "  improved"
+        print(
+            f"{before * 1000:8.2f} ms  {after * 1000:8.2f} ms  {change:+7.1f}%  "
+            f"{name}{flag}"
+        )
+    print(f"{regressions} regression(s) above {args.threshold:.1f}%")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark FakeLab")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="Save the results as JSON")
+    run_parser.add_argument(
+        "-r", "--rounds", type=int, default=DEFAULT_ROUNDS, help="Rounds per benchmark"
+    )
+    run_parser.add_argument(
+        "-k", "--filter", help="Only run benchmarks whose name contains this string"
+    )
+    run_parser.add_argument(
+        "--synthetic",
+        nargs="*",
+        default=DEFAULT_SYNTHETIC,
+        metavar="GLYPHS:AXES",
+        help="Also benchmark synthetic fonts with the number of glyphs and axes",
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("base", help="The results to compare against")
+    compare_parser.add_argument("new", help="The new results")
+    compare_parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="The slowdown in percent that counts as regression",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
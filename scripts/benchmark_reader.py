@@ -0,0 +1,79 @@
+# python scripts/benchmark_reader.py [path/to/font.vfb]
+#
+# Measure the time the VFB reader spends per entry when building a font from decompiled
+# VFB data. The binary data is decompiled only once up front, so the numbers show the
+# overhead of FakeLab's reader, not that of vfbLib's parsers.
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from vfbLib.enum import G
+from vfbLib.vfb.vfb import Vfb
+
+from FL.objects.Font import Font
+from FL.vfb.reader import VfbToFontReader, glyph_mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ROUNDS = 5
+
+if len(sys.argv) > 1:
+    vfb_path = Path(sys.argv[1])
+else:
+    data_path = Path(__file__).parent.parent / "tests" / "data"
+    vfb_path = data_path / "ComicJensPro-Regular3.000.vfb"
+
+vfb = Vfb(vfb_path, timing=False)
+vfb.decompile()
+font_entries = [
+    (e.id, e.data) for e in vfb.entries if e.id != G.Glyph and e.id not in glyph_mapping
+]
+num_glyph_entries = len(vfb.entries) - len(font_entries)
+
+
+def get_reader() -> VfbToFontReader:
+    reader = VfbToFontReader(None)
+    reader.font = Font()
+    reader.vfb = vfb
+    return reader
+
+
+def read_font_entries(reader: VfbToFontReader) -> None:
+    # Only the font-level entries, this is where the entry dispatch happens
+    reader._prepare_font()
+    for key, data in font_entries:
+        reader._read_font_entry(key, data)
+
+
+def read_all_entries(reader: VfbToFontReader) -> None:
+    reader._read_into_font()
+
+
+def measure(func: "Callable[[VfbToFontReader], None]", number: int) -> float:
+    # Return the best time of one call, excluding the instantiation of the font
+    times = []
+    for _ in range(ROUNDS):
+        readers = [get_reader() for _ in range(number)]
+        start = perf_counter()
+        for reader in readers:
+            func(reader)
+        times.append((perf_counter() - start) / number)
+    return min(times)
+
+
+print(
+    f"{vfb_path.name}: {len(font_entries)} font entries, "
+    f"{num_glyph_entries} glyph entries"
+)
+for name, func, num_entries in (
+    ("Font entries", read_font_entries, len(font_entries)),
+    ("All entries", read_all_entries, len(vfb.entries)),
+):
+    number = max(1, 20000 // num_entries)
+    best = measure(func, number)
+    print(
+        f"{name}: {best * 1000:.3f} ms per font, "
+        f"{best / num_entries * 1e6:.3f} µs per entry"
+    )
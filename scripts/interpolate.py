@@ -11,8 +11,7 @@ f = fl.font
 base_path = Path(f.file_name).parent
 # f.Save(str(base_path / "2axMM_roundtrip.vfb"))
 
-instances = f.fake_generate_primary_instances()
-for i in instances:
-    filename = f"{i.family_name}-{i.style_name.replace(' ', '')}.vfb"
-    print(filename)
-    i.Save(str(base_path / filename), save_json=True)
+# Interpolate and save the instances in parallel, using all CPUs
+paths = f.fake_save_primary_instances(base_path, workers=None, save_json=True)
+for path in paths:
+    print(path.name)
@@ -1,5 +1,6 @@
 import argparse
 import logging
+import sys
 from code import InteractiveConsole
 from pathlib import Path
 from typing import Any
@@ -7,6 +8,7 @@ from typing import Any
 from vfbLib.json import save_vfb_json
 
 from FL import environment, fl
+from FL.fake.batch import format_batch_report, run_batch
 
 try:
     from ptpython.repl import embed
@@ -68,6 +70,9 @@ def main() -> None:
     If one or more Python files are specified in the `---script` argument, those scripts
     are executed and the program exits.
 
+    If `--batch` is specified, the scripts are run on each VFB independently in a pool
+    of worker processes, and each VFB is saved afterwards, see `FL.fake.batch`.
+
     If no external script is specified, the program runs as an interactive console.
 
     Run `fakelab -h` to see a description of all command line arguments.
@@ -87,6 +92,23 @@ def main() -> None:
         nargs=1,
         help="Save files to output path instead of overwriting the original files",
     )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        action="store_true",
+        default=False,
+        help=(
+            "Run the script(s) on each VFB file independently in a pool of worker "
+            "processes, and save each file"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes in batch mode. Defaults to the number of CPUs",
+    )
     parser.add_argument(
         "-d",
         "--no-decompile",
@@ -94,6 +116,16 @@ def main() -> None:
         default=False,
         help="When roundtripping, don't decompile entries in JSON file",
     )
+    parser.add_argument(
+        "-l",
+        "--lazy",
+        action="store_true",
+        default=False,
+        help=(
+            "Decode glyphs only when they are accessed. Glyphs that were not accessed "
+            "are saved unchanged"
+        ),
+    )
     parser.add_argument(
         "-r",
         "--roundtrip",
@@ -134,14 +166,32 @@ def main() -> None:
         if args.roundtrip:
             for vfb_path in args.vfb:
                 logger.info(vfb_path)
-                fl.Open(vfb_path, addtolist=False)
+                fl.Open(vfb_path, addtolist=False, lazy=args.lazy)
                 out_path = Path(vfb_path).with_suffix(".fake.vfb")
                 fl.Save(str(out_path))
                 save_vfb_json(out_path, no_decompile=args.no_decompile)
+        elif args.batch:
+            if not args.script:
+                parser.error("Batch mode requires at least one script (-s/--script)")
+            if not args.vfb:
+                parser.error("Batch mode requires at least one VFB file")
+            try:
+                results = run_batch(
+                    args.vfb,
+                    args.script,
+                    out_path=args.out_path[0] if args.out_path else None,
+                    lazy=args.lazy,
+                    workers=args.jobs,
+                )
+            except ValueError as e:
+                parser.error(str(e))
+            print(format_batch_report(results))
+            if any(error is not None for _, _, error in results):
+                sys.exit(1)
         else:
             for vfb_path in args.vfb:
                 logger.info(vfb_path)
-                fl.Open(vfb_path, addtolist=True)
+                fl.Open(vfb_path, addtolist=True, lazy=args.lazy)
             if args.script:
                 # If we have scripts, run them and exit.
                 for script_path in args.script:
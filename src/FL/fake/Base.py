@@ -13,18 +13,6 @@ class Copyable:
     __slots__: list[str] = ["_parent"]
 
     def _copy_constructor(self, other: Any) -> None:
-        from copy import deepcopy
+        from FL.fake.copy import copy_fl_object
 
-        assert isinstance(other, type(self))
-
-        tmp = deepcopy(other)
-        for attr in self.__slots__:
-            if attr == "_parent":
-                # Parent is not copied
-                self._parent: Any | None = None
-            else:
-                try:
-                    setattr(self, attr, getattr(tmp, attr))
-                except AttributeError:
-                    logger.warning(f"Attribute not copied: {self}.{attr}")
-                    pass
+        copy_fl_object(other, self)
@@ -1,4 +1,7 @@
 import logging
+import operator
+from bisect import bisect_right
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING, Sequence
@@ -7,9 +10,11 @@ from vfbLib.enum import G
 from vfbLib.parsers.text import OpenTypeStringParser
 from vfbLib.typing import GlyphData, PSInfoDict
 
-from FL.fake.Kerning import FakeKerning
+from FL.fake.deletion import PendingDeletions
+from FL.fake.Kerning import FakeKerning, FlatKerning
 from FL.fake.mixins import GuideMixin, GuidePropertiesMixin
 from FL.fake.PSInfo import get_default_ps_info
+from FL.helpers.bounds import EMPTY_BOUNDS
 from FL.helpers.FLList import adjust_list
 from FL.helpers.interpolation import (
     build_axis_dict,
@@ -24,11 +29,22 @@ from FL.objects.Glyph import Glyph
 from FL.objects.Rect import Rect
 from FL.objects.Uni import Uni
 
+try:
+    from FL.helpers.interpolation_numpy import remove_axes_from_glyph_nodes
+
+    have_numpy = True
+except ImportError:
+    have_numpy = False
+
 if TYPE_CHECKING:
-    from typing import Any, SupportsIndex
+    from collections.abc import Iterator
+    from typing import Any, SupportsIndex, TextIO
 
     from vfbLib.vfb.vfb import Vfb
 
+    from FL.helpers.bounds import Bounds
+    from FL.vfb.incremental import VfbSource
+
 __doc__ = """
 Base class for Font
 """
@@ -43,6 +59,17 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
 
         super().__init__()
         self._fake_kerning = FakeKerning(self)
+        # Font-level entries that were kept undecoded when reading a VFB, they are
+        # written back unchanged
+        self._fake_raw_entries: list[tuple[int, bytes]] = []
+        # Where the glyphs are in the VFB file the font was read from
+        self._fake_vfb_source: "VfbSource | None" = None
+        # The bounding boxes of all glyphs in each master, with and without curve
+        # extrema, once they have been calculated
+        self._fake_bounds: "dict[bool, list[Bounds]]" = {}
+        # The glyph deletions for which the glyph references have not been updated yet
+        self._fake_pending_deletions: PendingDeletions | None = None
+        self._fake_defer_depth = 0
         self.fake_deselect_all()
 
     # Additional properties for FakeLab
@@ -63,6 +90,8 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
         self._master_names.clear()
         self._master_locations.clear()
         self._master_ps_infos.clear()
+        self._fake_raw_entries.clear()
+        self.fake_invalidate_bounds()
 
     @property
     def fake_kerning(self) -> FakeKerning:
@@ -76,24 +105,107 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
         # TODO: truncate value before scaling?
         return int(value * 1000 / self.upm)
 
-    def fake_bounding_rect(self, for_afm: bool = False) -> Rect:
-        rect = Rect(32767, 32767, -32767, -32767)
-        for g in self.glyphs:
-            gr = g.GetBoundingRect()
-            rect += gr
+    def fake_bounding_rect(
+        self, for_afm: bool = False, masterindex: int = 0, extrema: bool = False
+    ) -> Rect:
+        """
+        Return the bounding box of all glyphs in a master.
+
+        Args:
+            for_afm (bool, optional): Whether to extend the box to x = 0, like in the
+                FontBBox of an AFM file. Defaults to False.
+            masterindex (int, optional): The master index. Defaults to 0.
+            extrema (bool, optional): Whether to calculate the bounds of the curves
+                from their extrema instead of including the control points. Defaults
+                to False.
+
+        Returns:
+            Rect: The bounding box.
+        """
+        rect = Rect(*self._fake_get_bounds(extrema)[masterindex])
         if for_afm:
             if rect._x0 > 0:
                 rect._x0 = 0
         return rect
 
+    def fake_bounding_rects(self, extrema: bool = False) -> list[Rect]:
+        """
+        Return the bounding box of all glyphs in each master, without interpolating
+        instances.
+
+        Args:
+            extrema (bool, optional): Whether to calculate the bounds of the curves
+                from their extrema instead of including the control points. Defaults
+                to False.
+
+        Returns:
+            list[Rect]: The bounding box of each master.
+        """
+        return [Rect(*bounds) for bounds in self._fake_get_bounds(extrema)]
+
+    def _fake_get_bounds(self, extrema: bool = False) -> "list[Bounds]":
+        # Return the cached union of the glyph bounding boxes in each master
+        bounds = self._fake_bounds.get(extrema)
+        if bounds is None:
+            x0s = [EMPTY_BOUNDS[0]] * self._masters_count
+            y0s = [EMPTY_BOUNDS[1]] * self._masters_count
+            x1s = [EMPTY_BOUNDS[2]] * self._masters_count
+            y1s = [EMPTY_BOUNDS[3]] * self._masters_count
+            for g in self._glyphs.fake_iter_peek():
+                for m, (x0, y0, x1, y1) in enumerate(g._fake_get_bounds(extrema)):
+                    if m >= self._masters_count:
+                        break
+
+                    if x0 < x0s[m]:
+                        x0s[m] = x0
+                    if y0 < y0s[m]:
+                        y0s[m] = y0
+                    if x1 > x1s[m]:
+                        x1s[m] = x1
+                    if y1 > y1s[m]:
+                        y1s[m] = y1
+            bounds = self._fake_bounds[extrema] = list(zip(x0s, y0s, x1s, y1s))
+        return bounds
+
+    def fake_invalidate_bounds(self) -> None:
+        """
+        Discard the cached bounding box of the font. Is called when a glyph's nodes are
+        modified, or glyphs are added or removed.
+        """
+        self._fake_bounds = {}
+
     def fake_save_afm_expanded(self, filename: str) -> None:
-        afm = self.fake_get_afm(expand_kerning=True)
         afm_path = Path(filename).with_suffix(".afm")
         with open(afm_path, "w") as f:
-            f.write(afm)
+            self.fake_write_afm(f, expand_kerning=True)
 
     def fake_get_afm(self, expand_kerning: bool = False) -> str:
-        afm = ["StartFontMetrics 2.0"]
+        return "".join(f"{line}\n" for line in self.fake_iter_afm(expand_kerning))
+
+    def fake_write_afm(self, f: "TextIO", expand_kerning: bool = False) -> None:
+        """
+        Write the AFM data to a text file line by line, without building the whole
+        document in memory.
+
+        Args:
+            f (TextIO): The file to write to.
+            expand_kerning (bool, optional): Whether to expand class kerning. Defaults
+                to False.
+        """
+        f.writelines(f"{line}\n" for line in self.fake_iter_afm(expand_kerning))
+
+    def fake_iter_afm(self, expand_kerning: bool = False) -> "Iterator[str]":
+        """
+        Generate the lines of the AFM data, without line endings.
+
+        Args:
+            expand_kerning (bool, optional): Whether to expand class kerning. Defaults
+                to False.
+
+        Yields:
+            Iterator[str]: The lines.
+        """
+        yield "StartFontMetrics 2.0"
         r = self.fake_bounding_rect(for_afm=True)
         bbox = (
             f"{self._normalize_upm(r.ll.x)} {self._normalize_upm(r.ll.y)} "
@@ -101,30 +213,28 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
         )
         if bbox == "32767 32767 -32767 -32767":
             bbox = "0 0 0 0"
-        afm.extend(
-            [
-                f"Comment Copyright {self.notice}",
-                f"Comment Panose {' '.join([str(p) for p in self.panose])}",
-                f"FullName {self.full_name}",
-                f"FontName {self.font_name}",
-                f"FamilyName {self.family_name}",
-                f"Weight {self.weight}",
-                f"Notice {self.copyright}",
-                f"Version {self.version_major}.{self.version_minor:03d}",
-                f"IsFixedPitch {('false', 'true')[self.is_fixed_pitch]}",
-                f"ItalicAngle {self.italic_angle:0.2f}",
-                f"FontBBox {bbox}",
-                f"Ascender {self._normalize_upm(self.ascender[0])}",
-                f"Descender {self._normalize_upm(self.descender[0])}",
-                f"XHeight {self._normalize_upm(self.x_height[0])}",
-                f"CapHeight {self._normalize_upm(self.cap_height[0])}",
-                f"UnderlinePosition {self._normalize_upm(self.underline_position)}",
-                f"UnderlineThickness {self._normalize_upm(self.underline_thickness)}",
-                "EncodingScheme FontSpecific",
-                f"StartCharMetrics {len(self.glyphs)}",
-            ]
+        yield from (
+            f"Comment Copyright {self.notice}",
+            f"Comment Panose {' '.join([str(p) for p in self.panose])}",
+            f"FullName {self.full_name}",
+            f"FontName {self.font_name}",
+            f"FamilyName {self.family_name}",
+            f"Weight {self.weight}",
+            f"Notice {self.copyright}",
+            f"Version {self.version_major}.{self.version_minor:03d}",
+            f"IsFixedPitch {('false', 'true')[self.is_fixed_pitch]}",
+            f"ItalicAngle {self.italic_angle:0.2f}",
+            f"FontBBox {bbox}",
+            f"Ascender {self._normalize_upm(self.ascender[0])}",
+            f"Descender {self._normalize_upm(self.descender[0])}",
+            f"XHeight {self._normalize_upm(self.x_height[0])}",
+            f"CapHeight {self._normalize_upm(self.cap_height[0])}",
+            f"UnderlinePosition {self._normalize_upm(self.underline_position)}",
+            f"UnderlineThickness {self._normalize_upm(self.underline_thickness)}",
+            "EncodingScheme FontSpecific",
+            f"StartCharMetrics {len(self.glyphs)}",
         )
-        glyphs = self.fake_sort_glyphs(self.glyphs.data)
+        glyphs = self.fake_sort_glyphs(list(self._glyphs.fake_iter_peek()))
         for g in glyphs:
             r = g.bounding_box
             bbox = (
@@ -133,69 +243,193 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
             )
             if bbox == "32767 32767 -32767 -32767":
                 bbox = "0 0 0 0"
-            afm.append(
+            yield (
                 f"C {g.unicode or -1} ; WX {self._normalize_upm(g.width)} ; "
                 f"N {g.name} ; B {bbox} ;"
             )
-        afm.append("EndCharMetrics")
+        yield "EndCharMetrics"
 
         kerning = self.fake_get_afm_kerning(expand_kerning)
         if kerning:
-            kerning = self.fake_sort_kerning(kerning)
-            afm.append("StartKernData")
-            afm.append(f"StartKernPairs {len(kerning)}")
+            yield "StartKernData"
+            yield f"StartKernPairs {len(kerning)}"
             prev_L = ""
-            for L, R, value in kerning:
+            for L, R, value in self._fake_iter_sorted_kerning(kerning):
                 if prev_L != "" and prev_L != L:
-                    afm.append("")
-                afm.append(f"KPX {L} {R} {self._normalize_upm(value)}")
+                    yield ""
+                yield f"KPX {L} {R} {self._normalize_upm(value)}"
                 prev_L = L
 
-            afm.append("")
-            afm.append("EndKernPairs")
-            afm.append("EndKernData")
-        afm.append("EndFontMetrics\n")
-
-        return "\n".join(afm)
+            yield ""
+            yield "EndKernPairs"
+            yield "EndKernData"
+        yield "EndFontMetrics"
 
     def fake_get_afm_kerning(
         self, expand_kerning: bool = False
-    ) -> list[tuple[str, str, int]]:
+    ) -> Sequence[tuple[str, str, int]]:
         if expand_kerning:
             self.fake_kerning.expand()
             return self.fake_kerning.flat_kerning
 
         kerning = []
-        for g in self.glyphs:
+        glyphs = self._glyphs
+        for g in glyphs.fake_iter_peek():
             L = g.name
             for pair in g.kerning:
-                R = self.glyphs[pair.key].name
+                R = glyphs.fake_peek(pair.key).name
                 value = pair.value
                 kerning.append((L, R, value))
         return kerning
 
     def fake_get_inf(self) -> str:
-        inf = ""
-        return inf
+        return "".join(f"{line}\n" for line in self.fake_iter_inf())
+
+    def fake_write_inf(self, f: "TextIO") -> None:
+        """
+        Write the INF data to a text file line by line.
+
+        Args:
+            f (TextIO): The file to write to.
+        """
+        f.writelines(f"{line}\n" for line in self.fake_iter_inf())
+
+    def fake_iter_inf(self) -> "Iterator[str]":
+        """
+        Generate the lines of the INF data, without line endings. FakeLab doesn't
+        generate the INF data, so there are no lines and the INF file written by
+        `Font.SaveAFM()` is empty.
+
+        Yields:
+            Iterator[str]: The lines.
+        """
+        yield from ()
+
+    def fake_get_sort_ranks(self) -> tuple[dict[str, int], dict[str, int]]:
+        """
+        Return the order in which glyphs and kerning pairs are written to an AFM file.
+
+        The primary order is that of the encoding. Glyphs that are not in the encoding
+        follow in glyph order.
+
+        Returns:
+            tuple[dict[str, int], dict[str, int]]: The rank of each glyph name in the
+                primary order, and the rank of each glyph name in glyph order. If a
+                name occurs more than once, the first occurrence counts.
+        """
+        ranks: dict[str, int] = {}
+        for i, rec in enumerate(self.encoding):
+            ranks.setdefault(rec.name, i)
+        glyph_ranks: dict[str, int] = {}
+        for i, g in enumerate(self._glyphs.fake_iter_peek()):
+            glyph_ranks.setdefault(g.name, i)
+        offset = len(self.encoding)
+        for name, i in glyph_ranks.items():
+            ranks.setdefault(name, offset + i)
+        return ranks, glyph_ranks
 
     def fake_sort_glyphs(self, glyphs: list[Glyph]) -> list[Glyph]:
-        glyph_order = tuple([rec.name for rec in self.encoding])
-        sortable = [(glyph_order.index(glyph.name), glyph) for glyph in glyphs]
-        sortable.sort()
-        # print(sortable)
-        return [glyph for _, glyph in sortable]
+        """
+        Sort glyphs in AFM order, see `fake_get_sort_ranks()`. Glyphs that are not in
+        the font come last.
+
+        Args:
+            glyphs (list[Glyph]): The glyphs.
+
+        Returns:
+            list[Glyph]: The sorted glyphs.
+        """
+        ranks, _ = self.fake_get_sort_ranks()
+        last = len(self.encoding) + len(self.glyphs)
+        # The sort is stable, glyphs with the same rank keep their order
+        return sorted(glyphs, key=lambda glyph: ranks.get(glyph.name, last))
 
     def fake_sort_kerning(
-        self, kerning: list[tuple[str, str, int]]
+        self, kerning: Sequence[tuple[str, str, int]]
     ) -> list[tuple[str, str, int]]:
-        encoding_order = tuple([rec.name for rec in self.encoding])
-        glyph_order = tuple([rec.name for rec in self.glyphs])
-        sortable = [
-            (encoding_order.index(L), glyph_order.index(R), L, R, value)
-            for L, R, value in kerning
+        """
+        Sort kerning pairs in AFM order: By the left glyph in the order of
+        `fake_get_sort_ranks()`, then by the right glyph in glyph order. Glyphs that are
+        not in the font come last, sorted by name.
+
+        Args:
+            kerning (Sequence[tuple[str, str, int]]): The kerning pairs as tuples of
+                left glyph name, right glyph name, and value.
+
+        Returns:
+            list[tuple[str, str, int]]: The sorted kerning pairs.
+        """
+        return list(self._fake_iter_sorted_kerning(kerning))
+
+    def _fake_iter_sorted_kerning(
+        self, kerning: Sequence[tuple[str, str, int]]
+    ) -> "Iterator[tuple[str, str, int]]":
+        # Return the kerning pairs in the order of fake_sort_kerning(). Expanded kerning
+        # pairs are converted to tuples only when they are consumed.
+        ranks, glyph_ranks = self.fake_get_sort_ranks()
+        if isinstance(kerning, FlatKerning):
+            return self._fake_sort_flat_kerning(kerning, ranks, glyph_ranks)
+
+        last_left = len(self.encoding) + len(self.glyphs)
+        last_right = len(self.glyphs)
+        sorted_kerning = sorted(
+            kerning,
+            key=lambda pair: (
+                ranks.get(pair[0], last_left),
+                glyph_ranks.get(pair[1], last_right),
+                pair[0],
+                pair[1],
+            ),
+        )
+        return iter(sorted_kerning)
+
+    def _fake_sort_flat_kerning(
+        self,
+        kerning: FlatKerning,
+        ranks: dict[str, int],
+        glyph_ranks: dict[str, int],
+    ) -> "Iterator[tuple[str, str, int]]":
+        # Sort flat kerning row by row, without building sort keys for all pairs. The
+        # names are sorted, so glyphs that are not in the font are sorted by name if
+        # their id is added to their rank.
+        names = kerning.names
+        left = kerning.left
+        right = kerning.right
+        values = kerning.values
+        last_left = len(self.encoding) + len(self.glyphs)
+        last_right = len(self.glyphs)
+        left_ranks = [ranks.get(name, last_left + i) for i, name in enumerate(names)]
+        right_ranks = [
+            glyph_ranks.get(name, last_right + i) for i, name in enumerate(names)
         ]
-        sortable.sort()
-        return [(L, R, value) for _, _, L, R, value in sortable]
+
+        # The pairs are grouped by left glyph. Sort the groups by the left glyph.
+        rows = []
+        start = 0
+        num_pairs = len(left)
+        while start < num_pairs:
+            L = left[start]
+            end = bisect_right(left, L, start)
+            rows.append((left_ranks[L], start, end))
+            start = end
+        rows.sort()
+
+        # The order of the right glyphs of a row. Class members share their rows, so
+        # the order is cached by the right glyphs.
+        orders: dict[bytes, list[int]] = {}
+        for _, start, end in rows:
+            row_right = right[start:end]
+            key = row_right.tobytes()
+            order = orders.get(key)
+            if order is None:
+                row_ranks = [right_ranks[R] for R in row_right]
+                order = orders[key] = sorted(
+                    range(end - start), key=row_ranks.__getitem__
+                )
+            L_name = names[left[start]]
+            row_values = values[start:end]
+            for i in order:
+                yield L_name, names[row_right[i]], row_values[i]
 
     def fake_update(self) -> None:
         """
@@ -260,7 +494,25 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
 
         self._file_name = Path(filename) if not isinstance(filename, Path) else filename
 
-    def fake_generate_primary_instances(self) -> "list[FakeFont]":
+    def fake_generate_primary_instances(
+        self, workers: int | None = 1
+    ) -> "list[FakeFont]":
+        """
+        Interpolate the primary instances of an MM font.
+
+        Args:
+            workers (int | None, optional): The number of worker processes. If it is
+                not 1, the instances are interpolated in parallel; None means the
+                number of CPUs. Defaults to 1.
+
+        Returns:
+            list[FakeFont]: The instance fonts.
+        """
+        if workers != 1:
+            from FL.fake.instances import generate_instances
+
+            return list(generate_instances(self, self._primary_instances, workers))
+
         instances: "list[FakeFont]" = []
         for inst_dict in self._primary_instances:
             logger.info(inst_dict)
@@ -269,6 +521,43 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
 
         return instances
 
+    def fake_save_primary_instances(
+        self,
+        out_path: str | Path,
+        workers: int | None = 1,
+        save_json: bool = False,
+    ) -> list[Path]:
+        """
+        Interpolate the primary instances of an MM font and save them as VFB files named
+        after the family and style name, e.g. `TwoAxis-Cd2ExtraLight.vfb`.
+
+        Args:
+            out_path (str | Path): The directory in which to save the instances.
+            workers (int | None, optional): The number of worker processes. If it is
+                not 1, the instances are interpolated and saved in parallel; None means
+                the number of CPUs. Defaults to 1.
+            save_json (bool, optional): Whether to save a JSON file next to each VFB.
+                Defaults to False.
+
+        Returns:
+            list[Path]: The paths of the saved VFB files.
+        """
+        from FL.fake.instances import get_instance_file_name, save_instances
+
+        out_path = Path(out_path)
+        if workers != 1:
+            return save_instances(
+                self, self._primary_instances, out_path, workers, save_json
+            )
+
+        paths: list[Path] = []
+        for instance in self.fake_generate_primary_instances():
+            file_path = out_path / get_instance_file_name(instance)
+            instance.Save(str(file_path), save_json=save_json)
+            paths.append(file_path)
+
+        return paths
+
     def fake_deserialize_axis(self, data: str) -> None:
         # VFB stores only the long name of an axis.
         short_name = {
@@ -518,6 +807,7 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
         internal_values: tuple[float, ...],
         family_name: str | None = None,
         style_name: str | None = None,
+        vectorized: bool = True,
     ) -> None:
         """
         Interpolate an instance of an MM font using internal axis locations.
@@ -529,18 +819,37 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
                 Defaults to None.
             style_name (str | None, optional): The style name for the instance. Defaults
                 to None.
+            vectorized (bool, optional): Whether to interpolate the glyph nodes using
+                NumPy, if it is installed. Defaults to True.
         """
 
         # Do the interpolation
 
-        axis_index = self._axis_count - 1
         logger.info(f"Internal values: {internal_values}")
-        for factor in reversed(internal_values):
+        # Axes are removed from the last to the first
+        removals = list(
+            zip(range(self._axis_count - 1, -1, -1), reversed(internal_values))
+        )
+        if removals:
+            factors = [factor for _, factor in removals]
+            # Values are only rounded when the first axis is removed
+            round_values = removals[-1][0] == 0
+            m = self._masters_count
+
+            # Interpolate the glyphs for all axes in one pass
+            nodes = not (vectorized and have_numpy)
+            if not nodes:
+                remove_axes_from_glyph_nodes(self.glyphs, factors, m, round_values)
+            if self._global_mask is not None:
+                self._global_mask.fake_remove_axes(factors, round_values, m)
+            for glyph in self.glyphs:
+                glyph.fake_remove_axes(factors, round_values, m, nodes)
+
+        for axis_index, factor in removals:
             logger.info(f"Interpolating axis {axis_index} with factor {factor:.3f}")
-            self.fake_remove_axis(axis_index, factor, round_values=axis_index == 0)
-            axis_index -= 1
-            if axis_index < 0:
-                break
+            self.fake_remove_axis(
+                axis_index, factor, round_values=axis_index == 0, glyphs=False
+            )
 
         # Assign new font info
 
@@ -600,7 +909,10 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
         self._masters_count *= 2
 
         adjust_list(self.weight_vector._weights, self._masters_count, 0.0)
-        adjust_list(self._anisotropic_interpolation_mappings, self._axis_count)
+        # New axes get a linear mapping, None can't be written to a VFB
+        mappings = self._anisotropic_interpolation_mappings
+        while len(mappings) < self._axis_count:
+            mappings.append([(0, 0), (1000, 1000)])
 
         # Add master names
         master_map = self.fake_master_map()
@@ -619,7 +931,11 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
             self._master_locations.append((master_index + 1, location_tuple_2))
 
     def fake_remove_axis(
-        self, index: int, position: float, round_values: bool = True
+        self,
+        index: int,
+        position: float,
+        round_values: bool = True,
+        glyphs: bool = True,
     ) -> None:
         """
         Remove an axis from the font, interpolating the remaining masters.
@@ -628,6 +944,9 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
             index (int): The index of the axis to remove.
             position (float): The interpolation factor in internal coordinates (0.0-1.0).
             round_values (bool, optional): Whether to round the results. Defaults to True.
+            glyphs (bool, optional): Whether to interpolate the glyphs and the global
+                mask. Pass False if they have been interpolated already. Defaults to
+                True.
         """
         if self._axis_count == 0:
             # Ignore silently
@@ -639,12 +958,13 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
         r = round_values
         m = self._masters_count
 
-        if self._global_mask is not None:
-            self._global_mask.fake_remove_axis(index, position, round_values, m)
+        if glyphs:
+            if self._global_mask is not None:
+                self._global_mask.fake_remove_axis(index, position, round_values, m)
 
-        # Remove axis from glyphs
-        for glyph in self.glyphs:
-            glyph.fake_remove_axis(index, position, round_values, m)
+            # Remove axis from glyphs
+            for glyph in self.glyphs:
+                glyph.fake_remove_axis(index, position, round_values, m)
 
         for guide in self.hguides:
             guide.fake_remove_axis(index, position, round_values, m)
@@ -752,14 +1072,47 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
     ) -> None:
         """
         Delete one or more glyphs from the font. Updates the glyph indices in all places
-        where glyphs are referenced by index instead of name.
+        where glyphs are referenced by index instead of name. Inside a
+        `fake_defer_reindex()` block, the update is deferred until the end of the
+        block.
+
+        Deleting many glyphs at once, or inside a `fake_defer_reindex()` block, is much
+        faster than deleting them one by one.
 
         Args:
-            i (SupportsIndex | slice[Any, Any, Any]): The glyph index/indices to delete.
+            i (SupportsIndex | slice[Any, Any, Any] | Sequence[int]): The glyph
+                index/indices to delete.
         """
-        # For slice, we must check for an IndexError ourselves to match FLS behaviour
+        indices = self._fake_get_delete_indices(i)
+        if not indices:
+            return
+
+        pending = self._fake_pending_deletions
+        if pending is None:
+            pending = self._fake_pending_deletions = PendingDeletions(len(self._glyphs))
+
+        # We can't call del on the list because it would be referred back to us:
+        # del self._glyphs[i]
+        # Access the data member directly instead:
+        data = self._glyphs.data
+        for gid in reversed(indices):
+            pending.delete(gid, data[gid].name)
+            del data[gid]
+
+        self._glyphs.fake_invalidate_index()
+        self.fake_invalidate_bounds()
+        if not self._fake_defer_depth:
+            self.fake_reindex_glyphs()
+
+    def _fake_get_delete_indices(
+        self, i: "SupportsIndex | slice[Any, Any, Any] | Sequence[int]"
+    ) -> list[int]:
+        # Return the sorted glyph indices to delete. Raise an IndexError before anything
+        # is deleted.
         num_glyphs = len(self._glyphs)
         if isinstance(i, slice):
+            # For slice, we must check for an IndexError ourselves to match FLS
+            # behaviour
             start, stop, step = i.indices(num_glyphs)
             if stop >= num_glyphs:
                 raise IndexError("List index is out of range")
@@ -768,49 +1121,87 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
             if stop < start:
                 raise IndexError("Incorrect indexes for slice operation")
 
-        old_gids = {gid: glyph.name for gid, glyph in enumerate(self._glyphs)}
-
-        # The actual deletion
+            return sorted(range(start, stop, step))
 
-        # We can't call del on the list because it would be referred back to us:
-        # del self._glyphs[i]
-        # Access the data member directly instead:
-        if isinstance(i, Sequence):
-            for gid in sorted(i, reverse=True):
-                # logger.info(f"Removing GID {gid}")
-                del self._glyphs.data[gid]
-        else:
-            try:
-                del self._glyphs.data[i]
-            except IndexError:
-                # FIXME: FontLab raises before doing anything
+        indices = set()
+        for gid in i if isinstance(i, Sequence) else [i]:
+            gid = operator.index(gid)
+            if gid < 0:
+                gid += num_glyphs
+            if not 0 <= gid < num_glyphs:
                 raise IndexError("List index is out of range")
 
-        new_gids = {glyph.name: gid for gid, glyph in enumerate(self._glyphs)}
-        gid_map = {og: new_gids.get(name) for og, name in old_gids.items()}
-        logger.info(f"GID map: {gid_map}")
+            indices.add(gid)
+        return sorted(indices)
+
+    @contextmanager
+    def fake_defer_reindex(self) -> "Iterator[None]":
+        """
+        Defer updating the glyph references after glyphs have been deleted until the
+        end of the block, so they are updated only once:
+
+            with font.fake_defer_reindex():
+                for i in reversed(range(len(font))):
+                    if font[i].name.endswith(".old"):
+                        del font.glyphs[i]
+
+        Inside the block, the glyph indices in components and kerning pairs still refer
+        to the glyphs before the first deletion. Other changes of the glyph list, and
+        `fake_reindex_glyphs()`, update them early.
+        """
+        self._fake_defer_depth += 1
+        try:
+            yield
+        finally:
+            self._fake_defer_depth -= 1
+            if not self._fake_defer_depth:
+                self.fake_reindex_glyphs()
+
+    def fake_reindex_glyphs(self) -> None:
+        """
+        Update the glyph indices in components and kerning pairs after glyphs have been
+        deleted. Components and kerning pairs that reference deleted glyphs are
+        removed. Only the glyphs that reference glyphs whose index has changed are
+        modified.
+        """
+        pending = self._fake_pending_deletions
+        if pending is None:
+            return
+
+        self._fake_pending_deletions = None
+        first = pending.get_first_changed()
+        if first < 0:
+            return
 
-        # Fix component and kerning indices
-        for glyph in self._glyphs:
+        gid_map = pending.get_gid_map()
+        num_glyphs = pending.num_glyphs
+        glyphs = self._glyphs
+        for j in range(len(glyphs)):
+            # Only hand out the glyphs that reference a glyph from the first changed
+            # index on
+            peeked = glyphs.fake_peek(j)
+            if all(
+                0 <= component.index < first for component in peeked.components.data
+            ) and all(0 <= pair.key < first for pair in peeked.kerning.data):
+                continue
+
+            glyph = glyphs[j]
             # Components
             delete_components = []
-            for ci, component in enumerate(glyph.components):
-                new_cgid = gid_map.get(component.index)
-                if new_cgid is None:
+            for ci, component in enumerate(glyph.components.data):
+                old_cgid = component.index
+                new_cgid = gid_map[old_cgid] if 0 <= old_cgid < num_glyphs else -1
+                if new_cgid == -1:
                     # Referenced glyph has been removed.
                     logger.warning(
-                        f"Glyph '{old_gids.get(component.index)}' was removed, but it "
+                        f"Glyph '{pending.names.get(old_cgid)}' was removed, but it "
                         f"is used as component #{ci} in '{glyph.name}'"
                     )
                     # TODO: In an earlier version, we set the component index to -1.
                     # What is FL's behaviour?
                     # component.index = -1
                     delete_components.append(ci)
-                elif component.index != new_cgid:
-                    # logger.info(
-                    #     f"Setting component index in glyph '{glyph.name}' for base "
-                    #     f"glyph '{base_name}' from {component.index} to {new_cgid}"
-                    # )
+                elif old_cgid != new_cgid:
                     component.index = new_cgid
             # Remove any components from the glyph that pointed to deleted glyphs
             if delete_components:
@@ -819,12 +1210,13 @@ class FakeFont(BaseFont, GuideMixin, GuidePropertiesMixin):
 
             # Kerning
             delete_pairs = []
-            for ki, kerning_pair in enumerate(glyph.kerning):
-                new_gid = gid_map.get(kerning_pair.key)
-                if new_gid is None:
+            for ki, kerning_pair in enumerate(glyph.kerning.data):
+                old_gid = kerning_pair.key
+                new_gid = gid_map[old_gid] if 0 <= old_gid < num_glyphs else -1
+                if new_gid == -1:
                     # Right partner has been removed
                     delete_pairs.append(ki)
-                elif kerning_pair.key != new_gid:
+                elif old_gid != new_gid:
                     kerning_pair.key = new_gid
             # Remove any kerning pairs from the glyph that pointed to deleted glyphs
             if delete_pairs:
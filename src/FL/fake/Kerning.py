@@ -1,12 +1,17 @@
 import logging
-from typing import TYPE_CHECKING
+from array import array
+from collections.abc import Sequence
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, overload
 
 from FL.fake.KerningClass import KerningClass
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
     from pathlib import Path
 
     from FL.objects.Font import Font
+    from FL.objects.Glyph import Glyph
 
 
 logger = logging.getLogger(__name__)
@@ -17,6 +22,81 @@ Base class for Kerning
 """
 
 
+# A flat kerning pair: left glyph name, right glyph name, value
+FlatKerningPair = tuple[str, str, int]
+
+
+class FlatKerning(Sequence[FlatKerningPair]):
+    """
+    Flat kerning pairs, stored in columns: The left and right glyph of each pair as
+    index into a list of glyph names, and the values. The pairs are converted to
+    tuples of (left glyph name, right glyph name, value) only when they are accessed.
+
+    The pairs are sorted by the left and then by the right index.
+    """
+
+    __slots__ = ["names", "left", "right", "values"]
+
+    def __init__(
+        self,
+        names: list[str] | None = None,
+        left: "array[int] | None" = None,
+        right: "array[int] | None" = None,
+        values: "array[int] | None" = None,
+    ) -> None:
+        """
+        Args:
+            names (list[str] | None, optional): The glyph names. Defaults to None.
+            left (array[int] | None, optional): The index of the left glyph name of
+                each pair. Defaults to None.
+            right (array[int] | None, optional): The index of the right glyph name of
+                each pair. Defaults to None.
+            values (array[int] | None, optional): The value of each pair. Defaults to
+                None.
+        """
+        self.names = names or []
+        self.left = array("i") if left is None else left
+        self.right = array("i") if right is None else right
+        self.values = array("i") if values is None else values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"<FlatKerning: {len(self)} pairs>"
+
+    def __iter__(self) -> "Iterator[FlatKerningPair]":
+        names = self.names
+        for left, right, value in zip(self.left, self.right, self.values):
+            yield names[left], names[right], value
+
+    @overload
+    def __getitem__(self, index: int) -> FlatKerningPair:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> list[FlatKerningPair]:
+        pass
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> FlatKerningPair | list[FlatKerningPair]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return (
+            self.names[self.left[index]],
+            self.names[self.right[index]],
+            self.values[index],
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (FlatKerning, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return NotImplemented
+
+
 class FakeKerning:
     def __init__(self, font: "Font | None" = None) -> None:
         self._font = font
@@ -41,55 +121,180 @@ class FakeKerning:
         if self._font is None:
             raise ValueError
 
-        self.flat_kerning = []
-        cc = []  # Class-class pairs
-        gc = []  # Glyph-class pairs
+        glyphs = self._font.glyphs.fake_iter_peek()
+        names, gid_ranks, left_members, right_members = self._get_ranked_ids()
+        class_rows, cg, gc, gg = self._sort_pairs(
+            glyphs, gid_ranks, left_members, right_members
+        )
+
+        # The values by right id, by left id. The members of a left class share the
+        # row of the class until a pair is added for one of them. Later pairs override
+        # earlier ones.
+        rows: dict[int, dict[int, int]] = {}
+        own_rows: set[int] = set()
+
+        def get_own_row(L: int) -> dict[int, int]:
+            if L in own_rows:
+                return rows[L]
+
+            row = rows[L] = dict(rows.get(L, {}))
+            own_rows.add(L)
+            return row
+
+        for key, class_row in class_rows.items():
+            for L in left_members[key]:
+                if L in rows:
+                    # The glyph is a member of more than one left class
+                    get_own_row(L).update(class_row)
+                else:
+                    rows[L] = class_row
+        for l_class, R, value in cg:
+            for L in l_class:
+                get_own_row(L)[R] = value
+        for L, r_class, value in gc:
+            get_own_row(L).update(dict.fromkeys(r_class, value))
+        for L, R, value in gg:
+            get_own_row(L)[R] = value
+
+        left, right, values = self._get_columns(rows, own_rows)
+        self.flat_kerning = FlatKerning(names, left, right, values)
+        logger.info("Expanded kerning: %i pairs." % len(self.flat_kerning))
+
+    def _get_ranked_ids(
+        self,
+    ) -> "tuple[list[str], array[int], dict[int, list[int]], dict[int, list[int]]]":
+        # Give each glyph name an id. Glyphs with the same name share the id, and class
+        # members that are not in the font get an id, too. The ids are numbered in the
+        # order of the glyph names, so the pairs can be sorted by id.
+        # Return the sorted names, the id of each glyph by glyph index, and the ids of
+        # the glyphs of each left and right class by the id of its key glyph.
+        assert self._font is not None
+        names: list[str] = []
+        ids: dict[str, int] = {}
+
+        def get_id(name: str) -> int:
+            i = ids.get(name)
+            if i is None:
+                i = ids[name] = len(names)
+                names.append(name)
+            return i
+
+        gid_ids = array(
+            "i", [get_id(g.name) for g in self._font.glyphs.fake_iter_peek()]
+        )
+        left_members = self._get_class_members(self.classes_left, get_id)
+        right_members = self._get_class_members(self.classes_right, get_id)
+
+        n = len(names)
+        order = sorted(range(n), key=names.__getitem__)
+        rank = array("i", [0]) * n
+        for r, i in enumerate(order):
+            rank[i] = r
+        return (
+            [names[i] for i in order],
+            array("i", [rank[i] for i in gid_ids]),
+            {
+                rank[key]: [rank[i] for i in members]
+                for key, members in left_members.items()
+            },
+            {
+                rank[key]: [rank[i] for i in members]
+                for key, members in right_members.items()
+            },
+        )
+
+    def _sort_pairs(
+        self,
+        glyphs: "Iterable[Glyph]",
+        gid_ranks: "array[int]",
+        left_members: dict[int, list[int]],
+        right_members: dict[int, list[int]],
+    ) -> tuple[
+        dict[int, dict[int, int]],
+        list[tuple[list[int], int, int]],
+        list[tuple[int, list[int], int]],
+        list[tuple[int, int, int]],
+    ]:
+        # Return the class-class pairs as one row per left class (the values by right
+        # id), and the class-glyph, glyph-class and glyph-glyph pairs
+        class_rows: dict[int, dict[int, int]] = {}
         cg = []  # Class-glyph pairs
+        gc = []  # Glyph-class pairs
         gg = []  # Glyph-glyph pairs
-        for g in self._font.glyphs:
+        for gid, g in enumerate(glyphs):
+            L = gid_ranks[gid]
+            l_class = left_members.get(L)
             for kerning_pair in g.kerning:
                 value = kerning_pair.value
                 if value == 0:
                     continue
-                L = g.name
-                R = self._font.glyphs[kerning_pair.key].name
-                l_class = self.classes_left.get(L, None)
-                r_class = self.classes_right.get(R, None)
+
+                R = gid_ranks[kerning_pair.key]
+                r_class = right_members.get(R)
                 if l_class:
                     if r_class:
-                        cc.append((l_class, r_class, value))
+                        class_rows.setdefault(L, {}).update(
+                            dict.fromkeys(r_class, value)
+                        )
                     else:
                         cg.append((l_class, R, value))
+                elif r_class:
+                    gc.append((L, r_class, value))
                 else:
-                    if r_class:
-                        gc.append((L, r_class, value))
-                    else:
-                        gg.append((L, R, value))
-
-        pairs = {}
-        for l_class, r_class, value in cc:
-            for L in [l_class.keyglyph] + list(l_class.glyphs):
-                for R in [r_class.keyglyph] + list(r_class.glyphs):
-                    pairs[(L, R)] = value
-        for l_class, R, value in cg:
-            for L in [l_class.keyglyph] + list(l_class.glyphs):
-                pairs[(L, R)] = value
-        for L, r_class, value in gc:
-            for R in [r_class.keyglyph] + list(r_class.glyphs):
-                pairs[(L, R)] = value
-        for L, R, value in gg:
-            pairs[(L, R)] = value
-        self.flat_kerning = sorted([(g[0], g[1], v) for g, v in pairs.items()])
-        logger.info("Expanded kerning: %i pairs." % len(self.flat_kerning))
+                    gg.append((L, R, value))
+        return class_rows, cg, gc, gg
+
+    def _get_columns(
+        self, rows: dict[int, dict[int, int]], own_rows: set[int]
+    ) -> "tuple[array[int], array[int], array[int]]":
+        # Return the left ids, right ids and values of the rows, sorted by left and
+        # right id
+        left = array("i")
+        right = array("i")
+        values = array("i")
+        # The sorted right ids and values of the shared rows
+        columns: dict[int, tuple[array[int], array[int]]] = {}
+        for L in sorted(rows):
+            row = rows[L]
+            if (row_columns := columns.get(id(row))) is None:
+                keys = sorted(row)
+                row_columns = (array("i", keys), array("i", map(row.__getitem__, keys)))
+                if L not in own_rows:
+                    columns[id(row)] = row_columns
+            row_right, row_values = row_columns
+            left.extend(repeat(L, len(row_right)))
+            right.extend(row_right)
+            values.extend(row_values)
+        return left, right, values
+
+    def _get_class_members(
+        self, classes: dict[str, KerningClass], get_id: "Callable[[str], int]"
+    ) -> dict[int, list[int]]:
+        # Return the ids of the glyphs of each class by the id of its key glyph
+        members = {}
+        for key_glyph, kc in classes.items():
+            members[get_id(key_glyph)] = [get_id(key_glyph)] + [
+                get_id(name) for name in kc.glyphs
+            ]
+        return members
 
     def expand(self) -> None:
         if self._font is None:
             logger.error("You need to supply a font before you can expand the kerning")
             return
 
-        self.import_classes_from_font(self._font)
+        # Import the classes only if they have changed since the last import
+        classes_key = self._get_classes_key(self._font)
+        if classes_key != self._classes_key:
+            self.import_classes_from_font(self._font)
+            self._classes_key = classes_key
         self._expand()
 
+    def _get_classes_key(self, font: "Font") -> tuple[Any, ...]:
+        # Return a value that changes when the classes or their flags change
+        flags = font._classes.fake_serialize_kerning_class_flags()
+        return tuple(font._classes), tuple(flags.items())
+
     def export_afm(self, file_path: "Path", expand: bool = True) -> None:
         """
         Export kerning data to an AFM file at `file_path`.
@@ -230,7 +435,9 @@ class FakeKerning:
         self.classes: dict[str, dict[str, KerningClass]] = {"L": {}, "R": {}}
         self.classes_left: dict[str, KerningClass] = self.classes["L"]
         self.classes_right: dict[str, KerningClass] = self.classes["R"]
+        # The classes and flags of the font the classes were last imported from
+        self._classes_key: tuple[Any, ...] | None = None
 
     def reset_pairs(self) -> None:
         self.kerning: dict[tuple[str, str], list[int]] = {}
-        self.flat_kerning: list[tuple[str, str, int]] = []
+        self.flat_kerning: FlatKerning = FlatKerning()
@@ -1,3 +1,4 @@
+from array import array
 from typing import TYPE_CHECKING, Any
 
 from vfbLib.typing import MMNode
@@ -14,14 +15,16 @@ from FL.constants import (
 )
 from FL.helpers.interpolation import (
     add_axis_to_master_list,
+    remove_axes_from_coords,
+    remove_axes_from_master_point_list,
     remove_axis_from_master_point_list,
     round_master_point_list,
 )
-from FL.helpers.ListParent import ListParent
 from FL.objects.base.Node import BaseNode
-from FL.objects.Point import Point
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from FL.objects.Glyph import Glyph
 
 
@@ -31,24 +34,28 @@ class FakeNode(BaseNode):
         self.type = vfb2json_node_types[data["type"]]
         flags = data["flags"]
         self.alignment = vfb2json_node_conns[flags & ~8]
-        self._points = [ListParent(only_type=Point) for _ in range(self._masters_count)]
+        if self.type in (nMOVE, nLINE, nOFF):
+            num_points = 1
+        elif self.type == nCURVE:
+            num_points = 3
+        else:
+            raise ValueError(f"Unknown Node type: {self.type}")
         points = data.get("points", [])
+        coords = array("d")
         for master_index in range(num_masters):
             master_points = points[master_index]
-            if self.type in (nMOVE, nLINE, nOFF):
-                assert len(master_points) == 1
-            elif self.type == nCURVE:
-                assert len(master_points) == 3
-            else:
-                raise ValueError(f"Unknown Node type: {self.type}")
+            assert len(master_points) == num_points
             for x, y in master_points:
-                self._points[master_index].append(Point(x, y))
-        if self.type in (nMOVE, nLINE, nOFF):
-            assert len(self.points) == 1
-        elif self.type == nCURVE:
-            assert len(self.points) == 3
+                coords.append(x)
+                coords.append(y)
+        if num_masters:
+            # Store the points compactly until they are accessed
+            self._fake_coords = coords
+            self._fake_points = None
+            self._fake_points_count = num_points
+            self.fake_invalidate_bounds()
         else:
-            raise ValueError(f"Unknown Node type: {self.type}")
+            self._points = []
         if flags & 8:  # open path
             self.type += 0x8000
 
@@ -64,9 +71,18 @@ class FakeNode(BaseNode):
             points=[],
         )
         points: list[list[tuple[int, int]]] = [[] for _ in range(num_masters)]
-        for master_index, master_points in enumerate(self._points):
-            for p in master_points:
-                points[master_index].append((int(p.x), int(p.y)))
+        if self._fake_coords is not None:
+            coords = self._fake_coords
+            n = 2 * self._fake_points_count
+            for master_index, start in enumerate(range(0, len(coords), n)):
+                points[master_index] = [
+                    (int(coords[i]), int(coords[i + 1]))
+                    for i in range(start, start + n, 2)
+                ]
+        else:
+            for master_index, master_points in enumerate(self._points):
+                for p in master_points:
+                    points[master_index].append((int(p.x), int(p.y)))
         d["points"] = points
         return d
 
@@ -79,8 +95,17 @@ class FakeNode(BaseNode):
             p.fake_update(self)
 
     def fake_add_axis(self) -> None:
-        add_axis_to_master_list(self._points)
+        if self._fake_coords is not None:
+            self._fake_coords *= 2
+        else:
+            num_masters = len(self._points)
+            add_axis_to_master_list(self._points)
+            for master_index in range(num_masters, len(self._points)):
+                self._points[master_index] = self._fake_point_list(
+                    self._points[master_index]
+                )
         self._masters_count *= 2
+        self.fake_invalidate_bounds()
 
     def fake_remove_axis(
         self,
@@ -92,6 +117,10 @@ class FakeNode(BaseNode):
         if len(self) == 0:
             return
 
+        if self._fake_coords is not None:
+            self.fake_remove_axes([interpolation], round_values, num_masters)
+            return
+
         # print(
         #     f"Node.fake_remove_axis {axisindex} for type {self.type}: {self._points} ({interpolation})"
         # )
@@ -102,4 +131,23 @@ class FakeNode(BaseNode):
         self._masters_count //= 2
         if round_values:
             round_master_point_list(self._points)
+        self.fake_invalidate_bounds()
         # print(f"                             Result: {self._points}")
+
+    def fake_remove_axes(
+        self,
+        factors: "Sequence[float]",
+        round_values: bool = True,
+        num_masters: int = -1,
+    ) -> None:
+        if len(self) == 0:
+            return
+
+        if self._fake_coords is not None:
+            self._fake_coords = remove_axes_from_coords(
+                self._fake_coords, 2 * self._fake_points_count, factors, round_values
+            )
+        else:
+            remove_axes_from_master_point_list(self._points, factors, round_values)
+        self._masters_count //= 1 << len(factors)
+        self.fake_invalidate_bounds()
@@ -0,0 +1,175 @@
+import logging
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import FL
+from FL.objects.FontLab import FakeLab
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+__doc__ = """
+Run scripts against many VFB files in a pool of worker processes.
+
+Each VFB is processed independently: It is opened in a fresh `FakeLab` object, so
+scripts see only that one font in `fl`, the scripts are executed, and the font is saved.
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+# The result of processing one file: The path of the VFB, the time it took in seconds,
+# and the formatted traceback if processing failed, or None if it succeeded.
+BatchResult = tuple[str, float, str | None]
+
+
+def get_batch_output_path(vfb_path: str, out_path: str | None = None) -> Path:
+    """
+    Return the path under which a VFB is saved in batch mode.
+
+    Args:
+        vfb_path (str): The path of the original VFB.
+        out_path (str | None, optional): The output directory. Defaults to None, which
+            means the original file is overwritten.
+
+    Returns:
+        Path: The path to save the VFB to.
+    """
+    path = Path(vfb_path)
+    if out_path is None:
+        return path
+
+    return Path(out_path) / path.name
+
+
+def run_batch_file(
+    vfb_path: str,
+    scripts: "Sequence[str]",
+    out_path: str | None = None,
+    lazy: bool = False,
+) -> BatchResult:
+    """
+    Open a VFB in a fresh `FakeLab` object, run the scripts on it, and save it.
+    Exceptions are not raised, but returned as part of the result.
+
+    Args:
+        vfb_path (str): The path of the VFB.
+        scripts (Sequence[str]): The paths of the Python scripts to run.
+        out_path (str | None, optional): The directory to save the VFB to. Defaults to
+            None, which means the original file is overwritten.
+        lazy (bool, optional): Whether to decode glyphs only when they are accessed.
+            Defaults to False.
+
+    Returns:
+        BatchResult: The path, the time in seconds, and the traceback or None.
+    """
+    start = perf_counter()
+    global_fl = FL.fl
+    fl = FakeLab()
+    namespace = dict(FL.environment)
+    namespace["fl"] = fl
+    # Scripts that do `from FL import fl` must see the fresh object, too
+    FL.fl = fl
+    error = None
+    try:
+        fl.Open(vfb_path, addtolist=True, lazy=lazy)
+        if fl.font is None:
+            raise ValueError(f"Could not open font: {vfb_path}")
+
+        font = fl.font
+        for script_path in scripts:
+            logger.info(f"Executing {script_path} on {vfb_path}...")
+            code = compile(Path(script_path).read_text(), script_path, "exec")
+            exec(code, namespace)
+        font.Save(str(get_batch_output_path(vfb_path, out_path)))
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        FL.fl = global_fl
+    return vfb_path, perf_counter() - start, error
+
+
+def run_batch(
+    vfb_paths: "Sequence[str]",
+    scripts: "Sequence[str]",
+    out_path: str | None = None,
+    lazy: bool = False,
+    workers: int | None = None,
+) -> list[BatchResult]:
+    """
+    Run the scripts on each VFB independently, see `run_batch_file`.
+
+    Args:
+        vfb_paths (Sequence[str]): The paths of the VFBs.
+        scripts (Sequence[str]): The paths of the Python scripts to run.
+        out_path (str | None, optional): The directory to save the VFBs to. Defaults to
+            None, which means the original files are overwritten.
+        lazy (bool, optional): Whether to decode glyphs only when they are accessed.
+            Defaults to False.
+        workers (int | None, optional): The number of worker processes. Defaults to
+            None, which means the number of CPUs. If it is 1, the files are processed
+            in the current process.
+
+    Returns:
+        list[BatchResult]: The results, in the order of `vfb_paths`.
+
+    Raises:
+        ValueError: If several VFBs would be saved to the same path, e.g. files with
+            the same name from different directories to the same `out_path`.
+    """
+    saved_paths: dict[Path, str] = {}
+    for vfb_path in vfb_paths:
+        saved_path = get_batch_output_path(vfb_path, out_path).resolve()
+        if saved_path in saved_paths:
+            raise ValueError(
+                f"{saved_paths[saved_path]} and {vfb_path} would both be saved to "
+                f"{saved_path}"
+            )
+        saved_paths[saved_path] = vfb_path
+
+    if out_path is not None:
+        Path(out_path).mkdir(parents=True, exist_ok=True)
+    n = len(vfb_paths)
+    if workers == 1 or n < 2:
+        return [run_batch_file(p, scripts, out_path, lazy) for p in vfb_paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                run_batch_file, vfb_paths, [scripts] * n, [out_path] * n, [lazy] * n
+            )
+        )
+
+
+def format_batch_report(results: "Sequence[BatchResult]") -> str:
+    """
+    Format the results of a batch run as a report with the timing of each file,
+    followed by the tracebacks of the failed files.
+
+    Args:
+        results (Sequence[BatchResult]): The results.
+
+    Returns:
+        str: The report.
+    """
+    lines = []
+    failures = []
+    for vfb_path, seconds, error in results:
+        status = "OK" if error is None else "FAILED"
+        lines.append(f"{seconds:8.2f} s  {status:<6}  {vfb_path}")
+        if error is not None:
+            failures.append((vfb_path, error))
+    total = sum(seconds for _, seconds, _ in results)
+    lines.append(
+        f"{len(results)} file(s), {len(failures)} failed, {total:.2f} s processing time"
+    )
+    for vfb_path, error in failures:
+        lines.append("")
+        lines.append(f"{vfb_path}:")
+        lines.append(error.rstrip())
+    return "\n".join(lines)
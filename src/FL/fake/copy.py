@@ -2,19 +2,105 @@ import logging
 from copy import deepcopy
 from typing import Any
 
+__doc__ = """
+Copying of FontLab objects. Glyphs are shared between a font and its copies until they
+are accessed, see `SharedGlyph`.
+"""
+
+
 logger = logging.getLogger(__name__)
 
 
 def copy_fl_object(source: Any, target: Any) -> None:
+    """
+    Copy the attributes of `source` to `target`, which must be of the same type. The
+    attributes are copied deeply, but the parent of `source` is not copied, and
+    references to `source` are replaced by references to `target`.
+
+    Args:
+        source (Any): The object to copy from.
+        target (Any): The object to copy to.
+    """
     assert isinstance(target, type(source))
-    tmp = deepcopy(source)
+    memo: dict[int, Any] = {id(source): target}
+    parent = getattr(source, "_parent", None)
+    if parent is not None:
+        # Don't copy the object graph of the parent, e.g. the whole font when copying a
+        # glyph.
+        memo[id(parent)] = None
     for attr in target.__slots__:
         if attr == "_parent":
             # Parent is not copied
             target._parent = None
         else:
             try:
-                setattr(target, attr, getattr(tmp, attr))
+                value = getattr(source, attr)
             except AttributeError:
-                logger.warning(f"Attribute not copied: {target}.{attr}")
-                pass
+                # The attribute is not set in the source. That is only a problem if the
+                # target has a different value.
+                if hasattr(target, attr):
+                    logger.warning(f"Attribute not copied: {target}.{attr}")
+                continue
+
+            setattr(target, attr, deepcopy(value, memo))
+
+
+class SharedGlyph:
+    """
+    A glyph that is shared between the glyph lists of a font and its copies. This
+    stands in for the Glyph object in the glyph list of the copy. The glyph is copied
+    when it is accessed through the copy for the first time, so copying a font doesn't
+    duplicate all glyphs up front.
+
+    When the glyph is accessed through the glyph list of the original font, it may be
+    modified. Before that happens, the shared glyph takes a private copy of it (see
+    `GlyphList`).
+    """
+
+    __slots__ = ["__weakref__", "_glyph", "name", "unicodes"]
+
+    def __init__(self, glyph: Any) -> None:
+        """
+        Share a glyph.
+
+        Args:
+            glyph (Glyph): The glyph of the original font.
+        """
+        self._glyph = glyph
+        self.name: str = glyph.name
+        self.unicodes: list[int] = list(glyph.unicodes)
+
+    def __repr__(self) -> str:
+        return f"<SharedGlyph: '{self.name}'>"
+
+    def __copy__(self) -> "SharedGlyph":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "SharedGlyph":
+        return self
+
+    @property
+    def glyph(self) -> Any:
+        """
+        The shared glyph. It must not be modified.
+
+        Returns:
+            Glyph: The glyph.
+        """
+        return self._glyph
+
+    def fake_detach(self) -> None:
+        """
+        Take a private copy of the glyph, so the original glyph may be modified.
+        """
+        self._glyph = type(self._glyph)(self._glyph)
+
+    def fake_load(self) -> Any:
+        """
+        Return a copy of the glyph.
+
+        Returns:
+            Glyph: The glyph.
+        """
+        logger.debug(f"Copying shared glyph: '{self.name}'")
+        return type(self._glyph)(self._glyph)
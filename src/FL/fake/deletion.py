@@ -0,0 +1,71 @@
+import logging
+
+__doc__ = """
+Bookkeeping for deleting glyphs from a font.
+
+Components and kerning pairs reference glyphs by index, so deleting glyphs means the
+references in the remaining glyphs must be updated. `Font.fake_delete_glyphs()` records
+the deletions in a `PendingDeletions` object, from which the new glyph indices are
+derived when the references are updated. Inside a `Font.fake_defer_reindex()` block,
+the deletions are collected and the references are updated only once at the end.
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+class PendingDeletions:
+    """
+    The glyphs that have been deleted from a font since the glyph references were last
+    updated.
+    """
+
+    __slots__ = ["gids", "names", "num_glyphs"]
+
+    def __init__(self, num_glyphs: int) -> None:
+        """
+        Start recording deletions.
+
+        Args:
+            num_glyphs (int): The number of glyphs in the font before the deletions.
+        """
+        self.num_glyphs = num_glyphs
+        # The original index of each remaining glyph, by current index
+        self.gids = list(range(num_glyphs))
+        # The names of the deleted glyphs, by original index
+        self.names: dict[int, str] = {}
+
+    def __repr__(self) -> str:
+        return f"<PendingDeletions: {len(self.names)} of {self.num_glyphs} glyphs>"
+
+    def delete(self, index: int, name: str) -> None:
+        """
+        Record the deletion of a glyph.
+
+        Args:
+            index (int): The current index of the glyph.
+            name (str): The glyph name.
+        """
+        self.names[self.gids.pop(index)] = name
+
+    def get_first_changed(self) -> int:
+        """
+        Return the first original glyph index that is no longer valid. The indices
+        before it are unchanged.
+
+        Returns:
+            int: The index, or -1 if no glyphs have been deleted.
+        """
+        return min(self.names, default=-1)
+
+    def get_gid_map(self) -> list[int]:
+        """
+        Return the new index of each glyph.
+
+        Returns:
+            list[int]: The new index by original index, -1 for deleted glyphs.
+        """
+        gid_map = [-1] * self.num_glyphs
+        for new_gid, gid in enumerate(self.gids):
+            gid_map[gid] = new_gid
+        return gid_map
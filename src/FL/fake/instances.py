@@ -0,0 +1,169 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from vfbLib.vfb.vfb import Vfb
+
+from FL.objects.Font import Font
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from FL.fake.Font import FakeFont
+
+
+__doc__ = """
+Generate the instances of an MM font in a pool of worker processes.
+
+The MM font is sent to each worker once in VFB format, which is much more compact than
+a pickled Font object. Each worker reads it back and then interpolates the instances it
+is given.
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+# The MM font of the current worker process
+_master: Font | None = None
+
+
+def font_to_bytes(font: "FakeFont") -> bytes:
+    """
+    Serialize a font to VFB data.
+
+    Args:
+        font (FakeFont): The font.
+
+    Returns:
+        bytes: The VFB data.
+    """
+    from FL.vfb.writer import FontToVfbWriter
+
+    buffer = BytesIO()
+    FontToVfbWriter(font).vfb.write_bytes(buffer)
+    return buffer.getvalue()
+
+
+def font_from_bytes(data: bytes, file_name: str | None = None) -> Font:
+    """
+    Build a font from VFB data.
+
+    Args:
+        data (bytes): The VFB data.
+        file_name (str | None, optional): The file name to assign to the font. Defaults
+            to None.
+
+    Returns:
+        Font: The font.
+    """
+    vfb = Vfb(timing=False)
+    vfb.read_bytes(BytesIO(data))
+    font = Font()
+    font.fake_open_from_vfblib(vfb)
+    font._set_file_name(file_name)
+    return font
+
+
+def get_instance_file_name(instance: Font) -> str:
+    """
+    Return the file name under which an instance is saved, e.g.
+    `TwoAxis-Cd2ExtraLight.vfb`.
+
+    Args:
+        instance (Font): The instance font.
+
+    Returns:
+        str: The file name.
+    """
+    return f"{instance.family_name}-{instance.style_name.replace(' ', '')}.vfb"
+
+
+def _init_worker(data: bytes, file_name: str | None) -> None:
+    global _master
+    _master = font_from_bytes(data, file_name)
+
+
+def _interpolate(inst_dict: dict[str, Any]) -> Font:
+    assert _master is not None
+    logger.info(inst_dict)
+    return _master.ip(inst_dict["values"], style_name=inst_dict["name"])
+
+
+def _generate_instance(inst_dict: dict[str, Any]) -> bytes:
+    return font_to_bytes(_interpolate(inst_dict))
+
+
+def _save_instance(inst_dict: dict[str, Any], out_path: Path, save_json: bool) -> Path:
+    instance = _interpolate(inst_dict)
+    file_path = out_path / get_instance_file_name(instance)
+    instance.Save(str(file_path), save_json=save_json)
+    return file_path
+
+
+def _get_executor(font: "FakeFont", workers: int | None) -> ProcessPoolExecutor:
+    file_name = None if font.file_name is None else str(font.file_name)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(font_to_bytes(font), file_name),
+    )
+
+
+def generate_instances(
+    font: "FakeFont",
+    instances: "Sequence[dict[str, Any]]",
+    workers: int | None = None,
+) -> list[Font]:
+    """
+    Interpolate instances of an MM font in parallel.
+
+    Args:
+        font (FakeFont): The MM font.
+        instances (Sequence[dict[str, Any]]): The instances, in the format of
+            `Font._primary_instances`.
+        workers (int | None, optional): The number of worker processes. Defaults to
+            None, which means the number of CPUs.
+
+    Returns:
+        list[Font]: The instance fonts, in the order of `instances`.
+    """
+    file_name = None if font.file_name is None else str(font.file_name)
+    with _get_executor(font, workers) as executor:
+        return [
+            font_from_bytes(data, file_name)
+            for data in executor.map(_generate_instance, instances)
+        ]
+
+
+def save_instances(
+    font: "FakeFont",
+    instances: "Sequence[dict[str, Any]]",
+    out_path: Path,
+    workers: int | None = None,
+    save_json: bool = False,
+) -> list[Path]:
+    """
+    Interpolate instances of an MM font in parallel and save them as VFB files. The
+    instances are saved by the worker processes, so they don't need to be sent back.
+
+    Args:
+        font (FakeFont): The MM font.
+        instances (Sequence[dict[str, Any]]): The instances, in the format of
+            `Font._primary_instances`.
+        out_path (Path): The directory in which to save the instances.
+        workers (int | None, optional): The number of worker processes. Defaults to
+            None, which means the number of CPUs.
+        save_json (bool, optional): Whether to save a JSON file next to each VFB.
+            Defaults to False.
+
+    Returns:
+        list[Path]: The paths of the saved VFB files, in the order of `instances`.
+    """
+    n = len(instances)
+    with _get_executor(font, workers) as executor:
+        return list(
+            executor.map(_save_instance, instances, [out_path] * n, [save_json] * n)
+        )
@@ -0,0 +1,295 @@
+import logging
+from math import cos, pi, sin
+from pathlib import Path
+from random import Random
+from typing import Any
+
+from vfbLib.enum import G
+
+from FL.objects.Font import Font
+from FL.objects.Glyph import Glyph
+
+__doc__ = """
+Build synthetic fonts of configurable size for load testing.
+
+The fonts in `tests/data` are small, which hides scaling problems. `make_synthetic_font()`
+builds a `Font` with the requested number of glyphs, nodes, axes, components, kerning
+pairs and classes, and hints. The output only depends on the arguments, so the same
+arguments always produce the same font. `save_synthetic_font()` writes such a font to a
+VFB file via `FontToVfbWriter`.
+
+The glyph data is built in the format of the decompiled VFB entries and added with
+`Glyph.fake_deserialize()`, like the VFB reader does.
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+# The axes that are added to the font, in this order
+AXES = (
+    ("Weight", "Weight", "Wt"),
+    ("Width", "Width", "Wd"),
+    ("Optical Size", "OpticalSize", "Op"),
+    ("Serif", "Serif", "Se"),
+)
+
+# The maximum number of nodes in one contour
+MAX_CONTOUR_NODES = 16
+
+# The first code point that is assigned to the glyphs (Private Use Area)
+FIRST_CODE_POINT = 0xE000
+LAST_CODE_POINT = 0xF8FF
+
+GLYPH_WIDTH = 600
+
+
+def get_glyph_name(index: int) -> str:
+    """
+    Return the name of a synthetic glyph.
+
+    Args:
+        index (int): The glyph index.
+
+    Returns:
+        str: The glyph name.
+    """
+    return f"glyph{index:05d}"
+
+
+def make_synthetic_font(
+    num_glyphs: int = 1000,
+    nodes_per_glyph: int = 24,
+    num_axes: int = 0,
+    num_composites: int = 0,
+    num_kerning_pairs: int = 0,
+    num_kerning_classes: int = 0,
+    hints_per_glyph: int = 0,
+    seed: int = 0,
+) -> Font:
+    """
+    Build a synthetic font.
+
+    Args:
+        num_glyphs (int, optional): The number of glyphs, including the composites.
+            Defaults to 1000.
+        nodes_per_glyph (int, optional): The number of nodes in each glyph that is not
+            a composite. Defaults to 24.
+        num_axes (int, optional): The number of MM axes, 0 to 4. The font has
+            `2 ** num_axes` masters. Defaults to 0.
+        num_composites (int, optional): The number of glyphs at the end of the font
+            that consist of two components instead of nodes. Defaults to 0.
+        num_kerning_pairs (int, optional): The number of kerning pairs. Defaults to 0.
+        num_kerning_classes (int, optional): The number of kerning classes. Half of
+            them are left, the other half right classes. Defaults to 0.
+        hints_per_glyph (int, optional): The number of horizontal and of vertical
+            hints in each glyph that is not a composite. Defaults to 0.
+        seed (int, optional): The seed for the random coordinates and values. Defaults
+            to 0.
+
+    Returns:
+        Font: The font.
+    """
+    if not 0 <= num_axes <= len(AXES):
+        raise ValueError(f"The number of axes must be 0 to {len(AXES)}: {num_axes}")
+
+    if not 0 <= num_composites < num_glyphs:
+        raise ValueError(
+            f"The number of composites must be less than the number of glyphs: "
+            f"{num_composites}"
+        )
+
+    rng = Random(seed)
+    font = Font()
+    font.family_name = "Synthetic"
+    font.style_name = "Regular"
+    font.font_name = "Synthetic-Regular"
+    font.full_name = "Synthetic Regular"
+    for name, axis_type, short_name in AXES[:num_axes]:
+        font.DefineAxis(name, axis_type, short_name)
+    num_masters = font._masters_count
+    if num_axes:
+        # An instance in the middle of the design space
+        values = [500.0] * num_axes
+        font._primary_instance_locations = list(values)
+        font._primary_instances = [
+            {"name": "Middle", "values": tuple(values + [0.0] * (4 - num_axes))}
+        ]
+
+    num_simple = num_glyphs - num_composites
+    classes, flags, kerning = _make_kerning(
+        rng, num_simple, num_kerning_pairs, num_kerning_classes, num_masters
+    )
+    for index in range(num_glyphs):
+        glyph = Glyph()
+        if index < num_simple:
+            data = _make_simple_glyph(
+                rng, nodes_per_glyph, hints_per_glyph, num_masters
+            )
+        else:
+            data = _make_composite_glyph(rng, num_simple, num_masters)
+        data["name"] = get_glyph_name(index)
+        if index in kerning:
+            data["kerning"] = kerning[index]
+        glyph.fake_deserialize(G.Glyph, data)
+        code_point = FIRST_CODE_POINT + index
+        if code_point <= LAST_CODE_POINT:
+            glyph.fake_deserialize(G.unicodes, [code_point])
+        font.glyphs.append(glyph)
+
+    font.classes = classes
+    font.fake_set_class_flags(flags)
+    return font
+
+
+def save_synthetic_font(vfb_path: str | Path, **kwargs: Any) -> Font:
+    """
+    Build a synthetic font and save it as VFB.
+
+    Args:
+        vfb_path (str | Path): The path to save the VFB to.
+        **kwargs: The arguments for `make_synthetic_font()`.
+
+    Returns:
+        Font: The font.
+    """
+    from FL.vfb.writer import FontToVfbWriter
+
+    font = make_synthetic_font(**kwargs)
+    FontToVfbWriter(font).write(Path(vfb_path))
+    return font
+
+
+def _vary(rng: Random, x: int, y: int, num_masters: int) -> list[tuple[int, int]]:
+    # Return the coordinates of a point in each master. Each master is a bit bolder
+    # than the previous one.
+    dx = rng.randint(-20, 20)
+    dy = rng.randint(-20, 20)
+    return [(x + m * dx, y + m * dy) for m in range(num_masters)]
+
+
+def _make_simple_glyph(
+    rng: Random, num_nodes: int, num_hints: int, num_masters: int
+) -> dict[str, Any]:
+    nodes = []
+    remaining = num_nodes
+    while remaining > 0:
+        # A roughly circular contour, each node is either a line or a curve
+        n = min(remaining, MAX_CONTOUR_NODES)
+        remaining -= n
+        cx = rng.randint(100, GLYPH_WIDTH - 100)
+        cy = rng.randint(100, 600)
+        radius = rng.randint(50, 300)
+        for i in range(n):
+            angle = 2 * pi * i / n
+            x = int(cx + radius * cos(angle))
+            y = int(cy + radius * sin(angle))
+            if i == 0:
+                node_type = "move"
+            else:
+                node_type = rng.choice(("line", "curve"))
+            points = [_vary(rng, x, y, num_masters)]
+            if node_type == "curve":
+                # The off-curve points
+                for _ in range(2):
+                    points.append(
+                        _vary(
+                            rng,
+                            x + rng.randint(-50, 50),
+                            y + rng.randint(-50, 50),
+                            num_masters,
+                        )
+                    )
+            nodes.append(
+                {
+                    "type": node_type,
+                    "flags": 0,
+                    # By master, then by point
+                    "points": [list(master) for master in zip(*points)],
+                }
+            )
+    hints: dict[str, list[list[dict[str, int]]]] = {"h": [], "v": []}
+    for direction, limit in (("h", 700), ("v", GLYPH_WIDTH)):
+        for _ in range(num_hints):
+            pos = rng.randint(0, limit)
+            width = rng.randint(20, 100)
+            hints[direction].append(
+                [{"pos": pos, "width": width + 5 * m} for m in range(num_masters)]
+            )
+    return {
+        "num_masters": num_masters,
+        "metrics": [(GLYPH_WIDTH + 10 * m, 0) for m in range(num_masters)],
+        "hints": hints,
+        "nodes": nodes,
+    }
+
+
+def _make_composite_glyph(
+    rng: Random, num_simple: int, num_masters: int
+) -> dict[str, Any]:
+    components = []
+    for _ in range(2):
+        dx = rng.randint(-100, 100)
+        dy = rng.randint(0, 200)
+        components.append(
+            {
+                "gid": rng.randrange(num_simple),
+                "offsetX": [dx + 5 * m for m in range(num_masters)],
+                "offsetY": [dy] * num_masters,
+                "scaleX": [1.0] * num_masters,
+                "scaleY": [1.0] * num_masters,
+            }
+        )
+    return {
+        "num_masters": num_masters,
+        "metrics": [(GLYPH_WIDTH + 10 * m, 0) for m in range(num_masters)],
+        "components": components,
+        "nodes": [],
+    }
+
+
+def _make_kerning(
+    rng: Random, num_simple: int, num_pairs: int, num_classes: int, num_masters: int
+) -> tuple[list[str], list[str], dict[int, dict[int, list[int]]]]:
+    # Return the classes, their flags, and the kerning values by left and right glyph
+    # index. Each class has a block of simple glyphs as members, the first one is the
+    # key glyph. The left classes use the first half of the glyphs, the right classes
+    # the second half.
+    num_classes = min(num_classes, num_simple // 2)
+    classes: list[str] = []
+    flags: list[str] = []
+    keys: dict[str, list[int]] = {"L": [], "R": []}
+    for side, count in (("L", (num_classes + 1) // 2), ("R", num_classes // 2)):
+        if not count:
+            continue
+
+        start = 0 if side == "L" else num_simple // 2
+        size = max(1, (num_simple // 2) // count)
+        for i in range(count):
+            first = start + i * size
+            members = [get_glyph_name(first) + "'"]
+            members.extend(get_glyph_name(j) for j in range(first + 1, first + size))
+            classes.append(f"_{side.lower()}{i:04d}: {' '.join(members)}")
+            flags.append(side)
+            keys[side].append(first)
+
+    # Class pairs first, then random glyph pairs
+    pairs: dict[tuple[int, int], None] = {}
+    for left in keys["L"]:
+        for right in keys["R"]:
+            if len(pairs) >= num_pairs:
+                break
+
+            pairs[left, right] = None
+    # Don't loop forever if there are more pairs than possible combinations
+    max_pairs = min(num_pairs, num_simple * num_simple)
+    while len(pairs) < max_pairs:
+        pairs[rng.randrange(num_simple), rng.randrange(num_simple)] = None
+
+    kerning: dict[int, dict[int, list[int]]] = {}
+    for left, right in pairs:
+        value = rng.randint(-100, 50)
+        kerning.setdefault(left, {})[right] = [
+            value - 2 * m for m in range(num_masters)
+        ]
+    return classes, flags, kerning
@@ -1,6 +1,9 @@
 from collections import UserList
-from copy import copy
-from typing import Any, Iterable, SupportsIndex, TypeVar
+from copy import copy, deepcopy
+from typing import Any, Iterable, Iterator, SupportsIndex, TypeVar
+from weakref import WeakValueDictionary
+
+from FL.fake.copy import SharedGlyph
 
 T = TypeVar("T")
 
@@ -99,9 +102,303 @@ class DirectionalList(ListParent[T]):
         item._stem_direction = self._stem_direction
 
 
+class OutlineList(ListParent[T]):
+    # Glyph.nodes and the point lists of nodes
+
+    # Changing the list may change the bounding box of the glyph, so the parent is told
+    # to discard its cached bounding box.
+
+    def _item_callback(self, item: Any) -> None:
+        super()._item_callback(item)
+        # Points report their changes to the node even after they lost their parent
+        if hasattr(item, "_fake_node"):
+            item._fake_node = self._parent
+
+    def _fake_changed(self) -> None:
+        if self._parent is not None:
+            self._parent.fake_invalidate_bounds()
+
+    def __setitem__(
+        self, index: "SupportsIndex | slice[Any, Any, Any]", item: Any
+    ) -> None:
+        super().__setitem__(index, item)
+        self._fake_changed()
+
+    def __delitem__(self, i: "SupportsIndex | slice[Any, Any, Any]") -> None:
+        super().__delitem__(i)
+        self._fake_changed()
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._fake_changed()
+
+    def insert(self, i: int, item: Any) -> None:
+        super().insert(i, item)
+        self._fake_changed()
+
+    def pop(self, i: int = -1) -> Any:
+        item = super().pop(i)
+        self._fake_changed()
+        return item
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._fake_changed()
+
+    def clean(self) -> None:
+        super().clean()
+        self._fake_changed()
+
+
 class GlyphList(ListParent[T]):
     # Font.glyphs
 
+    # When a font was opened lazily, the list data contains placeholder objects for
+    # glyphs that haven't been accessed yet. They are replaced by the real glyph on
+    # first access through their fake_load() method.
+
+    # The list keeps an index of glyph names and Unicodes to the first glyph index
+    # using them, so glyph lookups don't need to scan the list. The index is built on
+    # first use and updated when glyphs are appended, renamed, or get new Unicodes.
+    # Other changes of the list discard it, and it is rebuilt on the next lookup.
+
+    # When the font is copied, the copy gets SharedGlyph placeholders for the glyphs.
+    # The list keeps track of them, and makes them take a private copy of a glyph
+    # before the glyph is handed out from this list, because it may be modified then.
+
+    # When the font was read from a VFB file, the list remembers the index of each
+    # glyph in the file until the glyph is handed out, so unmodified glyphs can be
+    # copied from the file when the font is saved incrementally.
+
+    # Glyph deletions may be pending while the font defers updating the glyph
+    # references (see `Font.fake_defer_reindex()`). They are applied before the list
+    # is changed otherwise.
+
+    def __init__(
+        self,
+        iterable: Iterable[T] = [],
+        parent: Any | None = None,
+        only_type: Any = None,
+    ) -> None:
+        self.fake_invalidate_index()
+        self._fake_shared: WeakValueDictionary[int, SharedGlyph] = WeakValueDictionary()
+        self._fake_sources: dict[int, tuple[Any, int]] = {}
+        super().__init__(iterable, parent, only_type)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "GlyphList[T]":
+        # Share the glyphs with the copy instead of copying them
+        result: GlyphList[T] = GlyphList(only_type=self._type)
+        memo[id(self)] = result
+        result._parent = deepcopy(self._parent, memo)
+        result.data = [self._fake_share(item) for item in self.data]
+        return result
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The weak references to shared glyphs can't be pickled
+        state = self.__dict__.copy()
+        del state["_fake_shared"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._fake_shared = WeakValueDictionary()
+        # The ids of the items have changed
+        self._fake_sources = {
+            id(item): (item, n) for item, n in self._fake_sources.values()
+        }
+
+    def _fake_share(self, item: Any) -> Any:
+        if hasattr(item, "fake_load"):
+            # Deferred and shared glyphs are not modified, they can be shared as is
+            return item
+
+        shared = self._fake_shared.get(id(item))
+        if shared is None:
+            shared = SharedGlyph(item)
+            self._fake_shared[id(item)] = shared
+        return shared
+
+    def _fake_hand_out(self, item: Any) -> None:
+        # The glyph is about to be handed out, so it may be modified
+        self._fake_unshare(item)
+        if self._fake_sources:
+            self._fake_sources.pop(id(item), None)
+
+    def _fake_unshare(self, item: Any) -> None:
+        # Let any copies take a private copy of the glyph first
+        if self._fake_shared:
+            shared = self._fake_shared.pop(id(item), None)
+            if shared is not None:
+                shared.fake_detach()
+
+    def __getitem__(self, i: "SupportsIndex | slice[Any, Any, Any]") -> Any:
+        if isinstance(i, slice):
+            for index in range(*i.indices(len(self.data))):
+                self._fake_hand_out(self._fake_load(index))
+            return super().__getitem__(i)
+
+        item = self.data[i]
+        if not hasattr(item, "fake_load"):
+            self._fake_hand_out(item)
+            return item
+
+        return self._fake_load(i)
+
+    def _fake_load(self, i: SupportsIndex) -> Any:
+        item = self.data[i]
+        if not hasattr(item, "fake_load"):
+            return item
+
+        if self._fake_sources:
+            self._fake_sources.pop(id(item), None)
+        item = item.fake_load()
+        self.data[i] = item
+        self._item_callback(item)
+        return item
+
+    def __setitem__(
+        self, index: "SupportsIndex | slice[Any, Any, Any]", item: Any
+    ) -> None:
+        self._fake_before_change()
+        super().__setitem__(index, item)
+        self.fake_invalidate_index()
+        self._fake_changed()
+
+    def append(self, item: Any) -> None:
+        self._fake_before_change()
+        super().append(item)
+        if self._fake_names is not None:
+            self._fake_index_glyph(len(self.data) - 1, item)
+        self._fake_changed()
+
+    def insert(self, i: int, item: Any) -> None:
+        self._fake_before_change()
+        super().insert(i, item)
+        self.fake_invalidate_index()
+        self._fake_changed()
+
+    def pop(self, i: int = -1) -> Any:
+        self._fake_before_change()
+        self._fake_hand_out(self._fake_load(i))
+        item = super().pop(i)
+        self.fake_invalidate_index()
+        self._fake_changed()
+        return item
+
+    def remove(self, item: Any) -> None:
+        self._fake_before_change()
+        super().remove(item)
+        self.fake_invalidate_index()
+        self._fake_changed()
+
+    def reverse(self) -> None:
+        self._fake_before_change()
+        super().reverse()
+        self.fake_invalidate_index()
+
+    def sort(self, /, *args: Any, **kwds: Any) -> None:
+        self._fake_before_change()
+        super().sort(*args, **kwds)
+        self.fake_invalidate_index()
+
+    def clean(self) -> None:
+        self._fake_before_change()
+        super().clean()
+        self.fake_invalidate_index()
+        self._fake_changed()
+
+    def _fake_before_change(self) -> None:
+        # Update the glyph references for pending deletions while the indices are
+        # still valid
+        if self._parent is not None:
+            self._parent.fake_reindex_glyphs()
+
+    def _fake_changed(self) -> None:
+        # Glyphs were added or removed, discard the cached bounding box of the font
+        if self._parent is not None:
+            self._parent.fake_invalidate_bounds()
+
+    def fake_peek(self, i: SupportsIndex) -> Any:
+        """
+        Return the glyph at index `i` for reading. Unlike normal list access, the glyph
+        is not considered modified afterwards, and copies of the font don't take a
+        private copy of it. The glyph must not be modified.
+
+        Args:
+            i (SupportsIndex): The glyph index.
+
+        Returns:
+            Glyph: The glyph.
+        """
+        item = self.data[i]
+        if isinstance(item, SharedGlyph):
+            return item.glyph
+
+        if not hasattr(item, "fake_load"):
+            return item
+
+        # Load the deferred glyph, but keep its index in the VFB file
+        source = self._fake_sources.get(id(item))
+        glyph = self._fake_load(i)
+        if source is not None and source[0] is item:
+            self.fake_set_source_index(glyph, source[1])
+        return glyph
+
+    def fake_iter_peek(self) -> Iterator[Any]:
+        """
+        Iterate over the glyphs for reading, see `fake_peek()`.
+
+        Yields:
+            Iterator[Glyph]: The glyphs.
+        """
+        for i in range(len(self.data)):
+            yield self.fake_peek(i)
+
+    def fake_is_loaded(self, i: SupportsIndex) -> bool:
+        """
+        Return whether the glyph at index `i` has been built already.
+
+        Args:
+            i (SupportsIndex): The glyph index.
+
+        Returns:
+            bool: False if the glyph is still deferred.
+        """
+        return not hasattr(self.data[i], "fake_load")
+
+    def fake_get_source_index(self, item: Any) -> int:
+        """
+        Return the index of a glyph in the VFB file the font was read from, if the
+        glyph has not been handed out since, see `FL.vfb.incremental`.
+
+        Args:
+            item (Any): The item in the list data.
+
+        Returns:
+            int: The index, or -1 if the glyph may have been modified.
+        """
+        source = self._fake_sources.get(id(item))
+        if source is None or source[0] is not item:
+            return -1
+
+        return source[1]
+
+    def fake_set_source_index(self, item: Any, n: int) -> None:
+        """
+        Set the index of a glyph in the VFB file the font was read from.
+
+        Args:
+            item (Any): The item in the list data.
+            n (int): The glyph index in the file.
+        """
+        self._fake_sources[id(item)] = (item, n)
+
+    def fake_clear_source_indices(self) -> None:
+        """
+        Forget the indices of all glyphs in the VFB file the font was read from.
+        """
+        self._fake_sources = {}
+
     def __delitem__(self, i: "SupportsIndex | slice[Any, Any, Any]") -> None:
         # We can delete glyphs from the font through this. Glyph indices need to be
         # updated afterwards, which this method takes care of.
@@ -110,3 +407,153 @@ class GlyphList(ListParent[T]):
 
         # Let the parent (Font) handle this:
         self._parent.fake_delete_glyphs(i)
+
+    # Glyph index
+
+    def fake_invalidate_index(self) -> None:
+        """
+        Discard the index of glyph names and Unicodes. It will be rebuilt on the next
+        lookup. Call this after modifying the list data directly.
+        """
+        self._fake_names: dict[str, int] | None = None
+        self._fake_unicodes: dict[int, int] | None = None
+        # Names and Unicodes which are used by more than one glyph
+        self._fake_duplicate_names: set[str] = set()
+        self._fake_duplicate_unicodes: set[int] = set()
+        self._fake_indexed_length = 0
+
+    def _fake_build_index(self) -> None:
+        self._fake_names = {}
+        self._fake_unicodes = {}
+        self._fake_duplicate_names = set()
+        self._fake_duplicate_unicodes = set()
+        self._fake_indexed_length = 0
+        for i, item in enumerate(self.data):
+            self._fake_index_glyph(i, item)
+
+    def _fake_index_glyph(self, i: int, item: Any) -> None:
+        # Add the glyph at the end of the list to the index
+        assert self._fake_names is not None
+        assert self._fake_unicodes is not None
+        if item.name in self._fake_names:
+            self._fake_duplicate_names.add(item.name)
+        else:
+            self._fake_names[item.name] = i
+        for u in item.unicodes:
+            if u in self._fake_unicodes:
+                self._fake_duplicate_unicodes.add(u)
+            else:
+                self._fake_unicodes[u] = i
+        self._fake_indexed_length = i + 1
+
+    def _fake_ensure_index(self) -> None:
+        # Rebuild the index if it has been discarded, or the list data has been
+        # modified directly
+        if self._fake_names is None or self._fake_indexed_length != len(self.data):
+            self._fake_build_index()
+
+    def fake_find_name(self, name: str) -> int:
+        """
+        Return the index of the first glyph with the name `name`.
+
+        Args:
+            name (str): The glyph name.
+
+        Returns:
+            int: The glyph index, or -1 if no glyph has the name.
+        """
+        self._fake_ensure_index()
+        assert self._fake_names is not None
+        i = self._fake_names.get(name, -1)
+        if i > -1 and self.data[i].name != name:
+            # The index is outdated
+            self._fake_build_index()
+            i = self._fake_names.get(name, -1)
+        return i
+
+    def fake_find_unicode(self, unicode: int) -> int:
+        """
+        Return the index of the first glyph with the Unicode `unicode`.
+
+        Args:
+            unicode (int): The Unicode codepoint.
+
+        Returns:
+            int: The glyph index, or -1 if no glyph has the Unicode.
+        """
+        self._fake_ensure_index()
+        assert self._fake_unicodes is not None
+        i = self._fake_unicodes.get(unicode, -1)
+        if i > -1 and unicode not in self.data[i].unicodes:
+            # The index is outdated
+            self._fake_build_index()
+            i = self._fake_unicodes.get(unicode, -1)
+        return i
+
+    def _fake_find_item(self, item: Any) -> int:
+        # Return the index of the glyph if it can be found through the index
+        if self._fake_names is None or item.name in self._fake_duplicate_names:
+            return -1
+
+        i = self._fake_names.get(item.name, -1)
+        if i > -1 and self.data[i] is not item:
+            return -1
+
+        return i
+
+    def fake_glyph_renamed(self, item: Any, old_name: str) -> None:
+        """
+        Update the index after a glyph in the list has been renamed. Is called from the
+        `Glyph.name` setter.
+
+        Args:
+            item (Glyph): The glyph, which already has the new name.
+            old_name (str): The previous glyph name.
+        """
+        if self._fake_names is None:
+            return
+
+        i = self._fake_names.get(old_name, -1)
+        if (
+            i == -1
+            or old_name in self._fake_duplicate_names
+            or self.data[i] is not item
+        ):
+            self.fake_invalidate_index()
+            return
+
+        del self._fake_names[old_name]
+        j = self._fake_names.get(item.name, -1)
+        if j == -1:
+            self._fake_names[item.name] = i
+        else:
+            self._fake_duplicate_names.add(item.name)
+            self._fake_names[item.name] = min(i, j)
+
+    def fake_glyph_unicodes_changed(self, item: Any, old_unicodes: list[int]) -> None:
+        """
+        Update the index after the Unicodes of a glyph in the list have been changed.
+        Is called from the `Glyph.unicode` and `Glyph.unicodes` setters.
+
+        Args:
+            item (Glyph): The glyph, which already has the new Unicodes.
+            old_unicodes (list[int]): The previous Unicodes of the glyph.
+        """
+        if self._fake_unicodes is None:
+            return
+
+        i = self._fake_find_item(item)
+        if i == -1 or self._fake_duplicate_unicodes.intersection(old_unicodes):
+            self.fake_invalidate_index()
+            return
+
+        for u in old_unicodes:
+            if self._fake_unicodes.get(u) == i:
+                del self._fake_unicodes[u]
+        for u in item.unicodes:
+            j = self._fake_unicodes.get(u, -1)
+            if j == -1:
+                self._fake_unicodes[u] = i
+            elif j != i:
+                self._fake_duplicate_unicodes.add(u)
+                self._fake_unicodes[u] = min(i, j)
@@ -0,0 +1,136 @@
+from math import sqrt
+from typing import TYPE_CHECKING
+
+from FL.constants import nCURVE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from FL.objects.Node import Node
+
+
+__doc__ = """
+Calculation of the bounding boxes of glyph outlines.
+"""
+
+
+# A bounding box as x0, y0, x1, y1
+Bounds = tuple[float, float, float, float]
+
+# The bounding box of an empty outline. Like in FontLab, the corners are swapped, so the
+# box can be extended by comparing with any point.
+EMPTY_BOUNDS: Bounds = (32767.0, 32767.0, -32767.0, -32767.0)
+
+
+def get_cubic_extrema(p0: float, p1: float, p2: float, p3: float) -> list[float]:
+    """
+    Return the values of a cubic Bézier curve in one dimension at the parameters where
+    the curve has a local minimum or maximum, not counting the start and end point.
+
+    Args:
+        p0 (float): The start point.
+        p1 (float): The first control point.
+        p2 (float): The second control point.
+        p3 (float): The end point.
+
+    Returns:
+        list[float]: The values, which may be empty.
+    """
+    # The derivative divided by 3 is a * t ** 2 + b * t + c
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+    if a == 0:
+        if b == 0:
+            return []
+
+        ts = [-c / b]
+    else:
+        discriminant = b * b - 4 * a * c
+        if discriminant < 0:
+            return []
+
+        root = sqrt(discriminant)
+        ts = [(-b + root) / (2 * a), (-b - root) / (2 * a)]
+
+    values = []
+    for t in ts:
+        if 0 < t < 1:
+            mt = 1 - t
+            values.append(
+                mt * mt * mt * p0
+                + 3 * mt * mt * t * p1
+                + 3 * mt * t * t * p2
+                + t * t * t * p3
+            )
+    return values
+
+
+def get_outline_bounds(
+    nodes: "Iterable[Node]", num_masters: int, extrema: bool = False
+) -> list[Bounds]:
+    """
+    Return the bounding boxes of all masters of an outline in one pass over the nodes.
+
+    Args:
+        nodes (Iterable[Node]): The nodes of the outline.
+        num_masters (int): The number of masters.
+        extrema (bool, optional): Whether to calculate the bounds of the curves from
+            their extrema. If False, the control points are included in the bounds,
+            like in `Glyph.GetBoundingRect()`. Defaults to False.
+
+    Returns:
+        list[Bounds]: The bounding box of each master. Masters without points have
+            `EMPTY_BOUNDS`.
+    """
+    xs: list[list[float]] = [[] for _ in range(num_masters)]
+    ys: list[list[float]] = [[] for _ in range(num_masters)]
+    # The last on-curve point in each master, where the next curve starts
+    last: list[Sequence[float]] = [()] * num_masters
+    for node in nodes:
+        is_curve = extrema and node.type & ~0x8000 == nCURVE
+        for m, c in enumerate(_iter_master_coords(node, num_masters)):
+            if not is_curve or len(c) < 6 or not last[m]:
+                xs[m].extend(c[::2])
+                ys[m].extend(c[1::2])
+            else:
+                # The curve segment from the last on-curve point to the end point at
+                # index 0, through the control points at index 1 and 2
+                x0, y0 = last[m][:2]
+                x3, y3 = c[0], c[1]
+                xs[m].append(x3)
+                ys[m].append(y3)
+                for values, p0, p1, p2, p3 in (
+                    (xs[m], x0, c[2], c[4], x3),
+                    (ys[m], y0, c[3], c[5], y3),
+                ):
+                    lo, hi = (p0, p3) if p0 < p3 else (p3, p0)
+                    if not (lo <= p1 <= hi and lo <= p2 <= hi):
+                        values.extend(get_cubic_extrema(p0, p1, p2, p3))
+            last[m] = c
+    return [_get_bounds(mx, my) for mx, my in zip(xs, ys)]
+
+
+def _iter_master_coords(node: "Node", num_masters: int) -> "Iterator[Sequence[float]]":
+    # Yield the point coordinates of each master of a node as x, y, x, y, ...
+    coords = node._fake_coords
+    if coords is None:
+        for points in node._points[:num_masters]:
+            yield [v for p in points for v in (p.x, p.y)]
+        return
+
+    n = 2 * node._fake_points_count
+    for start in range(0, min(len(coords), n * num_masters), n):
+        yield coords[start : start + n]
+
+
+def _get_bounds(xs: list[float], ys: list[float]) -> Bounds:
+    if not xs:
+        return EMPTY_BOUNDS
+
+    return (
+        min(EMPTY_BOUNDS[0], min(xs)),
+        min(EMPTY_BOUNDS[1], min(ys)),
+        max(EMPTY_BOUNDS[2], max(xs)),
+        max(EMPTY_BOUNDS[3], max(ys)),
+    )
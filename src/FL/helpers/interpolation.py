@@ -1,9 +1,12 @@
+from array import array
 from decimal import ROUND_HALF_UP, Decimal, DefaultContext, setcontext
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from FL.objects.Point import Point
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from FL.objects.Font import Font
 
 DefaultContext.rounding = ROUND_HALF_UP
@@ -303,6 +306,228 @@ def remove_axis_from_master_point_list(
         round_master_point_list(seq)
 
 
+def reduce_values(values: list[float], factors: "Sequence[float]") -> list[float]:
+    """
+    Interpolate a list of values per master for several axes at once. The axes are
+    removed from the last to the first, like repeated calls of `remove_axis_from_list`
+    would do, so the results are identical.
+
+    Args:
+        values (list[float]): The values per master. The length must be divisible by
+            2 ** len(factors).
+        factors (Sequence[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+
+    Returns:
+        list[float]: The values for the remaining masters.
+    """
+    for factor in factors:
+        half = len(values) // 2
+        values = [
+            v0 + (v1 - v0) * factor for v0, v1 in zip(values[:half], values[half:])
+        ]
+    return values
+
+
+def _check_num_masters(seq: Any, num_values: int, num_axes: int) -> None:
+    if num_values % (1 << num_axes):
+        raise ValueError(
+            f"List must have a number of elements divisible by {1 << num_axes}: {seq}"
+        )
+
+
+def remove_axes_from_list(
+    seq: list[int] | list[float],
+    factors: "Sequence[float]",
+    round_values: bool,
+    num_masters: int = -1,
+) -> None:
+    """
+    Remove several axes from a list in one pass, interpolating the remaining values.
+    The result is the same as calling `remove_axis_from_list` once per axis, rounding
+    only after the last axis.
+
+    Args:
+        seq (list[int] | list[float]): The list to be adjusted.
+        factors (Sequence[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+        round_values (bool): Whether to round the results.
+        num_masters (int, optional): The number of masters. Defaults to -1, which means
+            the length of the list.
+
+    Raises:
+        ValueError: If the number of elements can't be halved for each axis.
+    """
+    if num_masters >= 0 and num_masters != len(seq):
+        # Irregular list, process the axes one by one
+        for i, factor in enumerate(factors):
+            r = round_values and i == len(factors) - 1
+            remove_axis_from_list(seq, -1, factor, r, num_masters >> i)
+        return
+
+    _check_num_masters(seq, len(seq), len(factors))
+    seq[:] = reduce_values(seq, factors)
+    if round_values:
+        round_float_list(seq)
+
+
+def remove_axes_from_master_list(
+    seq: list[list[int] | list[float]],
+    factors: "Sequence[float]",
+    round_values: bool,
+    num_masters: int = -1,
+) -> None:
+    """
+    Remove several axes from a 2d list of values per master in one pass. Top level
+    index is the master index. See `remove_axes_from_list`.
+
+    Args:
+        seq (list[list[int] | list[float]]): The list of masters and values to be
+            adjusted.
+        factors (Sequence[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+        round_values (bool): Whether to round the results.
+        num_masters (int, optional): The number of masters. Defaults to -1, which means
+            the length of the list.
+
+    Raises:
+        ValueError: If the number of masters can't be halved for each axis.
+    """
+    if num_masters >= 0 and num_masters != len(seq):
+        for i, factor in enumerate(factors):
+            r = round_values and i == len(factors) - 1
+            remove_axis_from_master_list(seq, -1, factor, r, num_masters >> i)
+        return
+
+    num_masters = len(seq)
+    _check_num_masters(seq, num_masters, len(factors))
+    remaining = num_masters >> len(factors)
+    for v in range(len(seq[0])):
+        values = reduce_values([seq[m][v] for m in range(num_masters)], factors)
+        for m in range(remaining):
+            seq[m][v] = values[m]
+    del seq[remaining:]
+    if round_values:
+        round_master_float_list(seq)
+
+
+def remove_axes_from_point_list(
+    seq: list[Point],
+    factors: "Sequence[float]",
+    round_values: bool,
+    num_masters: int = -1,
+) -> None:
+    """
+    Remove several axes from a list of points in one pass. See
+    `remove_axes_from_list`.
+
+    Args:
+        seq (list[Point]): The list of points to be adjusted.
+        factors (Sequence[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+        round_values (bool): Whether to round the results.
+        num_masters (int, optional): The number of masters. Defaults to -1, which means
+            the length of the list.
+
+    Raises:
+        ValueError: If the number of points can't be halved for each axis.
+    """
+    if not seq:
+        # Empty point list, e.g. closepath?
+        return
+
+    if num_masters >= 0 and num_masters != len(seq):
+        for i, factor in enumerate(factors):
+            r = round_values and i == len(factors) - 1
+            remove_axis_from_point_list(seq, -1, factor, r, num_masters >> i)
+        return
+
+    _check_num_masters(seq, len(seq), len(factors))
+    xs = reduce_values([p.x for p in seq], factors)
+    ys = reduce_values([p.y for p in seq], factors)
+    seq[:] = [Point(x, y) for x, y in zip(xs, ys)]
+    if round_values:
+        round_point_list(seq)
+
+
+def remove_axes_from_master_point_list(
+    seq: list[list[Point]],
+    factors: "Sequence[float]",
+    round_values: bool,
+    num_masters: int = -1,
+) -> None:
+    """
+    Remove several axes from a 2d list of points per master in one pass. Top level
+    index is the master index. The remaining points are modified in place. See
+    `remove_axes_from_list`.
+
+    Args:
+        seq (list[list[Point]]): The list of masters and points to be adjusted.
+        factors (Sequence[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+        round_values (bool): Whether to round the results.
+        num_masters (int, optional): The number of masters. Defaults to -1, which means
+            the length of the list.
+
+    Raises:
+        ValueError: If the number of masters can't be halved for each axis.
+    """
+    if num_masters >= 0 and num_masters != len(seq):
+        for i, factor in enumerate(factors):
+            r = round_values and i == len(factors) - 1
+            remove_axis_from_master_point_list(seq, -1, factor, r, num_masters >> i)
+        return
+
+    num_masters = len(seq)
+    _check_num_masters(seq, num_masters, len(factors))
+    remaining = num_masters >> len(factors)
+    for v in range(len(seq[0])):
+        points = [seq[m][v] for m in range(num_masters)]
+        xs = reduce_values([p.x for p in points], factors)
+        ys = reduce_values([p.y for p in points], factors)
+        for m in range(remaining):
+            p = points[m]
+            p.x = xs[m]
+            p.y = ys[m]
+    del seq[remaining:]
+    if round_values:
+        round_master_point_list(seq)
+
+
+def remove_axes_from_coords(
+    coords: "array[float]",
+    stride: int,
+    factors: "Sequence[float]",
+    round_values: bool,
+) -> "array[float]":
+    """
+    Remove several axes from a flat array of coordinates per master in one pass. See
+    `remove_axes_from_list`.
+
+    Args:
+        coords (array[float]): The coordinates, `stride` values per master.
+        stride (int): The number of values per master.
+        factors (Sequence[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+        round_values (bool): Whether to round the results.
+
+    Raises:
+        ValueError: If the number of masters can't be halved for each axis.
+
+    Returns:
+        array[float]: The coordinates of the remaining masters.
+    """
+    num_masters = len(coords) // stride
+    _check_num_masters(coords, num_masters, len(factors))
+    result = array("d", bytes(8 * stride * (num_masters >> len(factors))))
+    for v in range(stride):
+        values = reduce_values(coords[v::stride].tolist(), factors)
+        if round_values:
+            values = [float(round_float(value)) for value in values]
+        result[v::stride] = array("d", values)
+    return result
+
+
 def interpolate(v0: float, v1: float, factor: float) -> float:
     return v0 + (v1 - v0) * factor
 
@@ -0,0 +1,144 @@
+from array import array
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import NDArray
+
+    from FL.objects.Glyph import Glyph
+
+
+__doc__ = """
+Vectorized interpolation of glyph data using NumPy. This is an optional engine, it is
+used when NumPy is installed.
+
+The results are identical to those of the pure Python functions in
+`FL.helpers.interpolation`, because the same floating point operations are performed
+in the same order.
+"""
+
+
+def remove_axes_from_array(
+    values: "NDArray[np.float64]", factors: "Iterable[float]"
+) -> "NDArray[np.float64]":
+    """
+    Remove axes from an array of values per master, interpolating the remaining values.
+    The first dimension of the array is the master index.
+
+    Args:
+        values (NDArray[np.float64]): The array of values.
+        factors (Iterable[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+
+    Raises:
+        ValueError: If the number of masters is odd.
+
+    Returns:
+        NDArray[np.float64]: The array of values for the remaining masters.
+    """
+    for factor in factors:
+        num_masters = values.shape[0]
+        if num_masters % 2:
+            raise ValueError(f"Array must have an even number of masters: {values}")
+
+        half = num_masters // 2
+        values = values[:half] + (values[half:] - values[:half]) * factor
+    return values
+
+
+def round_array(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """
+    Round an array of values like `FL.helpers.interpolation.round_float`, i.e. half
+    away from zero.
+
+    Args:
+        values (NDArray[np.float64]): The values.
+
+    Returns:
+        NDArray[np.float64]: The rounded values.
+    """
+    truncated = np.trunc(values)
+    rounded = truncated + np.sign(values) * (np.abs(values - truncated) >= 0.5)
+    # Avoid negative zeros
+    return rounded + 0.0
+
+
+def remove_axes_from_glyph_nodes(
+    glyphs: "Iterable[Glyph]",
+    factors: "Iterable[float]",
+    num_masters: int,
+    round_values: bool,
+) -> None:
+    """
+    Remove axes from the nodes of all glyphs in one go, interpolating the remaining
+    points. Nodes whose number of masters doesn't match `num_masters` are interpolated
+    by the pure Python code.
+
+    Args:
+        glyphs (Iterable[Glyph]): The glyphs.
+        factors (Iterable[float]): The interpolation factors, in the order in which the
+            axes are removed, i.e. starting with the last axis.
+        num_masters (int): The current number of masters.
+        round_values (bool): Whether to round the results.
+    """
+    factors = tuple(factors)
+    coords: list[list[float]] = [[] for _ in range(num_masters)]
+    nodes = []
+    for glyph in glyphs:
+        for node in glyph.nodes:
+            if len(node) == 0:
+                continue
+
+            node_coords = node._fake_coords
+            if node_coords is not None:
+                # Compact node
+                n = 2 * node._fake_points_count
+                if len(node_coords) != n * num_masters:
+                    node.fake_remove_axes(factors, round_values)
+                    continue
+
+                nodes.append(node)
+                for master_index in range(num_masters):
+                    start = master_index * n
+                    coords[master_index].extend(node_coords[start : start + n])
+                continue
+
+            if len(node._points) != num_masters:
+                node.fake_remove_axes(factors, round_values)
+                continue
+
+            nodes.append(node)
+            for master_index, master_points in enumerate(node._points):
+                master_coords = coords[master_index]
+                for p in master_points:
+                    master_coords.append(p.x)
+                    master_coords.append(p.y)
+
+    if not nodes:
+        return
+
+    values = remove_axes_from_array(np.array(coords, dtype=np.float64), factors)
+    if round_values:
+        values = round_array(values)
+
+    # Write the results back to the points
+    num_remaining = values.shape[0]
+    results = values.tolist()
+    v = 0
+    for node in nodes:
+        n = 2 * len(node)
+        if node._fake_coords is not None:
+            node._fake_coords = array("d", values[:, v : v + n].tobytes(order="C"))
+        else:
+            for master_index in range(num_remaining):
+                i = v
+                for p in node._points[master_index]:
+                    p.x = results[master_index][i]
+                    p.y = results[master_index][i + 1]
+                    i += 2
+            del node._points[num_remaining:]
+        v += n
+        node._masters_count //= 2 ** len(factors)
@@ -1,10 +1,16 @@
 from typing import TYPE_CHECKING
 
 from FL.fake.Base import Copyable
-from FL.helpers.interpolation import add_axis_to_list, remove_axis_from_point_list
+from FL.helpers.interpolation import (
+    add_axis_to_list,
+    remove_axes_from_point_list,
+    remove_axis_from_point_list,
+)
 from FL.objects.Point import Point
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from FL.objects.Glyph import Glyph
     from FL.objects.Matrix import Matrix
 
@@ -72,6 +78,14 @@ class Anchor(Copyable):
             self._points, index, interpolation, round_values, num_masters
         )
 
+    def fake_remove_axes(
+        self,
+        factors: "Sequence[float]",
+        round_values: bool,
+        num_masters: int = -1,
+    ) -> None:
+        remove_axes_from_point_list(self._points, factors, round_values, num_masters)
+
     # Attributes
 
     @property
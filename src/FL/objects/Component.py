@@ -1,11 +1,17 @@
 from typing import TYPE_CHECKING
 
 from FL.fake.Base import Copyable
-from FL.helpers.interpolation import add_axis_to_list, remove_axis_from_point_list
+from FL.helpers.interpolation import (
+    add_axis_to_list,
+    remove_axes_from_point_list,
+    remove_axis_from_point_list,
+)
 from FL.objects.Matrix import Matrix
 from FL.objects.Point import Point
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from FL.objects.Font import Font
     from FL.objects.Glyph import Glyph
 
@@ -115,6 +121,15 @@ class Component(Copyable):
         remove_axis_from_point_list(self._deltas, index, interpolation, round_values)
         remove_axis_from_point_list(self._scales, index, interpolation, round_values)
 
+    def fake_remove_axes(
+        self,
+        factors: "Sequence[float]",
+        round_values: bool,
+        num_masters: int = -1,
+    ) -> None:
+        remove_axes_from_point_list(self._deltas, factors, round_values)
+        remove_axes_from_point_list(self._scales, factors, round_values)
+
     # Attributes
 
     @property
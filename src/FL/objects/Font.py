@@ -1,5 +1,6 @@
 import traceback
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from FL.fake.copy import copy_fl_object
 from FL.fake.Font import FakeFont
@@ -8,6 +9,9 @@ from FL.objects.Glyph import Glyph
 from FL.objects.Uni import Uni
 from FL.objects.WeightVector import WeightVector
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 __doc__ = "Class to represent a font"
 
 
@@ -77,43 +81,105 @@ class Font(FakeFont):
         """
         raise NotImplementedError
 
-    def Open(self, filename: str) -> int:
+    def Open(
+        self,
+        filename: str,
+        lazy: bool = False,
+        skip: "Iterable[str] | None" = None,
+        keep_raw: "Iterable[str] | None" = None,
+        workers: int | None = 1,
+    ) -> int:
         """
         Open a font from a VFB file.
 
         Args:
             filename (str): The path and file name of the VFB file.
+            lazy (bool, optional): Whether to decode each glyph only when it is
+                accessed for the first time. Defaults to False.
+            skip (Iterable[str] | None, optional): The groups of data not to read at
+                all: "image", "bitmaps", "sketch", "mask" (glyph data), or "tth"
+                (font-level TrueType hinting data). The data is lost when the font is
+                saved. Defaults to None.
+            keep_raw (Iterable[str] | None, optional): The groups of data to keep
+                undecoded. They are not accessible through the API, but they are
+                written back unchanged when the font is saved. Defaults to None.
+            workers (int | None, optional): The number of worker processes in which to
+                decode the glyphs. Defaults to 1, which means the glyphs are decoded in
+                the current process. None means the number of CPUs. Not used in lazy
+                mode.
 
         Returns:
             int: 1 on success, 0 if the file could not be opened.
 
         If you need to import a font (not in VFB format), use `FL.Open()` or
         `FL.OpenFont()`.
+
+        If the environment variable `FAKELAB_CACHE_DIR` is set, the decoded font is
+        cached there, see `FL.vfb.cache`. Fonts opened lazily or with `skip` or
+        `keep_raw` are not cached.
         """
+        from FL.vfb.cache import get_cache
         from FL.vfb.reader import VfbToFontReader
 
         self._set_file_name(None)  # TODO: What if the font already is loaded from disk?
         try:
-            reader = VfbToFontReader(Path(filename))
-            reader.read(self)
-            del reader
+            cache = None if lazy or skip or keep_raw else get_cache()
+            key = None if cache is None else cache.get_key(filename)
+            if cache is None or key is None or not cache.load(key, self):
+                reader = VfbToFontReader(
+                    Path(filename),
+                    lazy=lazy,
+                    skip=skip,
+                    keep_raw=keep_raw,
+                    workers=workers,
+                )
+                reader.read(self)
+                reader.close()
+                del reader
+                if cache is not None and key is not None:
+                    cache.store(key, self)
         except Exception:
             print(traceback.format_exc())
             return 0
         self._set_file_name(filename)
         return 1
 
-    def Save(self, filename: str, save_json: bool = False) -> None:
+    def Save(
+        self,
+        filename: str,
+        save_json: bool = False,
+        incremental: bool = False,
+        workers: int | None = 1,
+    ) -> None:
         """
         Save the font in VFB format.
 
         Args:
             filename (str): The path and file name of the VFB file.
+            save_json (bool, optional): Whether to save a JSON file next to the VFB.
+                Defaults to False.
+            incremental (bool, optional): Whether to copy the glyphs which have not
+                been accessed since the font was read from a VFB file from that file,
+                instead of serializing them again. The file is written atomically.
+                Defaults to False.
+            workers (int | None, optional): The number of worker processes in which to
+                serialize the glyphs. Defaults to 1, which means the glyphs are
+                serialized in the current process. None means the number of CPUs. Not
+                used when saving incrementally.
         """
         from FL.vfb.writer import FontToVfbWriter
 
         self._set_file_name(filename)
-        writer = FontToVfbWriter(self)
+        if incremental:
+            from FL.vfb.incremental import save_incremental
+
+            save_incremental(self, Path(filename))
+            if save_json:
+                writer = FontToVfbWriter(self)
+                writer.write_json(Path(filename).with_suffix(".vfb.json"))
+            return
+
+        writer = FontToVfbWriter(self, workers=workers)
         if save_json:
             writer.write_json(Path(filename).with_suffix(".vfb.json"))
         writer.write(Path(filename))
@@ -152,14 +218,12 @@ class Font(FakeFont):
         Args:
             filename (str): The path and filename to save the files to.
         """
-        afm = self.fake_get_afm()
         afm_path = Path(filename).with_suffix(".afm")
         with open(afm_path, "w") as f:
-            f.write(afm)
-        inf = self.fake_get_inf()
+            self.fake_write_afm(f)
         inf_path = Path(filename).with_suffix(".inf")
         with open(inf_path, "w") as f:
-            f.write(inf)
+            self.fake_write_inf(f)
 
     def Reencode(self, e: Encoding, style: int = 0) -> None:
         """
@@ -181,22 +245,13 @@ class Font(FakeFont):
         """
         if isinstance(name_uni_int, str):
             # name
-            for i, g in enumerate(self._glyphs):
-                if g.name == name_uni_int:
-                    return i
-            return -1
+            return self._glyphs.fake_find_name(name_uni_int)
         elif isinstance(name_uni_int, Uni):
             # uni object
-            for i, g in enumerate(self._glyphs):
-                if name_uni_int.value in g.unicodes:
-                    return i
-            return -1
+            return self._glyphs.fake_find_unicode(name_uni_int.value)
         elif isinstance(name_uni_int, int):
             # int (unicode value)
-            for i, g in enumerate(self._glyphs):
-                if name_uni_int in g.unicodes:
-                    return i
-            return -1
+            return self._glyphs.fake_find_unicode(name_uni_int)
         else:
             raise TypeError
 
@@ -10,6 +10,8 @@ from FL.objects.Point import Point
 from FL.vfb.writer import FontToVfbWriter
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from FL.objects.Canvas import Canvas
     from FL.objects.Glyph import Glyph
     from FL.objects.Rect import Rect
@@ -273,7 +275,14 @@ class FakeLab:
         else:
             self.ifont = self.count - 1
 
-    def Open(self, filename: str, addtolist: bool = True) -> None:
+    def Open(
+        self,
+        filename: str,
+        addtolist: bool = True,
+        lazy: bool = False,
+        skip: "Iterable[str] | None" = None,
+        keep_raw: "Iterable[str] | None" = None,
+    ) -> None:
         """
         Open the font from file using current opening options. If `addtolist` is True,
         the font is added to FontLab's font list. The font is shown in a window.
@@ -281,6 +290,12 @@ class FakeLab:
         Args:
             filename (str): _description_
             addtolist (bool, optional): _description_. Defaults to True.
+            lazy (bool, optional): Whether to decode the glyphs of a VFB only when
+                they are accessed for the first time. Defaults to False.
+            skip (Iterable[str] | None, optional): The groups of VFB data not to read,
+                see `Font.Open()`. Defaults to None.
+            keep_raw (Iterable[str] | None, optional): The groups of VFB data to keep
+                undecoded, see `Font.Open()`. Defaults to None.
 
         `addtolist` seems to be ignored; the font window is always opened.
         If the file at the path is already opened, it will not be opened again.
@@ -291,7 +306,7 @@ class FakeLab:
 
         # Try to open the font as VFB:
         font = Font()
-        result = font.Open(filename)
+        result = font.Open(filename, lazy=lazy, skip=skip, keep_raw=keep_raw)
         if result == 0:
             # Was not a VFB, try to import it
             fi = FontImporter(Path(filename), options=Options())
@@ -17,13 +17,15 @@ from vfbLib.typing import (
 from FL.constants import DIR_HORIZONTAL, DIR_VERTICAL
 from FL.fake.Base import Copyable
 from FL.fake.mixins import GuideMixin, GuidePropertiesMixin
+from FL.helpers.bounds import get_outline_bounds
 from FL.helpers.FLList import adjust_list
 from FL.helpers.interpolation import (
     add_axis_to_list,
+    remove_axes_from_point_list,
     remove_axis_from_factor_list,
     remove_axis_from_point_list,
 )
-from FL.helpers.ListParent import DirectionalList, ListParent
+from FL.helpers.ListParent import DirectionalList, ListParent, OutlineList
 from FL.objects.Anchor import Anchor
 from FL.objects.Component import Component
 from FL.objects.Guide import Guide
@@ -37,10 +39,11 @@ from FL.objects.Rect import Rect
 from FL.objects.Replace import Replace
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from vfbLib.typing import Instruction
 
+    from FL.helpers.bounds import Bounds
     from FL.objects.AuditRecord import AuditRecord
     from FL.objects.Font import Font
     from FL.objects.Matrix import Matrix
@@ -86,7 +89,7 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
         "instructions",
         "left_side_bearing",
         "mark",
-        "name",
+        "_name",
         "note",
         "number_of_contours",
         "points",
@@ -100,6 +103,8 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
         "_glyph_origin",
         "_glyph_sketch",
         "_custom_dict",
+        "_fake_bounds",
+        "_fake_raw_entries",
         "_mask_weight_vector",
         "_mask_metrics_mm",
         "_mask_metrics",
@@ -143,7 +148,10 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
 
     def set_defaults(self) -> None:
         self._parent = None
-        self._nodes: ListParent[Node] = ListParent([], self, Node)
+        # The bounding boxes of all masters, with and without curve extrema. They are
+        # discarded when the nodes are modified.
+        self._fake_bounds: "dict[bool, list[Bounds]]" = {}
+        self._nodes: ListParent[Node] = OutlineList([], self, Node)
 
         # custom data defined for this glyph
         self.customdata: str | None = None
@@ -186,7 +194,7 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
         self._custom_dict: str = ""
 
         # glyph name
-        self.name = ""
+        self._name = ""
 
         # [Image]           - background image (new in FL 4.53 Win)
         self._image = Image(24, 24)
@@ -217,6 +225,9 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
         self._glyph_origin = {"x": 0, "y": 0}
         self._glyph_sketch: list[tuple[int, int, int]] = []
         self._tth: "list[Instruction]" = []
+        # Entries that were kept undecoded when reading a VFB, they are written back
+        # unchanged
+        self._fake_raw_entries: dict[int, bytes] = {}
 
         # For binary compatibility with FL-written files:
 
@@ -466,6 +477,8 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
         ):
             s[G.GuideProperties] = guide_properties
 
+        # Entries that were kept undecoded replace the serialized ones
+        s.update(self._fake_raw_entries)
         return s
 
     def fake_deserialize_hints(self, data: MMHintsDict) -> None:
@@ -608,6 +621,7 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
             add_axis_to_list(self._vsb)
 
         self._layers_number *= 2
+        self.fake_invalidate_bounds()
 
     def fake_remove_axis(
         self,
@@ -670,6 +684,108 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
 
         if self._vsb:
             adjust_list(self._vsb, self._layers_number)
+        self.fake_invalidate_bounds()
+
+    def fake_remove_axes(
+        self,
+        factors: "Sequence[float]",
+        round_values: bool = True,
+        num_masters: int = -1,
+        nodes: bool = True,
+    ) -> None:
+        """
+        Remove the last axes from the glyph in one pass, interpolating all values to
+        the normalized positions given. The result is the same as calling
+        `fake_remove_axis()` once per axis, rounding only after the last axis.
+
+        Args:
+            factors (Sequence[float]): The positions in normalized space (0.0 to 1.0),
+                in the order in which the axes are removed, i.e. starting with the last
+                axis.
+            round_values (bool, optional): Whether to round the results. Defaults to
+                True.
+            num_masters (int, optional): The number of masters. Defaults to -1.
+            nodes (bool, optional): Whether to interpolate the nodes. Pass False if
+                they have been interpolated already. Defaults to True.
+        """
+        # Delegate to sub-objects
+
+        if nodes:
+            for node in self._nodes:
+                node.fake_remove_axes(factors, round_values, num_masters)
+        for anchor in self._anchors:
+            anchor.fake_remove_axes(factors, round_values, num_masters)
+        for hint in self._hhints:
+            hint.fake_remove_axes(factors, round_values, num_masters)
+        for hint in self._vhints:
+            hint.fake_remove_axes(factors, round_values, num_masters)
+        for guide in self._hguides:
+            guide.fake_remove_axes(factors, round_values, num_masters)
+        for guide in self._vguides:
+            guide.fake_remove_axes(factors, round_values, num_masters)
+        for component in self._components:
+            component.fake_remove_axes(factors, round_values, num_masters)
+        for kerning_pair in self._kerning:
+            kerning_pair.fake_remove_axes(factors, round_values, num_masters)
+
+        self._layers_number //= 1 << len(factors)
+
+        # Direct MM properties
+        remove_axes_from_point_list(self._metrics, factors, round_values, num_masters)
+
+        if self._mask is not None:
+            self._mask.fake_remove_axes(factors, round_values)
+
+        if self._mask_metrics_mm is not None:
+            mm_metrics = [self._mask_metrics, *self._mask_metrics_mm]
+            remove_axes_from_point_list(mm_metrics, factors, round_values, num_masters)
+            self._mask_metrics = mm_metrics[0]
+            if self._layers_number > 1:
+                self._mask_metrics_mm = mm_metrics[1:]
+            else:
+                self._mask_metrics_mm = None
+
+        if self._vsb:
+            adjust_list(self._vsb, self._layers_number)
+        # The nodes may have been interpolated without notifying the glyph
+        self.fake_invalidate_bounds()
+
+    def fake_invalidate_bounds(self) -> None:
+        """
+        Discard the cached bounding boxes of the glyph and its font. Is called when the
+        nodes of the glyph are modified.
+        """
+        if not self._fake_bounds:
+            # If nothing is cached for the glyph, nothing is cached for the font either
+            return
+
+        self._fake_bounds = {}
+        if self._parent is not None:
+            self._parent.fake_invalidate_bounds()
+
+    def _fake_get_bounds(self, extrema: bool = False) -> "list[Bounds]":
+        # Return the cached bounding boxes of all masters, see `get_outline_bounds()`
+        bounds = self._fake_bounds.get(extrema)
+        if bounds is None:
+            bounds = self._fake_bounds[extrema] = get_outline_bounds(
+                self._nodes, self._layers_number, extrema
+            )
+        return bounds
+
+    def fake_get_bounding_rects(self, extrema: bool = False) -> list[Rect]:
+        """
+        Return the bounding boxes of all masters. They are calculated in one pass over
+        the nodes.
+
+        Args:
+            extrema (bool, optional): Whether to calculate the bounds of the curves
+                from their extrema instead of including the control points. Defaults
+                to False.
+
+        Returns:
+            list[Rect]: The bounding box of each master.
+        """
+        return [Rect(*bounds) for bounds in self._fake_get_bounds(extrema)]
 
     # Attributes
 
@@ -878,10 +994,13 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
             raise TypeError
         if value == -1:
             return
+        old_unicodes = self._unicodes.copy()
         if not self._unicodes:
             self._unicodes.append(value)
         else:
             self._unicodes[0] = value
+        if self._parent is not None:
+            self._parent.glyphs.fake_glyph_unicodes_changed(self, old_unicodes)
 
     @property
     def unicodes(self) -> list[int]:
@@ -889,9 +1008,27 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
 
     @unicodes.setter
     def unicodes(self, value: list[int]) -> None:
+        old_unicodes = self._unicodes
         self._unicodes = value.copy()
+        if self._parent is not None:
+            self._parent.glyphs.fake_glyph_unicodes_changed(self, old_unicodes)
+
+    @property
+    def name(self) -> str:
+        """
+        The glyph name.
 
-    # name
+        Returns:
+            str: The glyph name.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        old_name = self._name
+        self._name = value
+        if self._parent is not None and value != old_name:
+            self._parent.glyphs.fake_glyph_renamed(self, old_name)
 
     @property
     def image(self) -> Image:
@@ -1242,15 +1379,7 @@ class Glyph(Copyable, GuideMixin, GuidePropertiesMixin):
         Returns:
             Rect: The bounding box of the glyph.
         """
-        if masterindex != 0:
-            raise NotImplementedError
-
-        rect = Rect(32767, 32767, -32767, -32767)
-        for n in self._nodes:
-            for p in n.points:
-                rect += p
-
-        return rect
+        return Rect(*self._fake_get_bounds()[masterindex])
 
     def GetMetrics(self, masterindex: int = 0) -> Point:
         """
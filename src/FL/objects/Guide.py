@@ -2,9 +2,15 @@ from math import atan2, degrees, radians, tan
 from typing import TYPE_CHECKING
 
 from FL.fake.Base import Copyable
-from FL.helpers.interpolation import add_axis_to_list, remove_axis_from_list
+from FL.helpers.interpolation import (
+    add_axis_to_list,
+    remove_axes_from_list,
+    remove_axis_from_list,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from FL.objects.Glyph import Glyph
     from FL.objects.Matrix import Matrix
 
@@ -82,6 +88,15 @@ class Guide(Copyable):
         remove_axis_from_list(self._positions, index, interpolation, round_values, m)
         remove_axis_from_list(self._widths, index, interpolation, round_values, m)
 
+    def fake_remove_axes(
+        self,
+        factors: "Sequence[float]",
+        round_values: bool,
+        num_masters: int = -1,
+    ) -> None:
+        remove_axes_from_list(self._positions, factors, round_values, num_masters)
+        remove_axes_from_list(self._widths, factors, round_values, num_masters)
+
     @property
     def angle(self) -> float:
         """The angle of the guideline.
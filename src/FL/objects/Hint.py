@@ -5,11 +5,17 @@ from vfbLib.typing import HintDict
 
 from FL.constants import DIR_HORIZONTAL, DIR_UNDEFINED, DIR_VERTICAL
 from FL.fake.Base import Copyable
-from FL.helpers.interpolation import add_axis_to_list, remove_axis_from_list
+from FL.helpers.interpolation import (
+    add_axis_to_list,
+    remove_axes_from_list,
+    remove_axis_from_list,
+)
 from FL.objects.Link import Link
 from FL.objects.Point import Point
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from FL.objects.Glyph import Glyph
     from FL.objects.Matrix import Matrix
 
@@ -162,6 +168,15 @@ class Hint(Copyable):
             self._widths, index, interpolation, round_values, num_masters
         )
 
+    def fake_remove_axes(
+        self,
+        factors: "Sequence[float]",
+        round_values: bool,
+        num_masters: int = -1,
+    ) -> None:
+        remove_axes_from_list(self._positions, factors, round_values, num_masters)
+        remove_axes_from_list(self._widths, factors, round_values, num_masters)
+
     # Attributes
 
     @property
@@ -188,7 +203,7 @@ class Hint(Copyable):
     def position(self, value: int) -> None:
         # Sets the position for all masters
         # TODO: Must we keep the list, or could we just replace it?
-        for i in range(16):
+        for i in range(len(self._positions)):
             self._positions[i] = value
 
     @property
@@ -205,7 +220,7 @@ class Hint(Copyable):
     def width(self, value: int) -> None:
         # Sets the width for all masters
         # TODO: Must we keep the list, or could we just replace it?
-        for i in range(16):
+        for i in range(len(self._widths)):
             self._widths[i] = value
 
     @property
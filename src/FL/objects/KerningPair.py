@@ -2,9 +2,15 @@ from typing import TYPE_CHECKING
 
 from FL.fake.Base import Copyable
 from FL.helpers.FLList import adjust_list
-from FL.helpers.interpolation import add_axis_to_list, remove_axis_from_list
+from FL.helpers.interpolation import (
+    add_axis_to_list,
+    remove_axes_from_list,
+    remove_axis_from_list,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from FL.objects.Glyph import Glyph
 
 
@@ -79,6 +85,14 @@ class KerningPair(Copyable):
             self._values, index, interpolation, round_values, num_masters
         )
 
+    def fake_remove_axes(
+        self,
+        factors: "Sequence[float]",
+        round_values: bool,
+        num_masters: int = -1,
+    ) -> None:
+        remove_axes_from_list(self._values, factors, round_values, num_masters)
+
     # Attributes
 
     @property
@@ -2,6 +2,8 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import MutableSequence
+
     from FL.objects.Point import Point
 
 
@@ -123,6 +125,37 @@ class Matrix:
         p.x = x * self.a + y * self.b + self.e
         p.y = x * self.c + y * self.d + self.f
 
+    def fake_transform_coords(
+        self, coords: "MutableSequence[float]", start: int = 0, end: int | None = None
+    ) -> None:
+        """
+        Like `fake_transform_point`, but transform a flat sequence of x and y
+        coordinates in place.
+
+        Args:
+            coords (MutableSequence[float]): The coordinates.
+            start (int, optional): The index of the first x coordinate. Defaults to 0.
+            end (int | None, optional): The index after the last y coordinate. Defaults
+                to None, which means the end of the sequence.
+        """
+        if self.fake_is_identity:
+            return
+
+        if end is None:
+            end = len(coords)
+
+        if self.fake_is_translation:
+            for i in range(start, end, 2):
+                coords[i] += self.e
+                coords[i + 1] += self.f
+            return
+
+        for i in range(start, end, 2):
+            x = coords[i]
+            y = coords[i + 1]
+            coords[i] = x * self.a + y * self.b + self.e
+            coords[i + 1] = x * self.c + y * self.d + self.f
+
     # Attributes
 
     @property
@@ -35,7 +35,14 @@ class Node(FakeNode):
         self.type = other.type
         self.alignment = other.alignment
         self._masters_count = other._masters_count
-        self._points = [ListParent([Point(p) for p in other.points], only_type=Point)]
+        if other._fake_coords is not None:
+            # Copy the compact coordinates of the first master
+            self._fake_points = None
+            self._fake_coords = other._fake_coords[: 2 * other._fake_points_count]
+            self._fake_points_count = other._fake_points_count
+            self.fake_invalidate_bounds()
+        else:
+            self._points = [self._fake_point_list([Point(p) for p in other.points])]
 
     # Methods
 
@@ -66,7 +73,7 @@ class Node(FakeNode):
             else:
                 points = [Point(p)]
             self._points = [
-                ListParent(points, only_type=Point) for _ in range(self._masters_count)
+                self._fake_point_list(points) for _ in range(self._masters_count)
             ]
 
     def SetAllLayers(self, pointindex: int, p: Point) -> None:
@@ -105,5 +112,10 @@ class Node(FakeNode):
         Applies Matrix transformation to the Node
         """
         # FIXME: Does it handle MM?
+        if self._fake_coords is not None:
+            m.fake_transform_coords(self._fake_coords, 0, 2 * self._fake_points_count)
+            self.fake_invalidate_bounds()
+            return
+
         for point in self.points:
             point.Transform(m)
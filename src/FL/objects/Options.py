@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -405,8 +406,13 @@ class Options:
                 print(f"Ignored unknown attribute while loading options: {k}")
 
     def fake_save_options(self) -> None:
-        with open(self.fake_options_path, "w", encoding="utf-8") as f:
+        # Write to a temporary file first, so that other processes never read a
+        # partially written file
+        file_path = self.fake_options_path
+        tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(self.as_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, file_path)
 
     # Attributes
 
@@ -11,7 +11,7 @@ __doc__ = "Class to represent a point"
 
 
 class Point(Copyable):
-    __slots__ = ["_parent", "_x", "_y"]
+    __slots__ = ["_fake_node", "_parent", "_x", "_y"]
 
     # Constructor
 
@@ -54,6 +54,7 @@ class Point(Copyable):
         class Point has no attribute %s or it is read-only
         """
         self._parent = None
+        self._fake_node: Any = None
         self.x = 0
         self.y = 0
         if p_or_x is not None:
@@ -74,6 +75,14 @@ class Point(Copyable):
         Is called from FontLab.UpdateFont()
         """
         self._parent = parent
+        self._fake_node = parent
+
+    def _fake_changed(self) -> None:
+        # The node that holds the point must discard the cached bounding box of its
+        # glyph when the point moves. This is tracked separately from the parent,
+        # which Assign() removes, but the point still belongs to the node.
+        if self._fake_node is not None:
+            self._fake_node.fake_invalidate_bounds()
 
     # Attributes
 
@@ -98,6 +107,7 @@ class Point(Copyable):
     @x.setter
     def x(self, value: float) -> None:
         self._x = float(value)
+        self._fake_changed()
 
     @property
     def y(self) -> float:
@@ -112,6 +122,7 @@ class Point(Copyable):
     @y.setter
     def y(self, value: float) -> None:
         self._y = float(value)
+        self._fake_changed()
 
     # Operations
 
@@ -133,7 +133,12 @@ class BaseFont:
         "_primary_instances",
         "_sample_text",  # 1140
         # Internal:
+        "_fake_bounds",
+        "_fake_defer_depth",
         "_fake_kerning",
+        "_fake_pending_deletions",
+        "_fake_raw_entries",
+        "_fake_vfb_source",
         "_file_name",
         "_selection",
     ]
@@ -159,10 +164,10 @@ class BaseFont:
         """
         if isinstance(index, str):
             # We got a glyph name
-            for glyph in self._glyphs:
-                if glyph.name == index:
-                    return glyph
-            return None
+            i = self._glyphs.fake_find_name(index)
+            if i == -1:
+                return None
+            return self._glyphs[i]
 
         return self._glyphs[index]
 
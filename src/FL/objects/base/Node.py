@@ -1,7 +1,8 @@
+from array import array
 from typing import TYPE_CHECKING
 
 from FL.constants import nLINE, nSHARP
-from FL.helpers.ListParent import ListParent
+from FL.helpers.ListParent import ListParent, OutlineList
 from FL.objects.Point import Point
 
 if TYPE_CHECKING:
@@ -17,9 +18,17 @@ class BaseNode:
         "type",
         "_masters_count",
         "_parent",
-        "_points",
+        "_fake_coords",
+        "_fake_points",
+        "_fake_points_count",
     ]
 
+    # The points of a node which has been read from a VFB are stored compactly as
+    # coordinates in an array, in the order master, point, x/y. The Point objects are
+    # built when they are accessed for the first time; the array is discarded then.
+
+    # Changes of the points are reported to the glyph, which caches its bounding box.
+
     def __getitem__(self, index: int) -> "Point":
         """
         Accesses points array of the first master
@@ -27,6 +36,9 @@ class BaseNode:
         return self._points[0][index]
 
     def __init__(self) -> None:
+        self._fake_coords: "array[float] | None" = None
+        self._fake_points: "list[ListParent[Point]] | None" = None
+        self._fake_points_count = 0
         self._parent = None
         self._masters_count = 1
 
@@ -40,7 +52,7 @@ class BaseNode:
         # 1 if node is selected
         self.selected = 0
         self._points: "list[ListParent[Point]]" = [
-            ListParent(only_type=Point) for _ in range(self._masters_count)
+            self._fake_point_list() for _ in range(self._masters_count)
         ]
         for master_index in range(self._masters_count):
             self._points[master_index].append(Point())
@@ -49,6 +61,9 @@ class BaseNode:
         """
         Return the number of points.
         """
+        if self._fake_coords is not None:
+            return self._fake_points_count
+
         return len(self._points[0])
 
     def __mul__(self, matrix: "Matrix") -> "Node":
@@ -57,6 +72,46 @@ class BaseNode:
     def __repr__(self) -> str:
         return f"<Node: type=0x{self.type:x}, x={self.x:g}, y={self.y:g}>"
 
+    @property
+    def _points(self) -> "list[ListParent[Point]]":
+        if self._fake_points is None:
+            self._fake_build_points()
+        assert self._fake_points is not None
+        return self._fake_points
+
+    @_points.setter
+    def _points(self, value: "list[ListParent[Point]]") -> None:
+        self._fake_points = value
+        self._fake_coords = None
+        self.fake_invalidate_bounds()
+
+    def _fake_build_points(self) -> None:
+        # Build the Point objects from the compact coordinates
+        coords = self._fake_coords
+        assert coords is not None
+        n = 2 * self._fake_points_count
+        self._fake_points = [
+            self._fake_point_list(
+                [Point(coords[i], coords[i + 1]) for i in range(start, start + n, 2)]
+            )
+            for start in range(0, len(coords), n)
+        ]
+        self._fake_coords = None
+
+    def _fake_point_list(
+        self, points: "list[Point] | None" = None
+    ) -> OutlineList[Point]:
+        # Return a list for the points of one master, which reports changes to the node
+        return OutlineList([] if points is None else points, self, Point)
+
+    def fake_invalidate_bounds(self) -> None:
+        """
+        Discard the cached bounding box of the glyph the node belongs to. Is called when
+        the node or its points are modified.
+        """
+        if self._parent is not None:
+            self._parent.fake_invalidate_bounds()
+
     @property
     def parent(self) -> "Glyph | None":
         """
@@ -84,8 +139,14 @@ class BaseNode:
 
     @property
     def x(self) -> int:
+        if self._fake_coords is not None:
+            return int(self._fake_coords[0])
+
         return int(self.point.x)
 
     @property
     def y(self) -> int:
+        if self._fake_coords is not None:
+            return int(self._fake_coords[1])
+
         return int(self.point.y)
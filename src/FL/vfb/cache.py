@@ -0,0 +1,231 @@
+import hashlib
+import logging
+import os
+import pickle
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from FL.objects.Font import Font
+
+
+__doc__ = """
+Persistent cache of decoded VFB files.
+
+Decoding a VFB through vfbLib is slow compared to loading the pickled `Font` object. The
+cache is opt-in: Set the environment variable `FAKELAB_CACHE_DIR` to a directory, and
+`Font.Open()` stores each font it decodes there, and loads it from there the next time
+the same unchanged file is opened.
+
+An entry is identified by the resolved path of the VFB, its size, modification time and
+the SHA-256 hash of its contents, so a modified file is never loaded from the cache.
+When the total size of the cache exceeds `FAKELAB_CACHE_SIZE` (in megabytes, default
+1024), the least recently used entries are deleted.
+
+Lazily opened fonts are not cached.
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+# Increase this when the pickled data of the Font object changes incompatibly
+CACHE_FORMAT = 1
+
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+# The id under which the font object itself is pickled, see `VfbCache.store()`
+_FONT_ID = "font"
+
+
+def _get_version(package: str) -> str:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class _FontPickler(pickle.Pickler):
+    # Pickle references to the font as persistent id, so they can be pointed to the
+    # target font on loading
+    def __init__(self, file: Any, font: "Font") -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.font = font
+
+    def persistent_id(self, obj: Any) -> str | None:
+        if obj is self.font:
+            return _FONT_ID
+
+        return None
+
+
+class _FontUnpickler(pickle.Unpickler):
+    def __init__(self, file: Any, font: "Font") -> None:
+        super().__init__(file)
+        self.font = font
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == _FONT_ID:
+            return self.font
+
+        raise pickle.UnpicklingError(f"Unknown persistent id: {pid}")
+
+
+class VfbCache:
+    """
+    A directory containing decoded VFB files.
+    """
+
+    def __init__(self, cache_dir: Path | str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Use the directory at `cache_dir` as cache. It is created if it doesn't exist.
+
+        Args:
+            cache_dir (Path | str): The cache directory.
+            max_size (int, optional): The maximum total size of the cache entries in
+                bytes. Defaults to DEFAULT_MAX_SIZE.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._version = (
+            f"{CACHE_FORMAT}:{_get_version('fakelab')}:{_get_version('vfbLib')}"
+        )
+
+    def get_key(self, vfb_path: Path | str) -> str:
+        """
+        Return the cache key of the VFB file at `vfb_path`.
+
+        Args:
+            vfb_path (Path | str): The path of the VFB.
+
+        Returns:
+            str: The key.
+        """
+        path = Path(vfb_path).resolve()
+        stat = path.stat()
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        key = f"{self._version}\n{path}\n{stat.st_size}\n{stat.st_mtime_ns}\n{digest}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pickle"
+
+    def load(self, key: str, font: "Font") -> bool:
+        """
+        Load the cache entry with key `key` into `font`.
+
+        Args:
+            key (str): The cache key, see `get_key()`.
+            font (Font): The target object of the data.
+
+        Returns:
+            bool: Whether the entry was found. If it was not found, the font is not
+                modified.
+        """
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                state = _FontUnpickler(f, font).load()
+        except FileNotFoundError:
+            return False
+
+        except Exception:
+            logger.warning(f"Could not load cache entry, deleting it: {entry_path}")
+            entry_path.unlink(missing_ok=True)
+            return False
+
+        for attrs in state:
+            if attrs is None:
+                continue
+
+            for attr, value in attrs.items():
+                setattr(font, attr, value)
+        # Mark the entry as recently used
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        logger.debug(f"Loaded font from cache: {entry_path}")
+        return True
+
+    def store(self, key: str, font: "Font") -> None:
+        """
+        Store `font` in the cache under the key `key`, and evict old entries if the
+        cache is full.
+
+        Args:
+            key (str): The cache key, see `get_key()`.
+            font (Font): The font.
+        """
+        entry_path = self._get_entry_path(key)
+        # Write to a temporary file first, so that other processes never read a
+        # partially written file
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        state = font.__getstate__()
+        if not isinstance(state, tuple):
+            state = (state, None)
+        try:
+            with open(tmp_path, "wb") as f:
+                _FontPickler(f, font).dump(state)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            logger.warning(f"Could not store cache entry: {entry_path}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Delete the least recently used entries until the total size of the cache is
+        within `max_size`.
+        """
+        entries = []
+        total = 0
+        for entry_path in self.cache_dir.glob("*.pickle"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total <= self.max_size:
+                break
+
+            logger.debug(f"Evicting cache entry: {entry_path}")
+            entry_path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Delete all entries from the cache.
+        """
+        for entry_path in self.cache_dir.glob("*.pickle"):
+            entry_path.unlink(missing_ok=True)
+
+
+def get_cache() -> VfbCache | None:
+    """
+    Return the cache configured by the environment variables `FAKELAB_CACHE_DIR` and
+    `FAKELAB_CACHE_SIZE`.
+
+    Returns:
+        VfbCache | None: The cache, or None if caching is not enabled.
+    """
+    cache_dir = os.environ.get("FAKELAB_CACHE_DIR")
+    if not cache_dir:
+        return None
+
+    max_size = DEFAULT_MAX_SIZE
+    size = os.environ.get("FAKELAB_CACHE_SIZE")
+    if size:
+        try:
+            max_size = int(size) * 1024 * 1024
+        except ValueError:
+            logger.warning(f"Invalid FAKELAB_CACHE_SIZE, using the default: {size}")
+    return VfbCache(cache_dir, max_size)
@@ -0,0 +1,161 @@
+import logging
+from io import BytesIO
+from typing import TYPE_CHECKING, Any
+
+from vfbLib.enum import G
+from vfbLib.parsers.base import StreamReader
+from vfbLib.vfb.entry import VfbEntry
+from vfbLib.vfb.vfb import Vfb
+
+from FL.objects.Glyph import Glyph
+from FL.vfb.mapped import RawData
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+__doc__ = "Glyphs whose VFB entries are decoded on first access"
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_parse_context(vfb: Vfb) -> Vfb:
+    """
+    Return an empty Vfb that carries just the information the vfbLib parsers need to
+    decompile glyph entries, so the raw entries don't keep the whole source Vfb alive.
+
+    Args:
+        vfb (Vfb): The source Vfb, which must have been read already.
+
+    Returns:
+        Vfb: The parse context.
+    """
+    context = Vfb(timing=False)
+    context.encoding = vfb.encoding
+    context.num_masters = vfb.num_masters
+    context.ttStemsH_count = vfb.ttStemsH_count
+    context.ttStemsV_count = vfb.ttStemsV_count
+    context.writer_platform = vfb.writer_platform
+    return context
+
+
+def peek_glyph_name(data: RawData) -> str:
+    """
+    Read the glyph name from the raw data of a G.Glyph entry without decompiling the
+    outlines.
+
+    Args:
+        data (RawData): The raw entry data.
+
+    Returns:
+        str: The glyph name, or an empty string if the entry has no name.
+    """
+    reader = StreamReader()
+    reader.stream = BytesIO(data)
+    # Skip the glyph constant
+    reader.stream.read(4)
+    if reader.read_uint8() != 0x01:
+        return ""
+
+    return reader.read_str_with_len()
+
+
+class DeferredGlyph:
+    """
+    The undecoded VFB entries of a glyph. This stands in for the Glyph object in
+    `Font.glyphs` when a font was opened lazily. The Glyph is built when it is accessed
+    for the first time.
+
+    The glyph name and Unicodes are decoded up front, so glyph lookups don't need to
+    build the Glyph.
+    """
+
+    __slots__ = ["__weakref__", "_context", "entries", "name", "unicodes"]
+
+    def __init__(self, context: Vfb, data: RawData) -> None:
+        """
+        Start a deferred glyph from the raw data of its G.Glyph entry.
+
+        Args:
+            context (Vfb): The parse context, see `get_parse_context()`.
+            data (RawData): The raw data of the G.Glyph entry.
+        """
+        self._context = context
+        self.entries: list[tuple[int, RawData]] = [(G.Glyph, data)]
+        self.name = peek_glyph_name(data)
+        self.unicodes: list[int] = []
+
+    def __repr__(self) -> str:
+        return f"<DeferredGlyph: '{self.name}', {len(self.entries)} entries>"
+
+    def __copy__(self) -> "DeferredGlyph":
+        # The raw data is never modified, so copies may share it.
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DeferredGlyph":
+        return self
+
+    def fake_release_mapping(self) -> None:
+        """
+        Copy the raw data into memory, so it doesn't refer to a memory-mapped file
+        anymore, see `FL.vfb.mapped.release_mapped_file()`.
+        """
+        self.entries = [(key, bytes(data)) for key, data in self.entries]
+
+    @property
+    def num_masters(self) -> int:
+        """
+        The number of masters of the font the entries were read from.
+
+        Returns:
+            int: The number of masters.
+        """
+        return self._context.num_masters
+
+    def add_entry(self, key: int, data: RawData) -> None:
+        """
+        Add the raw data of another entry that belongs to the glyph.
+
+        Args:
+            key (int): The entry key.
+            data (RawData): The raw entry data.
+        """
+        self.entries.append((key, data))
+        if key in (G.unicodes, G.UnicodesNonBMP):
+            self.unicodes.extend(self._decompile_entry(key, data))
+
+    def _decompile_entry(self, key: int, data: RawData) -> Any:
+        entry = VfbEntry(self._context, eid=key)
+        # vfbLib only decompiles bytes
+        entry.data = bytes(data)
+        entry.decompile()
+        return entry.data
+
+    def decompile(self) -> "Iterator[tuple[int, Any]]":
+        """
+        Decompile the raw entries of the glyph.
+
+        Yields:
+            Iterator[tuple[int, Any]]: The entry key and decompiled data.
+        """
+        for key, data in self.entries:
+            yield key, self._decompile_entry(key, data)
+
+    def fake_load(self) -> Glyph:
+        """
+        Build the Glyph object from the raw entries.
+
+        Returns:
+            Glyph: The glyph.
+        """
+        logger.debug(f"Loading deferred glyph: '{self.name}'")
+        glyph = Glyph()
+        # The keys of the entries that are kept undecoded
+        raw_keys = self._context.drop_keys
+        for key, data in self.entries:
+            if key in raw_keys:
+                glyph._fake_raw_entries[key] = bytes(data)
+            else:
+                glyph.fake_deserialize(key, self._decompile_entry(key, data))
+        return glyph
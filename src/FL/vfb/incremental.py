@@ -0,0 +1,284 @@
+import logging
+import os
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import unpack_from
+from typing import TYPE_CHECKING, Any
+
+from vfbLib.enum import F, G
+from vfbLib.vfb.header import VfbHeader
+
+from FL.vfb.mapped import release_mapped_file
+from FL.vfb.writer import FontToVfbWriter, glyph_entry_keys
+
+if TYPE_CHECKING:
+    from vfbLib.vfb.vfb import Vfb
+
+    from FL.objects.Font import Font
+
+
+__doc__ = """
+Incremental saving of fonts that were read from a VFB file.
+
+When a font is read from a VFB file, the reader records where the entries of each glyph
+are located in the file (see `VfbSource`), and `Font.glyphs` remembers which glyph came
+from which location. A glyph is considered modified as soon as it is handed out by
+`Font.glyphs`, like in lazy mode.
+
+When the font is saved incrementally, the font-level entries are compiled as usual, but
+the bytes of unmodified glyphs are copied from the original file instead of serializing
+and compiling the glyphs again. The output is written to a temporary file, which then
+replaces the target file.
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+# The size of the chunks in which data is copied from the source file
+CHUNK_SIZE = 1024 * 1024
+
+
+class VfbSource:
+    """
+    The location of the glyphs in the VFB file a font was read from.
+    """
+
+    __slots__ = ["mtime_ns", "num_masters", "path", "size", "spans"]
+
+    def __init__(
+        self,
+        path: Path,
+        size: int,
+        mtime_ns: int,
+        num_masters: int,
+        spans: list[tuple[int, int]],
+    ) -> None:
+        """
+        Describe a VFB file.
+
+        Args:
+            path (Path): The path of the VFB file.
+            size (int): The file size in bytes.
+            mtime_ns (int): The modification time of the file in nanoseconds.
+            num_masters (int): The number of masters of the font in the file.
+            spans (list[tuple[int, int]]): The start and end offset of the entries of
+                each glyph in the file, by glyph index.
+        """
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.num_masters = num_masters
+        self.spans = spans
+
+    def __repr__(self) -> str:
+        return f"<VfbSource: '{self.path}', {len(self.spans)} glyphs>"
+
+    def __copy__(self) -> "VfbSource":
+        # The object is never modified, so copies may share it.
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "VfbSource":
+        return self
+
+    def is_current(self) -> bool:
+        """
+        Return whether the file has not been modified since it was described.
+
+        Returns:
+            bool: True if the file still has the same size and modification time.
+        """
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+def get_vfb_source(vfb_path: Path, vfb: "Vfb") -> VfbSource | None:
+    """
+    Describe the location of the glyphs in a VFB file.
+
+    Args:
+        vfb_path (Path): The path of the VFB file.
+        vfb (Vfb): The Vfb that was read from the file.
+
+    Returns:
+        VfbSource | None: The description, or None if the locations can't be determined
+            reliably.
+    """
+    spans: list[tuple[int, int]] = []
+    with open(vfb_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        VfbHeader().read(f)
+        offset = f.tell()
+        with mmap(f.fileno(), 0, access=ACCESS_READ) as data:
+            start: int | None = None
+            for e in vfb.entries:
+                # Read the entry header
+                if offset + 4 > stat.st_size:
+                    return None
+
+                raw_id, size = unpack_from("<HH", data, offset)
+                if raw_id & 0x8000:
+                    if offset + 6 > stat.st_size:
+                        return None
+
+                    size = unpack_from("<I", data, offset + 2)[0]
+                    header_size = 6
+                else:
+                    header_size = 4
+                key = raw_id & ~0x8000
+                if key != e.id:
+                    logger.info(f"Can't determine the glyph locations: {vfb_path}")
+                    return None
+
+                if key == F.MMKernPair:
+                    # The size is not stored correctly, see `VfbEntry.read()`
+                    size = 8 + vfb.num_masters * 2
+
+                if key == G.Glyph:
+                    if start is not None:
+                        spans.append((start, offset))
+                    start = offset
+                elif start is not None and key not in glyph_entry_keys:
+                    spans.append((start, offset))
+                    start = None
+                offset += header_size + size
+            if start is not None:
+                spans.append((start, offset))
+
+    return VfbSource(vfb_path, stat.st_size, stat.st_mtime_ns, vfb.num_masters, spans)
+
+
+class IncrementalVfbWriter(FontToVfbWriter):
+    """
+    Write a font to a VFB file, copying the unmodified glyphs from the VFB file the font
+    was read from.
+    """
+
+    def __init__(self, font: "Font", source: VfbSource) -> None:
+        """
+        Instantiate a writer that can write the `font` into a VFB file.
+
+        Args:
+            font (Font): The source object of the data.
+            source (VfbSource): The description of the VFB file the font was read from.
+                The number of masters must match that of the font.
+        """
+        self.source = source
+        # The spans of the source file to insert before the entry at the index of the
+        # key
+        self.spans: dict[int, list[tuple[int, int]]] = {}
+        # The glyphs that are copied from the source, with their source glyph index and
+        # the key and index of the span they are part of
+        self.copied: list[tuple[Any, int, int, int]] = []
+        super().__init__(font)
+
+    def compile_glyph(self, i: int, item: Any) -> None:
+        n = self.font.glyphs.fake_get_source_index(item)
+        if n < 0:
+            super().compile_glyph(i, item)
+            return
+
+        start, end = self.source.spans[n]
+        pos = len(self.vfb.entries)
+        spans = self.spans.setdefault(pos, [])
+        if spans and spans[-1][1] == start:
+            # Extend the previous span
+            spans[-1] = (spans[-1][0], end)
+        else:
+            spans.append((start, end))
+        self.copied.append((item, n, pos, len(spans) - 1))
+
+    def write(self, vfb_path: Path) -> None:
+        """
+        Write the VFB to `vfb_path` atomically. Afterwards, the font is described as
+        being read from `vfb_path`, so it can be saved incrementally again.
+
+        Args:
+            vfb_path (Path): The file path to which to write the VFB data.
+        """
+        tmp_path = vfb_path.with_name(f"{vfb_path.name}.{os.getpid()}.tmp")
+        # The offset of each span in the output file
+        offsets: dict[tuple[int, int], int] = {}
+        num_entries = len(self.vfb.entries)
+        try:
+            with open(self.source.path, "rb") as src, open(tmp_path, "wb") as out:
+                header = self.vfb.header
+                header.compile()
+                assert isinstance(header.data, bytes)
+                out.write(header.data)
+                for pos in range(num_entries + 1):
+                    for k, span in enumerate(self.spans.get(pos, [])):
+                        offsets[pos, k] = out.tell()
+                        self._copy(src, out, *span)
+                    if pos < num_entries:
+                        entry = self.vfb.entries[pos]
+                        entry.compile()
+                        out.write(entry.header)
+                        if entry.data is not None:
+                            assert isinstance(entry.data, bytes)
+                            out.write(entry.data)
+            # The target may be the source, whose data must not be mapped anymore
+            release_mapped_file(vfb_path, self.vfb)
+            os.replace(tmp_path, vfb_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Describe the new file. Only the glyphs that were copied are still unmodified.
+        spans = []
+        glyphs = self.font.glyphs
+        glyphs.fake_clear_source_indices()
+        for item, n, pos, k in self.copied:
+            start, end = self.source.spans[n]
+            delta = offsets[pos, k] - self.spans[pos][k][0]
+            glyphs.fake_set_source_index(item, len(spans))
+            spans.append((start + delta, end + delta))
+        stat = vfb_path.stat()
+        self.font._fake_vfb_source = VfbSource(
+            vfb_path, stat.st_size, stat.st_mtime_ns, self.vfb.num_masters, spans
+        )
+
+    def _copy(self, src: Any, out: Any, start: int, end: int) -> None:
+        src.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = src.read(min(remaining, CHUNK_SIZE))
+            if not data:
+                raise EOFError(f"Source file is truncated: {self.source.path}")
+
+            out.write(data)
+            remaining -= len(data)
+
+
+def save_incremental(font: "Font", vfb_path: Path) -> bool:
+    """
+    Save a font incrementally if possible, or completely otherwise. In both cases, the
+    file is written atomically.
+
+    Args:
+        font (Font): The font.
+        vfb_path (Path): The file path to which to write the VFB data.
+
+    Returns:
+        bool: Whether the font could be saved incrementally.
+    """
+    source = font._fake_vfb_source
+    if (
+        source is not None
+        and source.num_masters == font._masters_count
+        and source.is_current()
+    ):
+        IncrementalVfbWriter(font, source).write(vfb_path)
+        return True
+
+    logger.info(f"Can't save incrementally, saving the complete font: {vfb_path}")
+    FontToVfbWriter(font).write(vfb_path)
+
+    # We don't know where the glyphs are in the new file
+    font._fake_vfb_source = None
+    font.glyphs.fake_clear_source_indices()
+    return False
@@ -0,0 +1,280 @@
+import logging
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import unpack_from
+from typing import TYPE_CHECKING, Any
+from weakref import WeakSet
+
+from vfbLib.enum import F, T
+from vfbLib.helpers import int32_size
+from vfbLib.vfb.entry import VfbEntry
+from vfbLib.vfb.header import VfbHeader
+from vfbLib.vfb.vfb import Vfb
+
+if TYPE_CHECKING:
+    from vfbLib.typing import EntryDecompiled
+
+
+__doc__ = """
+Memory-mapped reading of VFB files.
+
+`read_mapped_vfb()` maps the VFB file into memory and scans the entry headers itself,
+instead of reading the file through `Vfb.read()`. The raw data of each entry, except
+for small ones, is a `memoryview` slice of the mapped file, which is copied to a `bytes`
+object only when the entry is decompiled or written. Entries which are never accessed, e.g. the
+background images of glyphs that are not accessed in a lazily opened font, are never
+copied into memory.
+
+The mapping stays open as long as any entry data refers to it. The file must not be
+modified in place meanwhile. Windows doesn't allow replacing a mapped file either, so
+before a VFB file is replaced, `release_mapped_file()` copies the data that is still
+mapped from it into memory and closes its mappings. Objects that keep mapped data beyond
+reading, e.g. the glyphs of a lazily opened font, register with
+`register_mapped_data()`.
+"""
+
+
+logger = logging.getLogger(__name__)
+
+
+# The type of raw entry data
+RawData = bytes | memoryview
+
+# Smaller entries are copied when reading, because a memoryview needs more memory than
+# a small bytes object
+MIN_MAPPED_SIZE = 256
+
+# The mappings of each file, and the objects holding data from them, by resolved path
+_mappings: dict[Path, WeakSet[mmap]] = {}
+_holders: dict[Path, WeakSet[Any]] = {}
+
+
+class MappedVfbEntry(VfbEntry):
+    """
+    A VfbEntry whose raw data is a slice of a memory-mapped file.
+    """
+
+    def __init__(self, parent: Vfb, view: memoryview, eid: int) -> None:
+        """
+        Make an entry from the raw data in `view`.
+
+        Args:
+            parent (Vfb): The parent object.
+            view (memoryview): The raw entry data.
+            eid (int): The entry key.
+        """
+        super().__init__(parent, eid=eid)
+        self._view: memoryview | None = view
+
+    @property
+    def data(self) -> "bytes | EntryDecompiled | None":
+        if self._view is not None:
+            # Don't keep the copy, so the raw data is only held by the mapping
+            return bytes(self._view)
+
+        return self._data
+
+    @data.setter
+    def data(self, value: "bytes | EntryDecompiled | None") -> None:
+        self._view = None
+        self._data = value
+
+    @property
+    def raw(self) -> RawData | None:
+        """
+        The raw entry data without copying it, or None if the entry has been
+        decompiled.
+
+        Returns:
+            RawData | None: The raw data.
+        """
+        if self._view is not None:
+            return self._view
+
+        if isinstance(self._data, bytes):
+            return self._data
+
+        return None
+
+    @property
+    def size(self) -> int:
+        if self._view is not None:
+            return len(self._view)
+
+        return super().size
+
+    def release(self) -> None:
+        """
+        Copy the raw data into memory, so the entry no longer refers to the mapping.
+        """
+        if self._view is not None:
+            self.data = bytes(self._view)
+
+    def compile(self) -> bool:
+        if self._view is not None:
+            # Is already compiled
+            return True
+
+        return super().compile()
+
+
+def get_raw_data(entry: VfbEntry) -> RawData | None:
+    """
+    Return the raw data of an entry without copying it.
+
+    Args:
+        entry (VfbEntry): The entry.
+
+    Returns:
+        RawData | None: The raw data, or None if the entry has been decompiled.
+    """
+    if isinstance(entry, MappedVfbEntry):
+        return entry.raw
+
+    if isinstance(entry.data, bytes):
+        return entry.data
+
+    return None
+
+
+def add_raw_entry(vfb: Vfb, key: int, data: RawData) -> None:
+    """
+    Add an entry with raw data to a Vfb, without copying the data.
+
+    Args:
+        vfb (Vfb): The Vfb.
+        key (int): The entry key.
+        data (RawData): The raw data.
+    """
+    if isinstance(data, memoryview):
+        vfb.add_entry(MappedVfbEntry(vfb, data, key))
+    else:
+        e = VfbEntry(vfb, eid=key)
+        e.data = data
+        vfb.add_entry(e)
+
+
+def read_mapped_vfb(vfb_path: Path) -> Vfb:
+    """
+    Read a VFB file without decompiling it, like `Vfb(vfb_path)`, but memory-map the
+    file instead of copying the entry data.
+
+    Args:
+        vfb_path (Path): The path of the VFB file.
+
+    Returns:
+        Vfb: The Vfb.
+    """
+    vfb = Vfb(timing=False)
+    vfb.vfb_path = vfb_path
+    with open(vfb_path, "rb") as f:
+        vfb.header = VfbHeader()
+        vfb.header.read(f)
+        offset = f.tell()
+        # The file descriptor may be closed, the mapping keeps its own
+        mapping = mmap(f.fileno(), 0, access=ACCESS_READ)
+        view = memoryview(mapping)
+    _mappings.setdefault(vfb_path.resolve(), WeakSet()).add(mapping)
+
+    end = len(view)
+    while offset + 4 <= end:
+        # Read the entry header, see `VfbEntry.read()`
+        raw_id, size = unpack_from("<HH", view, offset)
+        if raw_id & 0x8000:
+            # Uses uint32 for data length
+            size = unpack_from("<I", view, offset + 2)[0]
+            offset += 6
+        else:
+            offset += 4
+        key = raw_id & ~0x8000
+        if key == F.MMKernPair:
+            # The size is not stored correctly, see `VfbEntry.read()`
+            size = 2 * int32_size + vfb.num_masters * 2
+
+        if size < MIN_MAPPED_SIZE:
+            entry = VfbEntry(vfb, eid=key)
+            entry.data = bytes(view[offset : offset + size])
+        else:
+            entry = MappedVfbEntry(vfb, view[offset : offset + size], key)
+        offset += size
+        _read_global_entry(vfb, entry)
+        vfb.entries.append(entry)
+        if key == F.BlockFileDataEnd:
+            break
+
+    return vfb
+
+
+def register_mapped_data(vfb_path: Path, holder: Any) -> None:
+    """
+    Register an object that keeps raw data which may be mapped from a VFB file. Before
+    the file is replaced, the object's `fake_release_mapping()` method is called to
+    copy the data into memory, see `release_mapped_file()`.
+
+    Args:
+        vfb_path (Path): The path of the VFB file.
+        holder (Any): The object.
+    """
+    _holders.setdefault(vfb_path.resolve(), WeakSet()).add(holder)
+
+
+def release_mapped_file(vfb_path: Path, vfb: Vfb | None = None) -> None:
+    """
+    Copy the data that is still mapped from a VFB file into memory, and close the
+    mappings of the file, so it can be replaced.
+
+    Args:
+        vfb_path (Path): The path of the VFB file.
+        vfb (Vfb | None, optional): A Vfb whose entries may be mapped from the file,
+            e.g. the one that is being written. Defaults to None.
+    """
+    key = vfb_path.resolve()
+    holders = _holders.pop(key, None)
+    mappings = _mappings.pop(key, None)
+    if not mappings:
+        return
+
+    if vfb is not None:
+        _release_entries(vfb, mappings)
+    for holder in list(holders or ()):
+        holder.fake_release_mapping()
+    for mapping in list(mappings):
+        try:
+            mapping.close()
+        except BufferError:
+            logger.warning(
+                f"The file is still mapped and may not be replaceable: {vfb_path}"
+            )
+
+
+def _release_entries(vfb: Vfb, mappings: WeakSet[mmap]) -> None:
+    # Copy the data of the entries that refer to one of the mappings. This is a
+    # separate function, so no reference to the data outlives it.
+    for e in vfb.entries:
+        if isinstance(e, MappedVfbEntry) and e._view is not None:
+            if e._view.obj in mappings:
+                e.release()
+
+
+def _read_global_entry(vfb: Vfb, entry: VfbEntry) -> None:
+    # Store the information that is needed to decompile other entries, like
+    # `Vfb.read_stream()` does
+    data: Any
+    match entry.id:
+        case F.FLVersion:
+            entry.decompile()
+            if (data := entry.data) is not None:
+                vfb.writer_platform = data["platform"]
+                if vfb.force_unicode_strings or vfb.writer_platform == "macos":
+                    vfb.encoding = "utf-8"
+                else:
+                    vfb.encoding = "cp1252"
+        case F.MasterCount:
+            entry.decompile()
+            if (data := entry.data) is not None:
+                vfb.num_masters = data
+        case T.TrueTypeStems:
+            entry.decompile()
+            if (data := entry.data) is not None:
+                vfb.ttStemsV_count = len(data.get("ttStemsV", []))
+                vfb.ttStemsH_count = len(data.get("ttStemsH", []))
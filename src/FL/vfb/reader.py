@@ -1,5 +1,9 @@
 import logging
-from typing import TYPE_CHECKING
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_all_start_methods, get_context
+from typing import TYPE_CHECKING, Any
 
 from vfbLib.enum import F, G, M, T
 from vfbLib.vfb.vfb import Vfb
@@ -9,8 +13,12 @@ from FL.objects.Encoding import Encoding
 from FL.objects.EncodingRecord import EncodingRecord
 from FL.objects.Glyph import Glyph
 from FL.objects.NameRecord import NameRecord
+from FL.vfb.deferred import DeferredGlyph, get_parse_context
+from FL.vfb.incremental import VfbSource, get_vfb_source
+from FL.vfb.mapped import get_raw_data, read_mapped_vfb, register_mapped_data
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
     from pathlib import Path
 
     from FL.objects.Font import Font
@@ -107,6 +115,154 @@ ttinfo_mapping_direct = {
     T.hhea_descender,
 }
 
+# Entries which are stored in a private attribute of the font
+font_mapping_private = {
+    F.xuid: "_xuid",
+    F.MMEncType: "_mm_enc_type",
+    F.MasterCount: "_masters_count",
+    F.License: "_license",
+    F.LicenseURL: "_license_url",
+    F.PostScriptHintingOptions: "_postscript_hinting_options",
+    F.Collection: "_collection",
+    F.unicoderanges: "unicoderanges",
+    F.SampleText: "_sample_text",
+    F.CustomCMAPs: "_custom_cmaps",
+    F.PCLTTable: "_pclt_table",
+    F.ExportPCLTTable: "_export_pclt_table",
+    F.FontFlags: "_font_flags",
+    F.AxisCount: "_axis_count",
+    F.AnisotropicInterpolationMappings: "_anisotropic_interpolation_mappings",
+    F.AxisMappingsCount: "_axis_mappings_count",
+    F.AxisMappings: "_axis_mappings",
+    F.PrimaryInstanceLocations: "_primary_instance_locations",
+    F.PrimaryInstances: "_primary_instances",
+    F.FontOptions: "_ot_export_options",
+    F.ExportOptions: "_export_options",
+    F.MappingMode: "_mapping_mode",
+}
+
+# Entries which are stored in a private attribute of the font's TTInfo
+ttinfo_mapping_private = {
+    T.stemsnaplimit: "_stemsnaplimit",
+    T.zoneppm: "_zoneppm",
+    T.codeppm: "_codeppm",
+    T.dropoutppm: "_dropoutppm",
+    T.MeasurementLine: "_measurement_line",
+}
+
+# Entries which only mark the structure of the VFB
+block_markers = {
+    F.BlockFileDataStart,
+    F.BlockFontStart,
+    F.FLVersion,
+    F.BlockNamesStart,
+    F.BlockNamesEnd,
+    F.BlockFontInfoStart,
+    F.BlockFontInfoEnd,
+    F.BlockMMFontInfoStart,
+    F.BlockMMFontInfoEnd,
+    F.BlockMMKerningStart,
+    F.BlockMMKerningEnd,
+    F.BlockFontEnd,
+    F.BlockFileDataEnd,
+}
+
+# Groups of entries which can be skipped or kept undecoded when reading a VFB, by the
+# group name used in `Font.Open()`
+data_groups: dict[str, frozenset[int]] = {
+    "image": frozenset({G.image}),
+    "bitmaps": frozenset({G.Bitmaps}),
+    "sketch": frozenset({G.Sketch}),
+    "mask": frozenset({G.mask, G.MaskMetrics, G.MaskMetricsMM}),
+    "tth": frozenset(T),
+}
+
+
+def get_group_keys(groups: "Iterable[str] | None") -> frozenset[int]:
+    """
+    Return the entry keys of data groups, see `data_groups`.
+
+    Args:
+        groups (Iterable[str] | None): The group names.
+
+    Raises:
+        ValueError: If a group name is unknown.
+
+    Returns:
+        frozenset[int]: The entry keys.
+    """
+    keys: set[int] = set()
+    for group in groups or ():
+        if group not in data_groups:
+            raise ValueError(
+                f"Unknown data group: '{group}', must be one of {sorted(data_groups)}"
+            )
+
+        keys |= data_groups[group]
+    return frozenset(keys)
+
+
+def _get_setter(obj: Any, attr: str) -> "Callable[[Any], None]":
+    """
+    Return a function which sets the attribute `attr` of `obj` to its argument. If the
+    attribute is a property or slot, its setter is resolved up front.
+
+    Args:
+        obj (Any): The object.
+        attr (str): The attribute name.
+
+    Raises:
+        AttributeError: If the object has no such attribute.
+
+    Returns:
+        Callable[[Any], None]: The setter.
+    """
+    if not hasattr(obj, attr):
+        raise AttributeError(f"Unknown {type(obj).__name__} attribute: {attr}")
+
+    descriptor = getattr(type(obj), attr, None)
+    if hasattr(descriptor, "__set__"):
+        return partial(descriptor.__set__, obj)
+
+    return partial(setattr, obj, attr)
+
+
+# The minimum number of glyphs to decompile in worker processes, for fewer glyphs it
+# isn't worth starting them
+MIN_PARALLEL_GLYPHS = 200
+
+# The Vfb of the current worker process, see `VfbToFontReader._decompile_parallel()`
+_worker_vfb: Vfb | None = None
+
+
+def _init_worker(vfb: Vfb) -> None:
+    global _worker_vfb
+    _worker_vfb = vfb
+
+
+def _decompile_entries(span: tuple[int, int]) -> list[Any]:
+    # Return the decompiled data of the entries in the span, or None for entries which
+    # are not decompiled
+    assert _worker_vfb is not None
+    start, end = span
+    results: list[Any] = []
+    for e in _worker_vfb.entries[start:end]:
+        if e.id in _worker_vfb.drop_keys or get_raw_data(e) is None:
+            results.append(None)
+        else:
+            e.decompile()
+            results.append(e.data)
+    return results
+
+
+def _ignore_entry(data: Any) -> None:
+    pass
+
+
+def _drop_mm_kern_pair(data: Any) -> None:
+    # FL3 MM kern pair
+    logger.warning(f"Dropping FL3 MM kerning pair: {data}")
+
 
 class VfbToFontReader:
     """
@@ -114,14 +270,40 @@ class VfbToFontReader:
     know...) object (low-level representation of the binary VFB format)
     """
 
-    def __init__(self, vfb_path: "Path | None") -> None:
+    def __init__(
+        self,
+        vfb_path: "Path | None",
+        lazy: bool = False,
+        skip: "Iterable[str] | None" = None,
+        keep_raw: "Iterable[str] | None" = None,
+        workers: int | None = 1,
+    ) -> None:
         """
         Instantiate a reader for the VFB file at `vfb_path`.
 
         Args:
             vfb_path (Path): The file path from which to load the VFB data.
+            lazy (bool, optional): Whether to defer decoding the glyph entries until
+                each glyph is accessed for the first time. Defaults to False.
+            skip (Iterable[str] | None, optional): The data groups to leave out, see
+                `data_groups`. Defaults to None.
+            keep_raw (Iterable[str] | None, optional): The data groups to keep
+                undecoded, so they are written back unchanged when the font is saved.
+                Defaults to None.
+            workers (int | None, optional): The number of worker processes in which to
+                decompile the glyph entries, see `_decompile_parallel()`. Defaults to
+                1, which means they are decompiled in the current process. None means
+                the number of CPUs. Not used in lazy mode.
+
+        Raises:
+            ValueError: If a group name is unknown.
         """
         self.vfb_path = vfb_path
+        self.lazy = lazy
+        self.skip_keys = get_group_keys(skip)
+        self.raw_keys = get_group_keys(keep_raw) - self.skip_keys
+        self.workers = workers
+        self.source: VfbSource | None = None
         self.nametable = StandardNametable()
 
     def read(self, font: "Font") -> None:
@@ -134,6 +316,16 @@ class VfbToFontReader:
         self.font = font
         self._open_vfb()
         self._read_into_font()
+        self._set_source()
+
+    def close(self) -> None:
+        """
+        Release the entries of the VFB that was read. The entries refer to the Vfb, so
+        it would only be freed by the garbage collector, and keep the memory-mapped file
+        open until then (see `FL.vfb.mapped`).
+        """
+        if (vfb := getattr(self, "vfb", None)) is not None:
+            vfb.entries.clear()
 
     def read_from_obj(self, vfb: Vfb, font: "Font") -> None:
         """
@@ -145,15 +337,99 @@ class VfbToFontReader:
         """
         self.font = font
         self.vfb = vfb
-        self.vfb.decompile()
+        self._decompile_vfb()
         self._read_into_font()
 
     def _open_vfb(self) -> None:
         """
         Open the VFB from the current `vfb_path` and decompile it.
         """
-        self.vfb = Vfb(self.vfb_path, timing=False)
-        self.vfb.decompile()
+        assert self.vfb_path is not None
+        self.vfb = read_mapped_vfb(self.vfb_path)
+        self.vfb.drop_keys = set(self.skip_keys | self.raw_keys)
+        self.source = get_vfb_source(self.vfb_path, self.vfb)
+        self._decompile_vfb()
+
+    def _set_source(self) -> None:
+        """
+        Remember where the glyphs of the current `font` are in the VFB file, so the
+        font can be saved incrementally.
+        """
+        font = self.font
+        glyphs = font.glyphs
+        glyphs.fake_clear_source_indices()
+        source = self.source
+        if source is not None and len(source.spans) != len(glyphs.data):
+            source = None
+        font._fake_vfb_source = source
+        if source is not None:
+            for n, item in enumerate(glyphs.data):
+                glyphs.fake_set_source_index(item, n)
+
+    def _decompile_vfb(self) -> None:
+        """
+        Decompile the current `vfb`. In lazy mode, only the header is decompiled here,
+        the entries are decompiled one by one in `_read_into_font()`.
+        """
+        if self.lazy:
+            self.vfb.header.decompile()
+        elif self.workers == 1 or not self._decompile_parallel():
+            self.vfb.decompile()
+
+    def _decompile_parallel(self) -> bool:
+        """
+        Decompile the current `vfb`, with the glyph entries split into chunks of whole
+        glyphs that are decompiled in a pool of worker processes. The font-level
+        entries are decompiled in the current process meanwhile.
+
+        The workers are forked, so they inherit the raw entries instead of receiving a
+        pickled copy. Only the decompiled data is sent back; building the glyph objects
+        from it happens in the current process, because sending back glyph objects
+        would take longer than building them.
+
+        Returns:
+            bool: False if the entries were not decompiled, because processes can't be
+                forked, or there are too few glyphs to make it worthwhile.
+        """
+        if "fork" not in get_all_start_methods():
+            logger.info("Can't fork worker processes, decompiling glyphs serially")
+            return False
+
+        workers = self.workers or os.cpu_count() or 1
+        entries = self.vfb.entries
+        # The spans of entry indices of each glyph
+        glyph_spans: list[tuple[int, int]] = []
+        for i, e in enumerate(entries):
+            if e.id == G.Glyph:
+                glyph_spans.append((i, i + 1))
+            elif e.id in glyph_mapping and glyph_spans and glyph_spans[-1][1] == i:
+                glyph_spans[-1] = (glyph_spans[-1][0], i + 1)
+        if workers < 2 or len(glyph_spans) < MIN_PARALLEL_GLYPHS:
+            return False
+
+        # Several chunks per worker, so they finish at about the same time
+        size = -(-len(glyph_spans) // (workers * 4))
+        chunks = [
+            (glyph_spans[k][0], glyph_spans[min(k + size, len(glyph_spans)) - 1][1])
+            for k in range(0, len(glyph_spans), size)
+        ]
+        in_chunks = {i for start, end in chunks for i in range(start, end)}
+        self.vfb.header.decompile()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.vfb,),
+        ) as executor:
+            results = executor.map(_decompile_entries, chunks)
+            for i, e in enumerate(entries):
+                if i not in in_chunks and e.id not in self.vfb.drop_keys:
+                    e.decompile()
+            for (start, end), data_list in zip(chunks, results):
+                for e, data in zip(entries[start:end], data_list):
+                    if data is not None:
+                        e.data = data
+        return True
 
     def _read_into_font(self) -> None:
         """
@@ -163,185 +439,269 @@ class VfbToFontReader:
             AttributeError: When an unknown font attribute is encountered.
         """
         glyph: Glyph | None = None
-        gids: dict[int, str] = {}
+        deferred: DeferredGlyph | None = None
 
         font = self.font
-        font.fake_clear_defaults()
+        self._prepare_font()
+        context = get_parse_context(self.vfb)
+        # Deferred glyphs keep these entries undecoded when they are loaded
+        context.drop_keys = set(self.raw_keys)
 
         for e in self.vfb.entries:
             key = e.id
             assert isinstance(key, int)
-            data = e.data
+            if key in self.skip_keys:
+                continue
 
-            if key in font_mapping_direct:
-                attr = F(key).name
-                if hasattr(font, attr):
-                    setattr(font, attr, data)
+            raw = get_raw_data(e)
+            if (
+                key in self.raw_keys
+                and raw is not None
+                and not (self.lazy and key in glyph_mapping)
+            ):
+                if key in glyph_mapping:
+                    assert glyph is not None, "Glyph must exist before adding data"
+                    glyph._fake_raw_entries[key] = bytes(raw)
                 else:
-                    raise AttributeError(f"Unknown font attribute: {attr}")
+                    font._fake_raw_entries.append((key, bytes(raw)))
                 continue
 
-            if key in glyph_mapping:
+            if self.lazy and raw is not None:
+                # Keep the raw glyph data, it is decompiled on first access
+                if key == G.Glyph:
+                    if glyph is not None:
+                        font.glyphs.append(glyph)
+                        glyph = None
+                    deferred = DeferredGlyph(context, raw)
+                    if self.vfb_path is not None:
+                        register_mapped_data(self.vfb_path, deferred)
+                    font.glyphs.data.append(deferred)
+                    continue
+
+                if key in glyph_mapping:
+                    assert deferred is not None, "Glyph must exist before adding data"
+                    deferred.add_entry(key, raw)
+                    continue
+
+                if e.id not in self.vfb.drop_keys:
+                    e.decompile()
+
+            data = e.data
+
+            if key == G.Glyph:
+                # Append the current glyph
+                if glyph is not None:
+                    font.glyphs.append(glyph)
+                glyph = self._new_glyph(data)
+                deferred = None
+            elif key in glyph_mapping:
                 assert glyph is not None, "Glyph must exist before adding data"
                 glyph.fake_deserialize(key, data)
-                continue
+            else:
+                self._read_font_entry(key, data)
 
-            if key in (T.cvt, T.prep, T.fpgm):
-                font.ttinfo.fake_set_binary(T(key).name, data)
-                continue
+        if glyph is not None:
+            font.glyphs.append(glyph)
 
-            if key in (
-                T.TrueTypeStems,
-                T.TrueTypeStemPPEMs1,
-                T.TrueTypeStemPPEMs2And3,
-                T.TrueTypeStemPPEMs,
-            ):
-                font.ttinfo.fake_deserialize_stems(data)
-                continue
+        self._finish_font()
 
-            if key in ttinfo_mapping_direct:
-                setattr(font.ttinfo, T(key).name, data)
-                continue
+    def iter_glyphs(self, font: "Font") -> "Iterator[Glyph]":
+        """
+        Read the data from the VFB into a font, except for the glyphs. They are built
+        one at a time and yielded instead of being added to the font, so only the
+        current glyph is kept in memory.
 
-            if key in (
-                F.BlockFileDataStart,
-                F.BlockFontStart,
-                F.FLVersion,
-                F.BlockNamesStart,
-                F.BlockNamesEnd,
-                F.BlockFontInfoStart,
-                F.BlockFontInfoEnd,
-                F.BlockMMFontInfoStart,
-                F.BlockMMFontInfoEnd,
-                F.BlockMMKerningStart,
-                F.BlockMMKerningEnd,
-                F.BlockFontEnd,
-                F.BlockFileDataEnd,
-            ):
-                continue
+        The font-level data that precedes the glyphs in the VFB, e.g. the font info and
+        master data, is available in `font` when the first glyph is yielded. Data that
+        follows the glyphs, e.g. OpenType features and classes, is available after the
+        iteration has finished.
+
+        The yielded glyphs don't have a parent. The memory-mapped VFB file is closed
+        when the iteration has finished or the iterator is closed.
+
+        Args:
+            font (Font): The target object of the font-level data.
 
-            match key:
-                case F.xuid:
-                    font._xuid = data
-                case F.EncodingDefault:
-                    # Where is this used?
-                    gid, glyph_name = data
-                    e = EncodingRecord()
-                    e.name = glyph_name
-                    font._encoding_default.append(e)
-                case F.Encoding:
-                    gid, glyph_name = data
-                    gids[gid] = glyph_name
-                case F.MMEncType:
-                    font._mm_enc_type = data
-                case F.MasterCount:
-                    font._masters_count = data
-                case F.weight_vector:
-                    font.weight_vector._weights = data
-                case F.License:
-                    font._license = data
-                case F.LicenseURL:
-                    font._license_url = data
-                case F.PostScriptHintingOptions:
-                    font._postscript_hinting_options = data
-                case F.Collection:
-                    font._collection = data
-                case T.gasp:
-                    font.ttinfo.fake_deserialize_gasp(data)
-                case F.ttinfo:
-                    font.ttinfo.fake_deserialize(data)
-                case T.vdmx:
-                    font.ttinfo.fake_deserialize_vdmx(data)
-                case T.TrueTypeZones:
-                    font.ttinfo.fake_deserialize_zones(data)
-                case F.unicoderanges:
-                    font.unicoderanges = data
-                case T.stemsnaplimit:
-                    font.ttinfo._stemsnaplimit = data
-                case T.zoneppm:
-                    font.ttinfo._zoneppm = data
-                case T.codeppm:
-                    font.ttinfo._codeppm = data
-                case T.dropoutppm:
-                    font.ttinfo._dropoutppm = data
-                case T.MeasurementLine:
-                    font.ttinfo._measurement_line = data
-                case T.TrueTypeZoneDeltas:
-                    font.ttinfo.fake_deserialize_zone_deltas(data)
-                case F.SampleText:
-                    font._sample_text = data
-                case F.fontnames:
-                    assert isinstance(data, list)
-                    for nr in data:
-                        font.fontnames.append(NameRecord(tuple(nr)))
-                case F.CustomCMAPs:
-                    font._custom_cmaps = data
-                case F.PCLTTable:
-                    font._pclt_table = data
-                case F.ExportPCLTTable:
-                    font._export_pclt_table = data
-                case F.FontFlags:
-                    font._font_flags = data
-                case F.TrueTypeTable:
-                    font.truetypetables.append(data)
-                case F.MetricsClassFlags:
-                    font._classes.fake_deserialize_metrics_class_flags(data)
-                case F.KerningClassFlags:
-                    font._classes.fake_deserialize_kerning_class_flags(data)
-                case F.features:
-                    font.fake_deserialize_features(data)
-                case F.GlyphClass:
-                    font._classes.fake_deserialize_class(data)
-                case F.AxisCount:
-                    font._axis_count = data
-                case F.AxisName:
-                    font.fake_deserialize_axis(data)
-                case F.AnisotropicInterpolationMappings:
-                    font._anisotropic_interpolation_mappings = data
-                case F.AxisMappingsCount:
-                    font._axis_mappings_count = data
-                case F.AxisMappings:
-                    font._axis_mappings = data
-                case M.MasterName:
-                    font._master_names.append(data)
-                case M.MasterLocation:
-                    font._master_locations.append(data)
-                case F.PrimaryInstanceLocations:
-                    font._primary_instance_locations = data
-                case F.PrimaryInstances:
-                    font._primary_instances = data
-                case M.PostScriptInfo:
-                    font._master_ps_infos.append(data)
-                case F.GlobalGuides:
-                    font.fake_deserialize_guides(data)
-                case F.GlobalGuideProperties:
-                    font.fake_deserialize_guide_properties(data)
-                case F.GlobalMask:
-                    font.fake_deserialize_global_mask(data)
-                case G.Glyph:
-                    # Append the current glyph
+        Yields:
+            Iterator[Glyph]: The glyphs in the order of the VFB.
+        """
+        assert self.vfb_path is not None
+        self.font = font
+        self.vfb = read_mapped_vfb(self.vfb_path)
+        self.vfb.drop_keys = set(self.skip_keys | self.raw_keys)
+        self.vfb.header.decompile()
+        glyph: Glyph | None = None
+        font = self.font
+        self._prepare_font()
+
+        try:
+            for e in self.vfb.entries:
+                key = e.id
+                assert isinstance(key, int)
+                if key in self.skip_keys:
+                    continue
+
+                raw = get_raw_data(e)
+                if key in self.raw_keys and raw is not None:
+                    if key in glyph_mapping:
+                        assert glyph is not None, "Glyph must exist before adding data"
+                        glyph._fake_raw_entries[key] = bytes(raw)
+                    else:
+                        font._fake_raw_entries.append((key, bytes(raw)))
+                    continue
+
+                if raw is not None:
+                    e.decompile()
+                data = e.data
+                # Release the entry data, we don't need it anymore
+                e.data = None
+
+                if key == G.Glyph:
                     if glyph is not None:
-                        font.glyphs.append(glyph)
-                    # Make a new glyph
-                    logger.debug(f"Adding Glyph: '{data.get('name')}', {key}")
-                    glyph = Glyph()
-                    # Add the data
-                    glyph.fake_deserialize(G.Glyph, data)
-                case F.FontOptions:
-                    font._ot_export_options = data
-                case F.ExportOptions:
-                    font._export_options = data
-                case F.MappingMode:
-                    font._mapping_mode = data
-                case F.MMKernPair:
-                    # FL3 MM kern pair
-                    logger.warning(f"Dropping FL3 MM kerning pair: {data}")
-                case _:
-                    logger.error(f"Unhandled VFB entry: {key}")
+                        yield glyph
+                    glyph = self._new_glyph(data)
+                elif key in glyph_mapping:
+                    assert glyph is not None, "Glyph must exist before adding data"
+                    glyph.fake_deserialize(key, data)
+                else:
+                    if glyph is not None:
+                        yield glyph
+                        glyph = None
+                    self._read_font_entry(key, data)
 
-        if glyph is not None:
-            font.glyphs.append(glyph)
+            if glyph is not None:
+                yield glyph
+
+            self._finish_font()
+        finally:
+            self.close()
+
+    def _new_glyph(self, data: Any) -> Glyph:
+        """
+        Make a new glyph from the data of a G.Glyph entry.
+
+        Args:
+            data (Any): The decompiled entry data.
+
+        Returns:
+            Glyph: The glyph.
+        """
+        logger.debug(f"Adding Glyph: '{data.get('name')}'")
+        glyph = Glyph()
+        glyph.fake_deserialize(G.Glyph, data)
+        return glyph
+
+    def _prepare_font(self) -> None:
+        """
+        Prepare the current `font` for reading the entries into it.
+        """
+        self.font.fake_clear_defaults()
+        self._gids: dict[int, str] = {}
+        self._font_entry_handlers = self._get_font_entry_handlers()
 
+    def _get_font_entry_handlers(self) -> dict[int, "Callable[[Any], None]"]:
+        """
+        Return a table of the handlers for font-level entries of the current `font` by
+        entry key. Each handler takes the decompiled entry data.
+
+        Raises:
+            AttributeError: When an unknown font attribute is mapped.
+
+        Returns:
+            dict[int, Callable[[Any], None]]: The handlers.
+        """
+        font = self.font
+        ttinfo = font.ttinfo
+        classes = font._classes
+        handlers: dict[int, Callable[[Any], None]] = {}
+
+        for key in font_mapping_direct:
+            handlers[key] = _get_setter(font, F(key).name)
+        for key in ttinfo_mapping_direct:
+            handlers[key] = _get_setter(ttinfo, T(key).name)
+        for key in (T.cvt, T.prep, T.fpgm):
+            handlers[key] = partial(ttinfo.fake_set_binary, T(key).name)
+        for key in (
+            T.TrueTypeStems,
+            T.TrueTypeStemPPEMs1,
+            T.TrueTypeStemPPEMs2And3,
+            T.TrueTypeStemPPEMs,
+        ):
+            handlers[key] = ttinfo.fake_deserialize_stems
+        for key in block_markers:
+            handlers[key] = _ignore_entry
+
+        # Private attributes
+        for key, attr in font_mapping_private.items():
+            handlers[key] = _get_setter(font, attr)
+        for key, attr in ttinfo_mapping_private.items():
+            handlers[key] = _get_setter(ttinfo, attr)
+
+        handlers.update(
+            {
+                F.EncodingDefault: self._read_encoding_default,
+                F.Encoding: self._read_encoding,
+                F.weight_vector: _get_setter(font.weight_vector, "_weights"),
+                T.gasp: ttinfo.fake_deserialize_gasp,
+                F.ttinfo: ttinfo.fake_deserialize,
+                T.vdmx: ttinfo.fake_deserialize_vdmx,
+                T.TrueTypeZones: ttinfo.fake_deserialize_zones,
+                T.TrueTypeZoneDeltas: ttinfo.fake_deserialize_zone_deltas,
+                F.fontnames: self._read_fontnames,
+                F.TrueTypeTable: font.truetypetables.append,
+                F.MetricsClassFlags: classes.fake_deserialize_metrics_class_flags,
+                F.KerningClassFlags: classes.fake_deserialize_kerning_class_flags,
+                F.features: font.fake_deserialize_features,
+                F.GlyphClass: classes.fake_deserialize_class,
+                F.AxisName: font.fake_deserialize_axis,
+                M.MasterName: font._master_names.append,
+                M.MasterLocation: font._master_locations.append,
+                M.PostScriptInfo: font._master_ps_infos.append,
+                F.GlobalGuides: font.fake_deserialize_guides,
+                F.GlobalGuideProperties: font.fake_deserialize_guide_properties,
+                F.GlobalMask: font.fake_deserialize_global_mask,
+                F.MMKernPair: _drop_mm_kern_pair,
+            }
+        )
+        return handlers
+
+    def _read_font_entry(self, key: int, data: Any) -> None:
+        """
+        Read the data of a font-level entry into the current `font`.
+
+        Args:
+            key (int): The entry key.
+            data (Any): The decompiled entry data.
+        """
+        handler = self._font_entry_handlers.get(key)
+        if handler is None:
+            logger.error(f"Unhandled VFB entry: {key}")
+        else:
+            handler(data)
+
+    def _read_encoding_default(self, data: Any) -> None:
+        # Where is this used?
+        gid, glyph_name = data
+        er = EncodingRecord()
+        er.name = glyph_name
+        self.font._encoding_default.append(er)
+
+    def _read_encoding(self, data: Any) -> None:
+        gid, glyph_name = data
+        self._gids[gid] = glyph_name
+
+    def _read_fontnames(self, data: Any) -> None:
+        assert isinstance(data, list)
+        for nr in data:
+            self.font.fontnames.append(NameRecord(tuple(nr)))
+
+    def _finish_font(self) -> None:
+        """
+        Build the font data that depends on several entries, after all entries have
+        been read.
+        """
+        font = self.font
+        gids = self._gids
         if gids:
             enc = font._encoding = Encoding()
             enc._parent = font
@@ -1,4 +1,8 @@
 # from fontTools.misc.textTools import deHexStr, hexStr
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
 from typing import TYPE_CHECKING, Any
 
 from vfbLib.enum import F, G, M, T
@@ -9,42 +13,149 @@ from vfbLib.vfb.entry import VfbEntry
 from vfbLib.vfb.header import VfbHeader
 from vfbLib.vfb.vfb import Vfb
 
+from FL.fake.copy import SharedGlyph
 from FL.objects.Font import Font
 from FL.objects.TTInfo import TTInfo
+from FL.vfb.deferred import DeferredGlyph, get_parse_context
+from FL.vfb.mapped import add_raw_entry, release_mapped_file
 
 if TYPE_CHECKING:
     from enum import IntEnum
     from pathlib import Path
 
+    from FL.objects.Glyph import Glyph
+
 
 __doc__ = "VFB file writer"
 
 
+logger = logging.getLogger(__name__)
+
+
+# The entries of a glyph, in the order in which they are written
+glyph_entry_keys = (
+    G.Glyph,
+    G.Links,
+    G.image,  # FIXME
+    G.Bitmaps,  # FIXME
+    G.VSB,
+    G.Sketch,  # FIXME
+    G.HintingOptions,
+    G.mask,
+    G.MaskMetrics,
+    G.MaskMetricsMM,
+    G.Origin,
+    G.unicodes,
+    G.CustomDict,
+    G.UnicodesNonBMP,
+    G.mark,
+    G.customdata,
+    G.note,
+    G.GDEFData,
+    G.AnchorsProperties,
+    G.AnchorsMM,
+    G.GuideProperties,
+)
+
+# The minimum number of glyphs to serialize in worker processes, for fewer glyphs it
+# isn't worth starting them
+MIN_PARALLEL_GLYPHS = 200
+
+# The font and the compile context of the current worker process, see
+# `FontToVfbWriter.compile_glyphs_parallel()`
+_worker_font: Font | None = None
+_worker_context: Vfb | None = None
+
+
+def compile_glyph_entries(glyph: "Glyph", context: Vfb) -> list[tuple[int, bytes]]:
+    """
+    Serialize a glyph and compile its entries.
+
+    Args:
+        glyph (Glyph): The glyph.
+        context (Vfb): The Vfb that provides the information the compilers need, see
+            `get_parse_context()`.
+
+    Returns:
+        list[tuple[int, bytes]]: The entry keys and compiled data.
+    """
+    glyph_dict = glyph.fake_serialize()
+    entries = []
+    for key in glyph_entry_keys:
+        if key in glyph_dict:
+            e = VfbEntry(context, eid=key)
+            e.data = glyph_dict[key]
+            e.compile()
+            assert isinstance(e.data, bytes)
+            entries.append((key, e.data))
+    return entries
+
+
+def _init_worker(font: Font, context: Vfb) -> None:
+    global _worker_font, _worker_context
+    _worker_font = font
+    _worker_context = context
+
+
+def _compile_glyph_chunk(indices: list[int]) -> list[list[tuple[int, bytes]]]:
+    assert _worker_font is not None and _worker_context is not None
+    data = _worker_font.glyphs.data
+    results = []
+    for i in indices:
+        item = data[i]
+        glyph = item.glyph if isinstance(item, SharedGlyph) else item
+        results.append(compile_glyph_entries(glyph, _worker_context))
+    return results
+
+
 class FontToVfbWriter:
     """
     Convert the Font object to the low-level `vfbLib.vfb.vfb.Vfb` structure and write it
     to `vfb_path`
     """
 
-    def __init__(self, font: Font) -> None:
+    def __init__(self, font: Font, workers: int | None = 1) -> None:
         """
         Instantiate a writer that can write the `font` into a VFB file.
 
         Args:
             font (Font): The source object of the data
+            workers (int | None, optional): The number of worker processes in which to
+                serialize the glyphs, see `compile_glyphs_parallel()`. Defaults to 1,
+                which means the glyphs are serialized in the current process. None
+                means the number of CPUs.
         """
         self.font = font
         self.vfb = Vfb()
+        self.workers = workers
+        # The compiled entries of the glyphs that were serialized in worker processes,
+        # by glyph index
+        self.compiled: dict[int, list[tuple[int, bytes]]] = {}
+        # The font-level entries that were kept undecoded, by key. They are written
+        # in place of the decoded entries, see `add_entry()`.
+        self.raw_entries: dict[int, list[bytes]] = {}
+        for key, data in font._fake_raw_entries:
+            self.raw_entries.setdefault(key, []).append(data)
         self.compile()
 
     def write(self, vfb_path: "Path") -> None:
         """
-        Write the VFB to `vfb_path`.
+        Write the VFB to `vfb_path`. The data is written to a temporary file, which then
+        replaces the file at `vfb_path`, so a VFB which is still memory-mapped for
+        reading (see `FL.vfb.mapped`) is not modified. Data that is still mapped from
+        the file at `vfb_path` is copied into memory before it is replaced.
 
         Args:
             vfb_path (Path): The file path to which to write the VFB data.
         """
-        self.vfb.write(vfb_path)
+        tmp_path = vfb_path.with_name(f"{vfb_path.name}.{os.getpid()}.tmp")
+        try:
+            self.vfb.write(tmp_path)
+            release_mapped_file(vfb_path, self.vfb)
+            os.replace(tmp_path, vfb_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def write_json(self, vfb_json_path: "Path") -> None:
         """
@@ -63,6 +174,12 @@ class FontToVfbWriter:
             self.add_entry(key, getattr(parent, attr))
 
     def add_entry(self, eid: int, data: Any = "") -> None:
+        if eid in self.raw_entries:
+            # The original data is written instead, in the same position
+            for raw in self.raw_entries.pop(eid):
+                add_raw_entry(self.vfb, eid, raw)
+            return
+
         e = VfbEntry(self.vfb, eid=eid)
         e.data = data
         self.vfb.entries.append(e)
@@ -272,12 +389,15 @@ class FontToVfbWriter:
             self.add_entry(F.default_character, font.default_character)
 
     def compile_ttinfo(self) -> None:
+        # The font-level entries that can be kept undecoded are TrueType entries (see
+        # `FL.vfb.reader.data_groups`). They are empty in the font, but must be written.
         for k in (T.cvt, T.prep, T.fpgm):
             d = self.font.ttinfo.fake_get_binary(T(k).name)
-            if d:
+            if d or k in self.raw_entries:
                 self.add_entry(k, d)
 
-        if gasp := self.font.ttinfo.fake_serialize_gasp():
+        gasp = self.font.ttinfo.fake_serialize_gasp()
+        if gasp or T.gasp in self.raw_entries:
             self.add_entry(T.gasp, gasp)
 
         self.add_entry(F.ttinfo, self.font.ttinfo.fake_serialize())
@@ -307,35 +427,93 @@ class FontToVfbWriter:
             T.TrueTypeZoneDeltas, self.font.ttinfo.fake_serialize_zone_deltas()
         )
 
+        # Undecoded entries which are not written otherwise, e.g. "TrueType Stem PPEMs
+        # 2 And 3"
+        for key, data in self.font._fake_raw_entries:
+            if key in self.raw_entries:
+                add_raw_entry(self.vfb, key, data)
+        self.raw_entries.clear()
+
     def compile_glyphs(self) -> None:
-        for glyph in self.font.glyphs:
-            glyph_dict = glyph.fake_serialize()
-            # TODO: Which keys are required?
-            for key in (
-                G.Glyph,
-                G.Links,
-                G.image,  # FIXME
-                G.Bitmaps,  # FIXME
-                G.VSB,
-                G.Sketch,  # FIXME
-                G.HintingOptions,
-                G.mask,
-                G.MaskMetrics,
-                G.MaskMetricsMM,
-                G.Origin,
-                G.unicodes,
-                G.CustomDict,
-                G.UnicodesNonBMP,
-                G.mark,
-                G.customdata,
-                G.note,
-                G.GDEFData,
-                G.AnchorsProperties,
-                G.AnchorsMM,
-                G.GuideProperties,
+        glyphs = self.font.glyphs
+        if self.workers != 1:
+            self.compile_glyphs_parallel()
+        for i, item in enumerate(glyphs.data):
+            self.compile_glyph(i, item)
+        self.compiled.clear()
+
+    def compile_glyphs_parallel(self) -> None:
+        """
+        Serialize and compile the glyphs in a pool of worker processes. The results are
+        stored in `compiled` and added in the order of the glyphs by `compile_glyph()`.
+
+        The workers are forked, so they inherit the font instead of receiving a pickled
+        copy of each glyph, which would take longer than serializing it. Where processes
+        can't be forked, the glyphs are serialized in the current process.
+        """
+        if "fork" not in get_all_start_methods():
+            logger.info("Can't fork worker processes, serializing glyphs serially")
+            return
+
+        workers = self.workers or os.cpu_count() or 1
+        indices = [
+            i
+            for i, item in enumerate(self.font.glyphs.data)
+            if not isinstance(item, DeferredGlyph)
+        ]
+        if workers < 2 or len(indices) < MIN_PARALLEL_GLYPHS:
+            return
+
+        # Several chunks per worker, so they finish at about the same time
+        size = -(-len(indices) // (workers * 4))
+        chunks = [indices[k : k + size] for k in range(0, len(indices), size)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.font, get_parse_context(self.vfb)),
+        ) as executor:
+            for chunk, results in zip(
+                chunks, executor.map(_compile_glyph_chunk, chunks)
             ):
-                if key in glyph_dict:
-                    self.add_entry(key, glyph_dict[key])
+                self.compiled.update(zip(chunk, results))
+
+    def compile_glyph(self, i: int, item: Any) -> None:
+        """
+        Add the entries of a glyph.
+
+        Args:
+            i (int): The glyph index.
+            item (Any): The item at index `i` in the list data of `Font.glyphs`, i.e. a
+                Glyph or a placeholder object.
+        """
+        if (entries := self.compiled.get(i)) is not None:
+            # Serialized in a worker process
+            for key, data in entries:
+                self.add_entry(key, data)
+            return
+
+        if isinstance(item, DeferredGlyph):
+            if item.num_masters == self.vfb.num_masters:
+                # The glyph has not been accessed since the font was opened, so it
+                # can't have been modified. Copy its original entries.
+                for key, data in item.entries:
+                    add_raw_entry(self.vfb, key, data)
+                return
+
+            glyph = self.font.glyphs[i]
+        elif isinstance(item, SharedGlyph):
+            # The glyph is shared with the font this font was copied from, and
+            # has not been accessed. Serialize it without copying it.
+            glyph = item.glyph
+        else:
+            # Don't go through the list, so the glyph is not unshared
+            glyph = item
+        glyph_dict = glyph.fake_serialize()
+        # TODO: Which keys are required?
+        for key in glyph_entry_keys:
+            if key in glyph_dict:
+                self.add_entry(key, glyph_dict[key])
 
     def compile_options(self) -> None:
         if ot_export_options := self.font._ot_export_options:
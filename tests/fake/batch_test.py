@@ -0,0 +1,66 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+import FL
+from FL.fake.batch import format_batch_report, run_batch
+from FL.objects.Font import Font
+
+data_path = Path(__file__).parent.parent / "data"
+
+
+class BatchTests(unittest.TestCase):
+    def test_run_batch(self) -> None:
+        global_fl = FL.fl
+        with TemporaryDirectory() as tmp:
+            script = Path(tmp) / "script.py"
+            script.write_text(
+                "assert len(fl) == 1\n"
+                "fl.font.full_name = 'Batch ' + fl.font.full_name\n"
+            )
+            out_path = Path(tmp) / "out"
+            vfb_paths = [str(data_path / "mini.vfb"), str(data_path / "2axMM.vfb")]
+            results = run_batch(vfb_paths, [str(script)], str(out_path), workers=2)
+            assert [r[0] for r in results] == vfb_paths
+            assert [r[2] for r in results] == [None, None]
+            for vfb_path in vfb_paths:
+                original = Font(vfb_path)
+                f = Font(str(out_path / Path(vfb_path).name))
+                assert f.full_name == f"Batch {original.full_name}"
+        assert FL.fl is global_fl
+
+    def test_run_batch_failure(self) -> None:
+        with TemporaryDirectory() as tmp:
+            script = Path(tmp) / "script.py"
+            script.write_text("raise RuntimeError('Oops')\n")
+            vfb_path = str(data_path / "mini.vfb")
+            results = run_batch([vfb_path], [str(script)], tmp, workers=1)
+            assert len(results) == 1
+            path, seconds, error = results[0]
+            assert path == vfb_path
+            assert seconds > 0
+            assert error is not None
+            assert "RuntimeError: Oops" in error
+            # Failed files are not saved
+            assert not (Path(tmp) / "mini.vfb").exists()
+            report = format_batch_report(results)
+            assert "FAILED" in report
+            assert "1 file(s), 1 failed" in report
+
+    def test_run_batch_same_output_path(self) -> None:
+        with TemporaryDirectory() as tmp:
+            script = Path(tmp) / "script.py"
+            script.write_text("fl.font.full_name = 'Batch'\n")
+            vfb_paths = []
+            for family in ("Sans", "Serif"):
+                vfb_path = Path(tmp) / family / "Regular.vfb"
+                vfb_path.parent.mkdir()
+                vfb_path.write_bytes((data_path / "mini.vfb").read_bytes())
+                vfb_paths.append(str(vfb_path))
+            out_path = Path(tmp) / "out"
+            with pytest.raises(ValueError, match="would both be saved to"):
+                run_batch(vfb_paths, [str(script)], str(out_path), workers=2)
+            # Nothing is processed
+            assert not out_path.exists()
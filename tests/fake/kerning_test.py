@@ -1,7 +1,21 @@
 import unittest
 from pathlib import Path
 
-from FL.fake.Kerning import FakeKerning
+from FL.fake.Kerning import FakeKerning, FlatKerning
+from FL.objects.Font import Font
+from FL.objects.Glyph import Glyph
+from FL.objects.KerningPair import KerningPair
+
+
+def get_kerning_font() -> Font:
+    f = Font()
+    for name in ("A", "Aacute", "V", "W", "a", "v"):
+        g = Glyph()
+        g.name = name
+        f.glyphs.append(g)
+    f.classes = ["_A: A' Aacute", "_V: V' W", "_a: a' Agrave"]
+    f.fake_set_class_flags(["L", "R", "LR"])
+    return f
 
 
 class FakeKerningTests(unittest.TestCase):
@@ -43,3 +57,81 @@ class FakeKerningTests(unittest.TestCase):
             "uni1E92",
             "uni1E94",
         ]
+
+    def test_expand(self) -> None:
+        f = get_kerning_font()
+        # Class-class
+        f[0].kerning.append(KerningPair(2, -50))
+        # Glyph-class, overrides the class-class pair for Aacute
+        f[1].kerning.append(KerningPair(2, -30))
+        # Class-glyph
+        f[0].kerning.append(KerningPair(5, -10))
+        # Class-glyph, the class contains a glyph that is not in the font
+        f[4].kerning.append(KerningPair(5, -5))
+        # Zero values are ignored
+        f[4].kerning.append(KerningPair(1, 0))
+        k = f.fake_kerning
+        k.expand()
+        assert isinstance(k.flat_kerning, FlatKerning)
+        assert list(k.flat_kerning) == [
+            ("A", "V", -50),
+            ("A", "W", -50),
+            ("A", "v", -10),
+            ("Aacute", "V", -30),
+            ("Aacute", "W", -30),
+            ("Aacute", "v", -10),
+            ("Agrave", "v", -5),
+            ("a", "v", -5),
+        ]
+        assert len(k.flat_kerning) == 8
+        assert k.flat_kerning[3] == ("Aacute", "V", -30)
+        assert k.flat_kerning[-1] == ("a", "v", -5)
+        assert k.flat_kerning[1:3] == [("A", "W", -50), ("A", "v", -10)]
+        assert k.flat_kerning == list(k.flat_kerning)
+
+    def test_expand_classes_cached(self) -> None:
+        f = get_kerning_font()
+        f[0].kerning.append(KerningPair(2, -50))
+        k = f.fake_kerning
+        k.expand()
+        classes_left = k.classes_left
+        k.expand()
+        assert k.classes_left is classes_left
+        assert len(k.flat_kerning) == 4
+
+        # Changing the classes imports them again
+        f.classes = ["_A: A'", "_V: V' W"]
+        k.expand()
+        assert k.classes_left is not classes_left
+        assert list(k.flat_kerning) == [("A", "V", -50), ("A", "W", -50)]
+
+        # Changing the flags imports them again
+        f.fake_set_class_flags(["L", ""])
+        k.expand()
+        assert list(k.flat_kerning) == [("A", "V", -50)]
+
+    def test_expand_overlapping_classes(self) -> None:
+        f = get_kerning_font()
+        f.classes = ["_A: A' Aacute", "_B: V' Aacute", "_C: a' v"]
+        f.fake_set_class_flags(["L", "L", "R"])
+        f[0].kerning.append(KerningPair(4, -50))
+        f[0].kerning.append(KerningPair(3, -20))
+        f[2].kerning.append(KerningPair(4, -40))
+        k = f.fake_kerning
+        k.expand()
+        assert list(k.flat_kerning) == [
+            ("A", "W", -20),
+            ("A", "a", -50),
+            ("A", "v", -50),
+            ("Aacute", "W", -20),
+            ("Aacute", "a", -40),
+            ("Aacute", "v", -40),
+            ("V", "a", -40),
+            ("V", "v", -40),
+        ]
+
+    def test_flat_kerning_empty(self) -> None:
+        k = FlatKerning()
+        assert len(k) == 0
+        assert list(k) == []
+        assert k == []
@@ -0,0 +1,91 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+from vfbLib.enum import G
+
+from FL.fake.synthetic import make_synthetic_font, save_synthetic_font
+from FL.objects.Font import Font
+
+
+class SyntheticFontTests(unittest.TestCase):
+    def test_default(self) -> None:
+        f = make_synthetic_font(num_glyphs=10, nodes_per_glyph=20)
+        assert len(f) == 10
+        assert f._masters_count == 1
+        assert f[0].name == "glyph00000"
+        assert f[0].unicode == 0xE000
+        # One contour of 16 nodes and one of 4 nodes
+        assert len(f[0]) == 20
+        assert [n.type & 0xF for n in f[0].nodes].count(0x1) >= 2
+        assert not f[9].components
+        assert f.classes == []
+
+    def test_mm(self) -> None:
+        f = make_synthetic_font(
+            num_glyphs=10, nodes_per_glyph=4, num_axes=2, hints_per_glyph=1
+        )
+        assert f._masters_count == 4
+        assert len(f.axis) == 2
+        assert f[0].layers_number == 4
+        assert len(f[0].nodes[0]._points) == 4
+        assert len(f[0].hhints) == 1
+        assert len(f[0].vhints) == 1
+        assert f._primary_instances[0]["values"] == (500.0, 500.0, 0.0, 0.0)
+
+    def test_composites_kerning(self) -> None:
+        f = make_synthetic_font(
+            num_glyphs=40,
+            num_composites=4,
+            num_kerning_pairs=30,
+            num_kerning_classes=4,
+        )
+        assert [len(g.components) for g in f.glyphs[-5:]] == [0, 2, 2, 2, 2]
+        assert all(c.index < 36 for g in f.glyphs for c in g.components)
+        assert sum(len(g.kerning) for g in f.glyphs) == 30
+        assert len(f.classes) == 4
+        assert f.classes[0].startswith("_l0000: glyph00000' glyph00001 ")
+        assert f.GetClassLeft(0) == 1
+        assert f.GetClassRight(0) == 0
+        assert f.GetClassLeft(2) == 0
+        assert f.GetClassRight(2) == 1
+        # The key glyphs of the left and right classes are kerned
+        assert f[0].kerning[0].key == 18
+
+    def test_deterministic(self) -> None:
+        a = make_synthetic_font(num_glyphs=5, num_kerning_pairs=5)
+        b = make_synthetic_font(num_glyphs=5, num_kerning_pairs=5)
+        c = make_synthetic_font(num_glyphs=5, num_kerning_pairs=5, seed=1)
+        assert [g.fake_serialize() for g in a.glyphs] == [
+            g.fake_serialize() for g in b.glyphs
+        ]
+        assert [g.fake_serialize() for g in a.glyphs] != [
+            g.fake_serialize() for g in c.glyphs
+        ]
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            make_synthetic_font(num_axes=5)
+        with pytest.raises(ValueError):
+            make_synthetic_font(num_glyphs=5, num_composites=5)
+
+    def test_save(self) -> None:
+        with TemporaryDirectory() as tmp:
+            vfb_path = Path(tmp) / "synthetic.vfb"
+            f = save_synthetic_font(
+                vfb_path,
+                num_glyphs=20,
+                num_axes=1,
+                num_composites=2,
+                num_kerning_pairs=10,
+                num_kerning_classes=2,
+                hints_per_glyph=1,
+            )
+            g = Font(str(vfb_path))
+        assert len(g) == 20
+        assert g._masters_count == 2
+        assert g.classes == f.classes
+        assert [x.fake_serialize()[G.Glyph] for x in g.glyphs] == [
+            x.fake_serialize()[G.Glyph] for x in f.glyphs
+        ]
@@ -0,0 +1,62 @@
+import unittest
+
+import pytest
+from vfbLib.enum import G
+
+from FL.helpers.bounds import EMPTY_BOUNDS, get_cubic_extrema, get_outline_bounds
+from FL.objects.Glyph import Glyph
+
+# A contour with one curve whose control points overshoot its extrema, in two masters
+glyph_data = {
+    "name": "o",
+    "num_masters": 2,
+    "nodes": [
+        {"type": "move", "flags": 0, "points": [[(0, 0)], [(0, 0)]]},
+        {
+            "type": "curve",
+            "flags": 0,
+            "points": [
+                [(100, 0), (0, 100), (100, 100)],
+                [(200, 0), (0, 200), (200, 200)],
+            ],
+        },
+        {"type": "line", "flags": 0, "points": [[(0, 0)], [(0, 0)]]},
+    ],
+    "metrics": [[100, 0], [200, 0]],
+}
+
+
+class BoundsTests(unittest.TestCase):
+    def test_get_cubic_extrema(self) -> None:
+        assert get_cubic_extrema(0, 100, 100, 0) == [75.0]
+        # Monotonic
+        assert get_cubic_extrema(0, 10, 20, 30) == []
+        values = sorted(get_cubic_extrema(0, 100, -100, 0))
+        assert values == pytest.approx([-28.8675, 28.8675])
+
+    def test_get_outline_bounds(self) -> None:
+        g = Glyph()
+        g.fake_deserialize(G.Glyph, glyph_data)
+        assert get_outline_bounds(g.nodes, 2) == [
+            (0, 0, 100, 100),
+            (0, 0, 200, 200),
+        ]
+        assert get_outline_bounds(g.nodes, 2, extrema=True) == [
+            (0, 0, 100, 75),
+            (0, 0, 200, 150),
+        ]
+
+    def test_get_outline_bounds_points(self) -> None:
+        # The same with Point objects instead of compact coordinates
+        g = Glyph()
+        g.fake_deserialize(G.Glyph, glyph_data)
+        for node in g.nodes:
+            node.Layer(0)
+        assert g.nodes[1]._fake_coords is None
+        assert get_outline_bounds(g.nodes, 2, extrema=True) == [
+            (0, 0, 100, 75),
+            (0, 0, 200, 150),
+        ]
+
+    def test_get_outline_bounds_empty(self) -> None:
+        assert get_outline_bounds([], 2) == [EMPTY_BOUNDS, EMPTY_BOUNDS]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+import pytest
+
+from FL import Font
+from FL.helpers.interpolation import round_float
+
+try:
+    import numpy as np
+
+    from FL.helpers.interpolation_numpy import remove_axes_from_array, round_array
+
+    have_numpy = True
+except ImportError:
+    have_numpy = False
+
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+@unittest.skipUnless(have_numpy, "NumPy is not installed")
+class InterpolationNumpyTests(unittest.TestCase):
+    def test_remove_axes_from_array(self) -> None:
+        values = np.array([[0.0, 10.0], [100.0, 20.0], [50.0, 0.0], [150.0, 40.0]])
+        result = remove_axes_from_array(values, (0.5, 0.25))
+        assert result.tolist() == [[50.0, 11.25]]
+
+    def test_remove_axes_from_array_odd(self) -> None:
+        values = np.array([[0.0], [1.0], [2.0]])
+        with pytest.raises(ValueError):
+            remove_axes_from_array(values, (0.5,))
+
+    def test_round_array(self) -> None:
+        values = [-2.5, -1.5, -0.5, -0.49, 0.0, 0.49, 0.5, 1.5, 2.5, 12.500000001]
+        result = round_array(np.array(values)).tolist()
+        assert result == [round_float(v) for v in values]
+
+    def _interpolate(self, vfb: str, vectorized: bool) -> list:
+        f = Font(str(DATA / vfb))
+        f.fake_interpolate_internal((0.35, 0.7), vectorized=vectorized)
+        return [glyph.fake_serialize() for glyph in f.glyphs]
+
+    def test_interpolate_vectorized(self) -> None:
+        assert self._interpolate("2axMM.vfb", True) == self._interpolate(
+            "2axMM.vfb", False
+        )
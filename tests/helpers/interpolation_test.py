@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import unittest
+from array import array
+
+import pytest
 
 from FL.helpers.interpolation import (
     add_axis_to_list,
     add_axis_to_master_list,
     interpolate,
     interpolate_point,
+    remove_axes_from_coords,
+    remove_axes_from_list,
+    remove_axes_from_master_list,
+    remove_axes_from_master_point_list,
+    remove_axes_from_point_list,
     remove_axis_from_list,
     remove_axis_from_master_list,
     remove_axis_from_master_point_list,
@@ -90,6 +98,56 @@ class FLListTests(unittest.TestCase):
         # In interpolation, points are rounded, not truncated.
         assert seq == [[Point(6, 1), Point(5, 150)]]
 
+    def test_remove_axes_from_list(self) -> None:
+        seq = [0, 100, 50, 150, 10, 110, 60, 170]
+        expected = list(seq)
+        remove_axis_from_list(expected, 2, 0.3, round_values=False)
+        remove_axis_from_list(expected, 1, 0.45, round_values=False)
+        remove_axis_from_list(expected, 0, 0.7, round_values=True)
+        remove_axes_from_list(seq, (0.3, 0.45, 0.7), round_values=True)
+        assert seq == expected == [96]
+
+    def test_remove_axes_from_list_odd(self) -> None:
+        seq = [0, 100, 50, 150, 10, 110]
+        with pytest.raises(ValueError):
+            remove_axes_from_list(seq, (0.3, 0.45), round_values=True)
+
+    def test_remove_axes_from_list_num_masters(self) -> None:
+        # Longer lists are processed axis by axis
+        seq = [0, 100, 50, 150] + [0] * 12
+        expected = list(seq)
+        remove_axis_from_list(expected, 1, 0.5, round_values=False, num_masters=4)
+        remove_axis_from_list(expected, 0, 0.5, round_values=True, num_masters=2)
+        remove_axes_from_list(seq, (0.5, 0.5), round_values=True, num_masters=4)
+        assert seq == expected
+
+    def test_remove_axes_from_master_list(self) -> None:
+        seq = [[1, 0], [10, 2], [3, 7], [12, 9]]
+        remove_axes_from_master_list(seq, (0.25, 0.5), round_values=False)
+        assert seq == [[6.0, 2.75]]
+
+    def test_remove_axes_from_point_list(self) -> None:
+        seq = [Point(1, 0), Point(10, 2), Point(3, 7), Point(12, 9)]
+        remove_axes_from_point_list(seq, (0.25, 0.5), round_values=True)
+        assert seq == [Point(6, 3)]
+
+    def test_remove_axes_from_master_point_list(self) -> None:
+        seq = [
+            [Point(1, 0), Point(0, 100)],
+            [Point(10, 2), Point(10, 200)],
+            [Point(3, 7), Point(0, 100)],
+            [Point(12, 9), Point(10, 300)],
+        ]
+        remove_axes_from_master_point_list(seq, (0.25, 0.5), round_values=True)
+        assert seq == [[Point(6, 3), Point(5, 163)]]
+
+    def test_remove_axes_from_coords(self) -> None:
+        coords = array(
+            "d", [1, 0, 0, 100, 10, 2, 10, 200, 3, 7, 0, 100, 12, 9, 10, 300]
+        )
+        result = remove_axes_from_coords(coords, 4, (0.25, 0.5), round_values=True)
+        assert result.tolist() == [6.0, 3.0, 5.0, 163.0]
+
     def test_interpolate_zero(self) -> None:
         result = interpolate(0, 1, 0.0)
         assert result == 0
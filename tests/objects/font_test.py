@@ -1,9 +1,13 @@
 import unittest
+from io import StringIO
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
+from vfbLib.enum import G
+from vfbLib.vfb.vfb import Vfb
 
-from FL import Component, Feature, Font, Glyph, KerningPair, fl
+from FL import Component, Feature, Font, Glyph, KerningPair, Node, Point, Uni, fl, nMOVE
 
 
 class FontTests(unittest.TestCase):
@@ -135,12 +139,105 @@ class FontTests(unittest.TestCase):
             expected = afm.read()
         assert actual == expected
 
+    def test_write_afm(self) -> None:
+        base_path = Path(__file__).parent.parent / "data" / "mini.vfb"
+        f = Font(str(base_path))
+        lines = f.fake_iter_afm(expand_kerning=True)
+        assert next(lines) == "StartFontMetrics 2.0"
+        buffer = StringIO()
+        f.fake_write_afm(buffer, expand_kerning=True)
+        with open(base_path.with_suffix(".expanded.afm")) as afm:
+            expected = afm.read()
+        assert buffer.getvalue() == expected
+        assert f.fake_get_afm(expand_kerning=True) == expected
+
+    def test_sort_glyphs_unencoded(self) -> None:
+        f = Font()
+        for name in ("b.alt", "b", "a.alt", "a"):
+            g = Glyph()
+            g.name = name
+            f.glyphs.append(g)
+        other = Glyph()
+        other.name = "other"
+        glyphs = f.fake_sort_glyphs([other] + list(f.glyphs))
+        # Encoded glyphs first, then the others in glyph order, then those not in the
+        # font
+        assert [g.name for g in glyphs] == ["a", "b", "b.alt", "a.alt", "other"]
+
+    def test_sort_kerning_unencoded(self) -> None:
+        f = Font()
+        for name in ("b.alt", "b", "a.alt", "a"):
+            g = Glyph()
+            g.name = name
+            f.glyphs.append(g)
+        kerning = [
+            ("z.none", "a", 1),
+            ("a.alt", "b", 2),
+            ("b", "y.none", 3),
+            ("b", "x.none", 4),
+            ("b", "a.alt", 5),
+            ("b.alt", "a", 6),
+            ("a", "b", 7),
+            ("b", "b.alt", 8),
+        ]
+        expected = [
+            ("a", "b", 7),
+            ("b", "b.alt", 8),
+            ("b", "a.alt", 5),
+            ("b", "x.none", 4),
+            ("b", "y.none", 3),
+            ("b.alt", "a", 6),
+            ("a.alt", "b", 2),
+            ("z.none", "a", 1),
+        ]
+        assert f.fake_sort_kerning(kerning) == expected
+
+    def test_sort_flat_kerning(self) -> None:
+        vfb_path = Path(__file__).parent.parent / "data" / "mini.vfb"
+        f = Font(str(vfb_path))
+        kerning = f.fake_get_afm_kerning(expand_kerning=True)
+        assert f.fake_sort_kerning(kerning) == f.fake_sort_kerning(list(kerning))
+
     def test_bounding_box(self) -> None:
         base_path = Path(__file__).parent.parent / "data" / "mini.vfb"
         f = Font(str(base_path))
         bbox = f.fake_bounding_rect()
         assert (bbox.ll.x, bbox.ll.y, bbox.ur.x, bbox.ur.y) == (66, -66, 531, 646)
 
+    def test_bounding_rects(self) -> None:
+        base_path = Path(__file__).parent.parent / "data" / "2axMM.vfb"
+        f = Font(str(base_path))
+        rects = f.fake_bounding_rects()
+        assert [(r.ll.x, r.ll.y, r.ur.x, r.ur.y) for r in rects] == [
+            (58, -260, 422, 501),
+            (24, -245, 459, 509),
+            (72, -260, 496, 502),
+            (39, -241, 526, 509),
+        ]
+        assert f.fake_bounding_rect(masterindex=2).ur == Point(496, 502)
+        # The glyph bounding boxes of each master
+        for m, rect in enumerate(rects):
+            for g in f.glyphs:
+                r = g.GetBoundingRect(m)
+                assert rect.ll.x <= r.ll.x and r.ur.y <= rect.ur.y
+
+    def test_bounding_box_invalidated(self) -> None:
+        base_path = Path(__file__).parent.parent / "data" / "mini.vfb"
+        f = Font(str(base_path))
+        assert f.fake_bounding_rect().ur == Point(531, 646)
+
+        # Moving a point of a glyph
+        f["a"][0].points[0].y = 700
+        assert f.fake_bounding_rect().ur == Point(531, 700)
+
+        # Adding and removing a glyph
+        g = Glyph()
+        g.nodes.append(Node(nMOVE, Point(600, 0)))
+        f.glyphs.append(g)
+        assert f.fake_bounding_rect().ur == Point(600, 700)
+        f.fake_delete_glyphs([len(f) - 1])
+        assert f.fake_bounding_rect().ur == Point(531, 700)
+
     def test_classes(self) -> None:
         f = Font()
         g = Glyph()
@@ -560,6 +657,15 @@ class FontTests(unittest.TestCase):
         f.axis.append(("Fettegrad", "Wt", "Weight"))
         assert f.axis == [("Optik", "Op", "OpticalSize")]
 
+    def test_define_axis_mappings(self) -> None:
+        f = Font()
+        f.DefineAxis("Weight", "Weight", "Wt")
+        f.DefineAxis("Width", "Width", "Wd")
+        assert f._anisotropic_interpolation_mappings == [
+            [(0, 0), (1000, 1000)],
+            [(0, 0), (1000, 1000)],
+        ]
+
     def test_build_axis_map_1(self) -> None:
         f = Font()
         f._axis = [("Weight", "Wt", "Weight")]
@@ -722,3 +828,214 @@ class FontTests(unittest.TestCase):
             f.glyphs.append(g)
         with pytest.raises(IndexError):
             del f.glyphs[4:4]
+
+    def test_delete_glyphs_sequence_out_of_range(self) -> None:
+        f = Font()
+        for name in ("A", "B", "C", "D"):
+            g = Glyph()
+            g.name = name
+            f.glyphs.append(g)
+        with pytest.raises(IndexError):
+            f.fake_delete_glyphs([1, 4])
+        # Nothing has been deleted
+        assert [g.name for g in f.glyphs] == ["A", "B", "C", "D"]
+
+    def test_delete_glyphs_deferred(self) -> None:
+        # Build a font
+        f = Font()
+        for name in ("A", "B", "C", "D", "E"):
+            g = Glyph()
+            g.name = name
+            f.glyphs.append(g)
+        B = f.glyphs[1]
+        B.components.append(Component(0))  # A, a glyph that will stay the same
+        B.components.append(Component(2))  # C, a glyph to be deleted
+        B.components.append(Component(4))  # E, a glyph to be reindexed
+        B.kerning.append(KerningPair(3, -20))  # B D -20
+        B.kerning.append(KerningPair(4, -30))  # B E -30
+        with f.fake_defer_reindex():
+            del f.glyphs[3]  # D
+            del f.glyphs[2]  # C
+            # The references are not updated yet
+            assert [c.index for c in B.components] == [0, 2, 4]
+            assert len(f.glyphs) == 3
+        # 0: A
+        # 1: B
+        # 2: E
+        assert [c.index for c in B.components] == [0, 2]
+        assert [(k.key, k.value) for k in B.kerning] == [(2, -30)]
+
+    def test_delete_glyphs_deferred_before_change(self) -> None:
+        f = Font()
+        for name in ("A", "B", "C"):
+            g = Glyph()
+            g.name = name
+            f.glyphs.append(g)
+        A = f.glyphs[0]
+        A.components.append(Component(2))  # C
+        with f.fake_defer_reindex():
+            del f.glyphs[1]
+            # Adding a glyph applies the pending deletion first
+            g = Glyph()
+            g.name = "D"
+            f.glyphs.append(g)
+            assert A.components[0].index == 1
+        assert A.components[0].index == 1
+
+    def test_delete_glyphs_copy_shares_glyphs(self) -> None:
+        f = Font(str(Path(__file__).parent.parent / "data" / "mini.vfb"))
+
+        def get_keys(font: Font) -> list[list[int]]:
+            # The kerning references of each glyph, without handing out the glyphs
+            return [[p.key for p in g.kerning] for g in font.glyphs.fake_iter_peek()]
+
+        assert get_keys(f) == [[4], [4], [], [], [1, 3, 4]]
+        c = Font(f)
+        c.fake_delete_glyphs([2])  # b
+        # Only the glyphs that reference reindexed glyphs have been copied
+        assert [c.glyphs.fake_is_loaded(i) for i in range(len(c))] == [
+            True,
+            True,
+            False,
+            True,
+        ]
+        assert get_keys(c) == [[3], [3], [], [1, 2, 3]]
+        # The original is unchanged
+        assert get_keys(f) == [[4], [4], [], [], [1, 3, 4]]
+
+    def test_open_lazy(self) -> None:
+        base_path = Path(__file__).parent.parent / "data" / "mini.vfb"
+        eager = Font(str(base_path))
+        f = Font()
+        assert f.Open(str(base_path), lazy=True) == 1
+        assert len(f) == len(eager)
+        # Lookups don't build the glyphs
+        assert f.FindGlyph("b") == 2
+        assert f.FindGlyph(0x62) == 2
+        assert not any(f.glyphs.fake_is_loaded(i) for i in range(len(f)))
+        # Access builds the glyph
+        b = f["b"]
+        assert isinstance(b, Glyph)
+        assert b.parent == f
+        assert f.glyphs.fake_is_loaded(2)
+        assert not f.glyphs.fake_is_loaded(1)
+        assert f.glyphs[2] is b
+        for lazy_glyph, glyph in zip(f.glyphs, eager.glyphs):
+            assert lazy_glyph.fake_serialize() == glyph.fake_serialize()
+
+    def test_save_lazy_pass_through(self) -> None:
+        base_path = Path(__file__).parent.parent / "data" / "mini.vfb"
+        f = Font()
+        f.Open(str(base_path), lazy=True)
+        f["a"].GetMetrics().x = 600
+        with TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "mini.vfb"
+            f.Save(str(out_path))
+            glyph_keys = {int(key) for key in G}
+            original = [
+                (e.id, e.data)
+                for e in Vfb(base_path, timing=False).entries
+                if e.id in glyph_keys
+            ]
+            saved = [
+                (e.id, e.data)
+                for e in Vfb(out_path, timing=False).entries
+                if e.id in glyph_keys
+            ]
+            # The accessed glyph has been re-encoded
+            assert saved != original
+            # The other glyphs have been copied verbatim
+            assert [data for key, data in saved if key == G.Glyph][2:] == [
+                data for key, data in original if key == G.Glyph
+            ][2:]
+            assert Font(str(out_path))["a"].width == 600
+            assert Font(str(out_path))["b"].width == f["b"].width
+
+    def test_copy_shares_glyphs(self) -> None:
+        f = Font(str(Path(__file__).parent.parent / "data" / "mini.vfb"))
+        width_a = f["a"].width
+        width_b = f["b"].width
+        c = Font(f)
+        assert len(c) == len(f)
+        assert not any(c.glyphs.fake_is_loaded(i) for i in range(len(c)))
+        # Modifying the original doesn't modify the copy
+        f["a"].GetMetrics().x = width_a + 100
+        assert c["a"].width == width_a
+        # Modifying the copy doesn't modify the original
+        c["b"].GetMetrics().x = width_b + 100
+        assert f["b"].width == width_b
+        assert c["b"].parent is c
+        assert f["b"].parent is f
+
+    def test_afm_keeps_glyphs_shared(self) -> None:
+        base_path = Path(__file__).parent.parent / "data" / "mini.vfb"
+        f = Font()
+        f.Open(str(base_path), lazy=True)
+        c = Font(Font(str(base_path)))
+        for font in (f, c):
+            font.fake_get_afm(expand_kerning=True)
+            font.fake_get_afm()
+        # The glyphs are still unmodified copies of the file and of the original font
+        assert all(f.glyphs.fake_get_source_index(item) >= 0 for item in f.glyphs.data)
+        assert not any(c.glyphs.fake_is_loaded(i) for i in range(len(c)))
+
+    def test_generate_primary_instances_parallel(self) -> None:
+        from FL.fake.instances import font_to_bytes
+
+        f = Font(str(Path(__file__).parent.parent / "data" / "2axMM.vfb"))
+        instances = f.fake_generate_primary_instances()
+        parallel = f.fake_generate_primary_instances(workers=2)
+        assert len(parallel) == len(instances) == 30
+        for instance, parallel_instance in zip(instances, parallel):
+            assert parallel_instance.style_name == instance.style_name
+            assert font_to_bytes(parallel_instance) == font_to_bytes(instance)
+
+    def test_save_primary_instances_parallel(self) -> None:
+        f = Font(str(Path(__file__).parent.parent / "data" / "2axMM.vfb"))
+        with TemporaryDirectory() as tmp:
+            paths = f.fake_save_primary_instances(tmp, workers=2)
+            assert len(paths) == 30
+            assert paths[0] == Path(tmp) / "TwoAxis-Cd2ExtraLight.vfb"
+            assert all(path.exists() for path in paths)
+            assert Font(str(paths[-1])).style_name == "Office Bold 737 wt 600 wd"
+
+    def test_find_glyph_index_updates(self) -> None:
+        f = Font()
+        for name, uni in (("A", 0x41), ("B", 0x42), ("C", 0x43)):
+            g = Glyph()
+            g.name = name
+            g.unicode = uni
+            f.glyphs.append(g)
+        assert f.FindGlyph("B") == 1
+        assert f.FindGlyph(0x43) == 2
+        assert f.has_key(Uni(0x41)) == 1
+
+        # Rename
+        f["B"].name = "Bee"
+        assert f.FindGlyph("B") == -1
+        assert f.FindGlyph("Bee") == 1
+
+        # Duplicate name, the first glyph wins
+        f.glyphs[2].name = "A"
+        assert f.FindGlyph("A") == 0
+        f.glyphs[0].name = "Ah"
+        assert f.FindGlyph("A") == 2
+
+        # Unicodes
+        f.glyphs[1].unicodes = [0x62, 0x42]
+        assert f.FindGlyph(0x62) == 1
+        assert f.FindGlyph(0x42) == 1
+        f.glyphs[1].unicode = 0x63
+        assert f.FindGlyph(0x62) == -1
+        assert f.FindGlyph(0x63) == 1
+
+        # Insert and delete
+        g = Glyph()
+        g.name = "space"
+        f.glyphs.insert(0, g)
+        assert f.FindGlyph("Bee") == 2
+        assert f["space"] is g
+        del f.glyphs[0]
+        assert f.FindGlyph("space") == -1
+        assert f.FindGlyph("Bee") == 1
+        assert f["space"] is None
@@ -2,7 +2,10 @@ import unittest
 
 from vfbLib.enum import G
 
+from FL.constants import nLINE
 from FL.objects.Glyph import Glyph
+from FL.objects.Matrix import Matrix
+from FL.objects.Node import Node
 from FL.objects.Point import Point
 
 glyph_a = {
@@ -36,3 +39,54 @@ class GlyphTests(unittest.TestCase):
 
         s = g.fake_serialize()
         assert s[G.Glyph] == glyph_a
+
+    def test_bounding_rect(self) -> None:
+        g = Glyph()
+        g.fake_deserialize(G.Glyph, glyph_a)
+        r = g.GetBoundingRect()
+        assert (r.ll.x, r.ll.y, r.ur.x, r.ur.y) == (77, 106, 468, 613)
+        # The returned rect is a copy of the cached bounding box
+        r.Assign(0, 0, 0, 0)
+        assert g.GetBoundingRect().ur == Point(468, 613)
+
+    def test_bounding_rect_invalidated(self) -> None:
+        g = Glyph()
+        g.fake_deserialize(G.Glyph, glyph_a)
+        assert g.bounding_box.ur == Point(468, 613)
+
+        # Moving a point
+        g[2].points[0].x = 500
+        assert g.bounding_box.ur == Point(500, 613)
+        g[2].points[0].Shift(0, 300)
+        assert g.bounding_box.ur == Point(500, 659)
+
+        # Transforming a compact node
+        g[1].Transform(Matrix(1, 0, 0, 1, 0, -200))
+        assert g.bounding_box.ll == Point(77, -94)
+
+        # Adding and removing nodes
+        g.nodes.append(Node(nLINE, Point(-10, 0)))
+        assert g.bounding_box.ll == Point(-10, -94)
+        g.nodes.pop()
+        assert g.bounding_box.ll == Point(77, -94)
+
+    def test_bounding_rect_invalidated_after_assign(self) -> None:
+        g = Glyph()
+        g.fake_deserialize(G.Glyph, glyph_a)
+        p = g[2].points[0]
+        p.Assign(480, 613)
+        assert p.parent is None
+        assert g.GetBoundingRect().ur == Point(480, 613)
+        # The point still belongs to the node after losing its parent
+        p.x = 99999
+        assert g.GetBoundingRect().ur == Point(99999, 613)
+
+    def test_bounding_rects_extrema(self) -> None:
+        g = Glyph()
+        g.fake_deserialize(G.Glyph, glyph_a)
+        g[2].points[1].y = 0
+        # The control point is outside of the curve
+        assert g.GetBoundingRect().ll == Point(77, 0)
+        r = g.fake_get_bounding_rects(extrema=True)[0]
+        assert r.ll.x == 77
+        assert 0 < r.ll.y < 106
@@ -40,3 +40,11 @@ class HintTests(unittest.TestCase):
         h.width = 50
         assert h.width == 50
         assert h.widths == [50] * 16
+
+    def test_position_deserialized(self) -> None:
+        h = Hint()
+        h.fake_deserialize([{"pos": 10, "width": 20}, {"pos": 15, "width": 30}])
+        h.position = 50
+        h.width = 40
+        assert h.positions == [50, 50]
+        assert h.widths == [40, 40]
@@ -47,3 +47,49 @@ class NodeTests(unittest.TestCase):
         n.fake_remove_axis(1, 0.5, True)
         assert n._points == [[Point()]]
         assert n._masters_count == 1
+
+    def test_fake_deserialize_compact(self) -> None:
+        data = {
+            "type": "curve",
+            "flags": 3,
+            "points": [
+                [(208, -260), (120, -253), (162, -260)],
+                [(207, -245), (92, -236), (160, -245)],
+            ],
+        }
+        n = Node()
+        n.fake_deserialize(2, data)
+        # The points are not built until they are accessed
+        assert n._fake_points is None
+        assert len(n) == 3
+        assert (n.x, n.y) == (208, -260)
+        assert n.fake_serialize(2) == data
+        assert n._fake_points is None
+        assert n.Layer(1) == [Point(207, -245), Point(92, -236), Point(160, -245)]
+        assert n._fake_coords is None
+        assert n.fake_serialize(2) == data
+
+    def test_fake_remove_axis_compact(self) -> None:
+        data = {
+            "type": "line",
+            "flags": 0,
+            "points": [[(0, 10)], [(101, 20)], [(50, 0)], [(150, 40)]],
+        }
+        n = Node()
+        n.fake_deserialize(4, data)
+        n.fake_remove_axes((0.5, 0.25), True)
+        assert n._masters_count == 1
+        assert n._fake_coords is not None
+        assert n._points == [[Point(50, 11)]]
+
+    def test_copy_compact(self) -> None:
+        data = {
+            "type": "line",
+            "flags": 0,
+            "points": [[(0, 10)], [(101, 20)]],
+        }
+        n = Node()
+        n.fake_deserialize(2, data)
+        c = Node(n)
+        assert (c.x, c.y) == (0, 10)
+        assert c.points == [Point(0, 10)]
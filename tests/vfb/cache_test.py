@@ -0,0 +1,96 @@
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from FL.objects.Font import Font
+from FL.vfb.cache import VfbCache, get_cache
+
+data_path = Path(__file__).parent.parent / "data"
+
+
+class VfbCacheTests(unittest.TestCase):
+    def test_get_cache(self) -> None:
+        with patch.dict(os.environ, {"FAKELAB_CACHE_DIR": ""}):
+            assert get_cache() is None
+        with TemporaryDirectory() as tmp:
+            env = {"FAKELAB_CACHE_DIR": tmp, "FAKELAB_CACHE_SIZE": "2"}
+            with patch.dict(os.environ, env):
+                cache = get_cache()
+                assert cache is not None
+                assert cache.cache_dir == Path(tmp)
+                assert cache.max_size == 2 * 1024 * 1024
+
+    def test_key(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cache = VfbCache(Path(tmp) / "cache")
+            vfb_path = Path(tmp) / "mini.vfb"
+            vfb_path.write_bytes((data_path / "mini.vfb").read_bytes())
+            key = cache.get_key(vfb_path)
+            assert key == cache.get_key(str(vfb_path))
+            assert key != cache.get_key(data_path / "2axMM.vfb")
+            # Same size and modification time, but different contents
+            stat = vfb_path.stat()
+            data = bytearray(vfb_path.read_bytes())
+            data[-1] ^= 0xFF
+            vfb_path.write_bytes(data)
+            os.utime(vfb_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert key != cache.get_key(vfb_path)
+
+    def test_store_load(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cache = VfbCache(tmp)
+            vfb_path = data_path / "2axMM.vfb"
+            key = cache.get_key(vfb_path)
+            f = Font()
+            assert not cache.load(key, f)
+            assert len(f) == 0
+
+            f = Font(str(vfb_path))
+            cache.store(key, f)
+            g = Font()
+            assert cache.load(key, g)
+            assert len(g) == len(f)
+            assert g.full_name == f.full_name
+            assert g[0].parent is g
+            assert g[0].fake_serialize() == f[0].fake_serialize()
+            assert g.FindGlyph(f[1].name) == 1
+
+            # A broken entry is deleted
+            entry_path = Path(tmp) / f"{key}.pickle"
+            entry_path.write_bytes(b"broken")
+            assert not cache.load(key, Font())
+            assert not entry_path.exists()
+
+    def test_evict(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cache = VfbCache(tmp)
+            f = Font(str(data_path / "mini.vfb"))
+            cache.store("a", f)
+            cache.store("b", f)
+            size = (Path(tmp) / "a.pickle").stat().st_size
+            os.utime(Path(tmp) / "b.pickle", ns=(0, 0))
+            # Make "a" the most recently used entry
+            assert cache.load("a", Font())
+            cache.max_size = size
+            cache.evict()
+            assert sorted(p.name for p in Path(tmp).iterdir()) == ["a.pickle"]
+            cache.clear()
+            assert list(Path(tmp).iterdir()) == []
+
+    def test_open(self) -> None:
+        with TemporaryDirectory() as tmp:
+            vfb_path = str(data_path / "mini.vfb")
+            with patch.dict(os.environ, {"FAKELAB_CACHE_DIR": tmp}):
+                f = Font(vfb_path)
+                assert len(list(Path(tmp).glob("*.pickle"))) == 1
+                g = Font(vfb_path)
+                # Lazy fonts are not cached
+                Font().Open(vfb_path, lazy=True)
+            assert len(list(Path(tmp).glob("*.pickle"))) == 1
+            assert g.file_name == vfb_path
+            assert len(g) == len(f)
+            assert [glyph.name for glyph in g.glyphs] == [
+                glyph.name for glyph in f.glyphs
+            ]
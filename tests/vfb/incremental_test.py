@@ -0,0 +1,82 @@
+import os
+import unittest
+from io import BytesIO
+from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+
+from FL.objects.Font import Font
+from FL.vfb.incremental import save_incremental
+from FL.vfb.writer import FontToVfbWriter
+
+data_path = Path(__file__).parent.parent / "data"
+
+
+def get_vfb_bytes(font: Font) -> bytes:
+    stream = BytesIO()
+    FontToVfbWriter(font).vfb.write_bytes(stream)
+    return stream.getvalue()
+
+
+class IncrementalTests(unittest.TestCase):
+    def test_source(self) -> None:
+        for lazy in (False, True):
+            font = Font()
+            font.Open(str(data_path / "2axMM.vfb"), lazy=lazy)
+            source = font._fake_vfb_source
+            assert source is not None
+            assert source.num_masters == 4
+            assert len(source.spans) == len(font.glyphs)
+            assert source.is_current()
+
+    def test_save_unmodified(self) -> None:
+        ref = Font()
+        ref.Open(str(data_path / "2axMM.vfb"), lazy=True)
+        with TemporaryDirectory() as tmp:
+            for lazy in (False, True):
+                font = Font()
+                font.Open(str(data_path / "2axMM.vfb"), lazy=lazy)
+                vfb_path = Path(tmp) / "out.vfb"
+                assert save_incremental(font, vfb_path)
+                assert vfb_path.read_bytes() == get_vfb_bytes(ref)
+                assert os.listdir(tmp) == ["out.vfb"]
+
+    def test_save_modified(self) -> None:
+        with TemporaryDirectory() as tmp:
+            vfb_path = Path(tmp) / "2axMM.vfb"
+            copyfile(data_path / "2axMM.vfb", vfb_path)
+            ref = Font(str(vfb_path))
+            font = Font(str(vfb_path))
+            for i in (0, 1):
+                ref[i].width += 10
+                font[i].width += 10
+                # Save over the file the font was read from
+                font.Save(str(vfb_path), incremental=True)
+                source = font._fake_vfb_source
+                assert source is not None
+                assert source.path == vfb_path
+                assert font.glyphs.fake_get_source_index(font.glyphs.data[i]) == -1
+                saved = Font(str(vfb_path))
+                assert get_vfb_bytes(saved) == get_vfb_bytes(ref)
+
+    def test_save_fallback(self) -> None:
+        with TemporaryDirectory() as tmp:
+            vfb_path = Path(tmp) / "2axMM.vfb"
+            copyfile(data_path / "2axMM.vfb", vfb_path)
+            font = Font(str(vfb_path))
+            # The source file was modified
+            with open(vfb_path, "ab") as f:
+                f.write(b"\0")
+            out_path = Path(tmp) / "out.vfb"
+            assert not save_incremental(font, out_path)
+            assert font._fake_vfb_source is None
+            assert get_vfb_bytes(Font(str(out_path))) == get_vfb_bytes(font)
+            assert sorted(os.listdir(tmp)) == ["2axMM.vfb", "out.vfb"]
+
+    def test_save_new_font(self) -> None:
+        font = Font()
+        assert font._fake_vfb_source is None
+        with TemporaryDirectory() as tmp:
+            vfb_path = Path(tmp) / "new.vfb"
+            font.Save(str(vfb_path), incremental=True)
+            assert vfb_path.exists()
@@ -0,0 +1,83 @@
+import unittest
+from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+
+from vfbLib.enum import G
+from vfbLib.vfb.vfb import Vfb
+
+from FL.objects.Font import Font
+from FL.vfb.deferred import DeferredGlyph
+from FL.vfb.mapped import (
+    MappedVfbEntry,
+    _mappings,
+    get_raw_data,
+    read_mapped_vfb,
+)
+
+data_path = Path(__file__).parent.parent / "data"
+
+
+class MappedTests(unittest.TestCase):
+    def test_read_mapped_vfb(self) -> None:
+        for name in ("mini.vfb", "2axMM.vfb", "ComicJensPro-Regular3.000.vfb"):
+            vfb_path = data_path / name
+            ref = Vfb(vfb_path, timing=False)
+            vfb = read_mapped_vfb(vfb_path)
+            assert vfb.header.data == ref.header.data
+            assert vfb.encoding == ref.encoding
+            assert vfb.num_masters == ref.num_masters
+            assert [e.id for e in vfb.entries] == [e.id for e in ref.entries]
+            assert [e.data for e in vfb.entries] == [e.data for e in ref.entries]
+            assert any(isinstance(e, MappedVfbEntry) for e in vfb.entries)
+
+    def test_entry(self) -> None:
+        vfb = read_mapped_vfb(data_path / "2axMM.vfb")
+        e = next(
+            e for e in vfb.entries if e.id == G.Glyph and isinstance(e, MappedVfbEntry)
+        )
+        raw = get_raw_data(e)
+        assert isinstance(raw, memoryview)
+        assert e.size == len(raw)
+        assert e.data == raw
+        assert e.compile()
+        assert get_raw_data(e) is raw
+        e.decompile()
+        assert isinstance(e.data, dict)
+        assert e.data["name"]
+        assert get_raw_data(e) is None
+
+    def test_save_lazy_font_over_source(self) -> None:
+        with TemporaryDirectory() as tmp:
+            vfb_path = Path(tmp) / "2axMM.vfb"
+            copyfile(data_path / "2axMM.vfb", vfb_path)
+            font = Font()
+            font.Open(str(vfb_path), lazy=True)
+            font.Save(str(vfb_path))
+            saved = vfb_path.read_bytes()
+            # The deferred glyphs were copied into memory before the file was replaced
+            font.Save(str(vfb_path))
+            assert vfb_path.read_bytes() == saved
+            assert len(Font(str(vfb_path)).glyphs) == len(font.glyphs)
+
+    def test_save_over_source_releases_mapping(self) -> None:
+        reference = Font(str(data_path / "2axMM.vfb"))
+        with TemporaryDirectory() as tmp:
+            vfb_path = Path(tmp) / "2axMM.vfb"
+            for incremental in (False, True):
+                copyfile(data_path / "2axMM.vfb", vfb_path)
+                font = Font()
+                font.Open(str(vfb_path), lazy=True)
+                mappings = list(_mappings[vfb_path.resolve()])
+                assert mappings
+                font.Save(str(vfb_path), incremental=incremental)
+                # The file is not mapped anymore, so it could be replaced on Windows
+                assert all(m.closed for m in mappings)
+                deferred = [g for g in font.glyphs.data if isinstance(g, DeferredGlyph)]
+                assert deferred
+                assert all(
+                    isinstance(data, bytes) for g in deferred for _, data in g.entries
+                )
+                assert [g.fake_serialize() for g in font.glyphs] == [
+                    g.fake_serialize() for g in reference.glyphs
+                ]
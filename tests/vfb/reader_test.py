@@ -0,0 +1,168 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import pytest
+from vfbLib.enum import F, G, M, T
+
+from FL.objects.Font import Font
+from FL.vfb.mapped import _mappings, get_raw_data
+from FL.vfb.reader import VfbToFontReader, _get_setter, get_group_keys
+
+data_path = Path(__file__).parent.parent / "data"
+
+
+class VfbToFontReaderTests(unittest.TestCase):
+    def test_iter_glyphs(self) -> None:
+        vfb_path = data_path / "2axMM.vfb"
+        f = Font()
+        glyphs = VfbToFontReader(vfb_path).iter_glyphs(f)
+        first = next(glyphs)
+        # The font info is available up front
+        assert f.family_name == "TwoAxis"
+        assert f[0:] == []
+        assert first.parent is None
+        names = [first.name] + [g.name for g in glyphs]
+
+        reference = Font(str(vfb_path))
+        assert names == [g.name for g in reference.glyphs]
+        assert first.fake_serialize() == reference[0].fake_serialize()
+        assert len(f) == 0
+        assert f.axis == reference.axis
+        assert f._master_names == reference._master_names
+
+    def test_iter_glyphs_skip(self) -> None:
+        vfb_path = data_path / "2axMM.vfb"
+        reference = Font(str(vfb_path))
+        ref_glyph = next(g for g in reference.glyphs if g.mask is not None)
+        f = Font()
+        reader = VfbToFontReader(vfb_path, skip=["tth"], keep_raw=["mask"])
+        glyphs = {g.name: g for g in reader.iter_glyphs(f)}
+        assert all(g.mask is None for g in glyphs.values())
+        assert set(glyphs[ref_glyph.name]._fake_raw_entries) == {
+            G.mask,
+            G.MaskMetrics,
+            G.MaskMetricsMM,
+        }
+        assert f.ttinfo.fake_serialize_gasp() == []
+        assert f._fake_raw_entries == []
+
+    def test_iter_glyphs_stop(self) -> None:
+        vfb_path = data_path / "ComicJensPro-Regular3.000.vfb"
+        # Mappings of the file by other tests may still be open
+        other = set(_mappings.get(vfb_path.resolve(), ()))
+        reader = VfbToFontReader(vfb_path)
+        glyphs = reader.iter_glyphs(Font())
+        next(glyphs)
+        assert set(_mappings[vfb_path.resolve()]) - other
+        glyphs.close()
+        # The entries that refer to the memory-mapped file are released
+        assert reader.vfb.entries == []
+        assert not set(_mappings[vfb_path.resolve()]) - other
+
+    def test_get_setter(self) -> None:
+        f = Font()
+        # Property
+        _get_setter(f, "family_name")("Family")
+        assert f.family_name == "Family"
+        # Slot
+        _get_setter(f, "_masters_count")(2)
+        assert f._masters_count == 2
+        with pytest.raises(AttributeError):
+            _get_setter(f, "unknown")
+
+    def test_read_font_entry(self) -> None:
+        reader = VfbToFontReader(None)
+        f = reader.font = Font()
+        reader._prepare_font()
+        reader._read_font_entry(F.full_name, "Full Name")
+        reader._read_font_entry(F.AxisCount, 2)
+        reader._read_font_entry(T.zoneppm, 48)
+        reader._read_font_entry(M.MasterName, "Wt0")
+        reader._read_font_entry(F.Encoding, [65, "A"])
+        reader._read_font_entry(F.BlockFontEnd, None)
+        assert f.full_name == "Full Name"
+        assert f._axis_count == 2
+        assert f.ttinfo._zoneppm == 48
+        assert f._master_names == ["Wt0"]
+        assert reader._gids == {65: "A"}
+        with self.assertLogs("FL.vfb.reader", level="ERROR"):
+            reader._read_font_entry(0xFFFF, None)
+
+    def test_get_group_keys(self) -> None:
+        assert get_group_keys(None) == frozenset()
+        assert get_group_keys(["image", "mask"]) == {
+            G.image,
+            G.mask,
+            G.MaskMetrics,
+            G.MaskMetricsMM,
+        }
+        assert T.fpgm in get_group_keys(["tth"])
+        with pytest.raises(ValueError):
+            get_group_keys(["images"])
+
+    def test_skip(self) -> None:
+        vfb_path = data_path / "2axMM.vfb"
+        reference = Font(str(vfb_path))
+        assert any(g.mask is not None for g in reference.glyphs)
+        for lazy in (False, True):
+            f = Font()
+            f.Open(str(vfb_path), lazy=lazy, skip=["mask", "tth"])
+            assert len(f) == len(reference)
+            assert all(g.mask is None for g in f.glyphs)
+            assert f.ttinfo.fake_serialize_gasp() == []
+            assert f._fake_raw_entries == []
+
+    def test_keep_raw(self) -> None:
+        vfb_path = data_path / "2axMM.vfb"
+        reference = Font(str(vfb_path))
+        ref_glyph = next(g for g in reference.glyphs if g.mask is not None)
+        for lazy in (False, True):
+            f = Font()
+            f.Open(str(vfb_path), lazy=lazy, keep_raw=["mask", "tth"])
+            assert T.gasp in [key for key, _ in f._fake_raw_entries]
+            glyph = f[ref_glyph.name]
+            assert glyph.mask is None
+            assert set(glyph._fake_raw_entries) == {
+                G.mask,
+                G.MaskMetrics,
+                G.MaskMetricsMM,
+            }
+            # The raw data is written back
+            with TemporaryDirectory() as tmp:
+                out_path = Path(tmp) / "out.vfb"
+                f.Save(str(out_path))
+                saved = Font(str(out_path))
+            assert saved[ref_glyph.name].fake_serialize() == ref_glyph.fake_serialize()
+            assert saved.ttinfo.fake_serialize() == reference.ttinfo.fake_serialize()
+            assert (
+                saved.ttinfo.fake_serialize_gasp()
+                == reference.ttinfo.fake_serialize_gasp()
+            )
+
+    def test_keep_raw_entry_order(self) -> None:
+        vfb_path = data_path / "2axMM.vfb"
+        with TemporaryDirectory() as tmp:
+            saved = []
+            for keep_raw in (None, ["tth"]):
+                f = Font()
+                f.Open(str(vfb_path), keep_raw=keep_raw)
+                out_path = Path(tmp) / "out.vfb"
+                f.Save(str(out_path))
+                saved.append(out_path.read_bytes())
+        # The undecoded entries are written in the same positions as decoded ones
+        assert saved[0] == saved[1]
+
+    def test_decompile_parallel(self) -> None:
+        vfb_path = data_path / "2axMM.vfb"
+        reference = Font(str(vfb_path))
+        with patch("FL.vfb.reader.MIN_PARALLEL_GLYPHS", 1):
+            reader = VfbToFontReader(vfb_path, workers=2)
+            f = Font()
+            reader.read(f)
+        assert all(get_raw_data(e) is None for e in reader.vfb.entries)
+        assert [g.fake_serialize() for g in f.glyphs] == [
+            g.fake_serialize() for g in reference.glyphs
+        ]
+        assert f.family_name == reference.family_name
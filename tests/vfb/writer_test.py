@@ -0,0 +1,40 @@
+import unittest
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
+
+from FL.objects.Font import Font
+from FL.vfb.writer import FontToVfbWriter
+
+data_path = Path(__file__).parent.parent / "data"
+
+
+def get_vfb_bytes(font: Font, workers: int | None = 1) -> bytes:
+    stream = BytesIO()
+    FontToVfbWriter(font, workers=workers).vfb.write_bytes(stream)
+    return stream.getvalue()
+
+
+class RecordingWriter(FontToVfbWriter):
+    def compile_glyphs_parallel(self) -> None:
+        super().compile_glyphs_parallel()
+        self.num_compiled = len(self.compiled)
+
+
+class FontToVfbWriterTests(unittest.TestCase):
+    def test_compile_glyphs_parallel(self) -> None:
+        for lazy in (False, True):
+            f = Font()
+            f.Open(str(data_path / "2axMM.vfb"), lazy=lazy)
+            # Make sure some glyphs are decoded in lazy mode
+            f[0].width += 10
+            copy = Font(f)
+            for font in (f, copy):
+                with patch("FL.vfb.writer.MIN_PARALLEL_GLYPHS", 1):
+                    writer = RecordingWriter(font, workers=2)
+                    # Only the decoded glyphs are serialized
+                    assert writer.num_compiled == 1 if lazy else len(font)
+                    assert writer.compiled == {}
+                    stream = BytesIO()
+                    writer.vfb.write_bytes(stream)
+                assert stream.getvalue() == get_vfb_bytes(font)